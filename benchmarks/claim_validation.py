@@ -0,0 +1,107 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Cost of RecipeImplementation.validate_claims with 1 KB and 10 KB access token
+payloads, when no claim needs to be refetched and when one does, compared to
+the two json.dumps of the payload that were used to detect if it had changed.
+
+Run with: python -m benchmarks.claim_validation
+"""
+import asyncio
+import json
+from typing import Any, Dict
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import SessionRecipe
+from supertokens_python.recipe.session.claim_base_classes.boolean_claim import (
+    BooleanClaim,
+)
+from supertokens_python.types import RecipeUserId
+
+from .utils import run_async_benchmark, run_benchmark
+
+OPS = 20_000
+CLAIMS = 3
+
+
+def _create_payload(size: int) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"sub": "user_id", "tId": "public"}
+    i = 0
+    while len(json.dumps(payload)) < size:
+        payload[f"custom-{i}"] = {"name": f"value-{i}", "tags": ["a", "b", "c"]}
+        i += 1
+    return payload
+
+
+async def _run():
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    claims = [
+        BooleanClaim(f"claim-{i}", lambda *_: True)  # type: ignore
+        for i in range(CLAIMS)
+    ]
+    validators = [claim.validators.is_true(None) for claim in claims]
+
+    for size in (1024, 10 * 1024):
+        payload = _create_payload(size)
+        for claim in claims:
+            payload = claim.add_to_payload_(payload, True, {})
+        label = f"{size // 1024} KB payload"
+
+        print(
+            run_benchmark(
+                f"2x json.dumps ({label})",
+                lambda: json.dumps(payload) == json.dumps(payload),
+                OPS,
+            )
+        )
+
+        # the first claim is missing, so it is refetched. The payload is copied for
+        # every call, since refetched values are added to it.
+        payload_without_claim = {k: v for k, v in payload.items() if k != claims[0].key}
+
+        for name, get_payload in (
+            ("no refetch", lambda: payload),
+            ("1 refetch", lambda: dict(payload_without_claim)),
+        ):
+
+            async def validate():
+                await recipe_implementation.validate_claims(
+                    "user_id", RecipeUserId("user_id"), get_payload(), validators, {}
+                )
+
+            print(
+                await run_async_benchmark(
+                    f"validate_claims, {name} ({label})", validate, OPS // 10
+                )
+            )
+
+
+def main():
+    init(
+        app_info=InputAppInfo(
+            app_name="benchmark",
+            api_domain="http://localhost:8000",
+            website_domain="http://localhost:3000",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        recipe_list=[session.init()],
+        telemetry=False,
+    )
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Cost of the debug log messages of claim validation, with debug logging disabled
+(the default), enabled and enabled with queued logging, and of preparing a log argument eagerly compared to
+with LazyLogArg when debug logging is disabled.
+
+Run with: python -m benchmarks.debug_logging
+"""
+import asyncio
+import io
+import json
+import logging
+from typing import Any, Dict, TextIO, cast
+
+from supertokens_python.logger import (
+    NAMESPACE,
+    LazyLogArg,
+    disable_queued_logging,
+    enable_queued_logging,
+    log_debug_message,
+    streamHandler,
+)
+from supertokens_python.recipe.session.claim_base_classes.boolean_claim import (
+    BooleanClaim,
+)
+from supertokens_python.recipe.session.utils import validate_claims_in_payload
+
+from .utils import run_async_benchmark, run_benchmark
+
+OPS = 20_000
+CLAIMS = 5
+
+
+async def _run():
+    claims = [
+        BooleanClaim(f"claim-{i}", lambda *_: True)  # type: ignore
+        for i in range(CLAIMS)
+    ]
+    payload: Dict[str, Any] = {}
+    for claim in claims:
+        payload = claim.add_to_payload_(payload, True, {})
+    validators = [claim.validators.is_true(None) for claim in claims]
+    res = await validators[0].validate(payload, {})
+
+    print(
+        run_benchmark(
+            "log json.dumps(res) (debug off)",
+            lambda: log_debug_message("res %s", json.dumps(res.__dict__)),
+            OPS,
+        )
+    )
+    print(
+        run_benchmark(
+            "log LazyLogArg(json.dumps, res) (debug off)",
+            lambda: log_debug_message("res %s", LazyLogArg(json.dumps, res.__dict__)),
+            OPS,
+        )
+    )
+
+    async def validate():
+        await validate_claims_in_payload(validators, payload, {})
+
+    logger = logging.getLogger(NAMESPACE)
+    for level in (logging.NOTSET, logging.DEBUG):
+        logger.setLevel(level)
+        label = "debug on" if level == logging.DEBUG else "debug off"
+        print(
+            await run_async_benchmark(
+                f"validate {CLAIMS} claims ({label})", validate, OPS // 10
+            )
+        )
+
+    enable_queued_logging()
+    print(
+        await run_async_benchmark(
+            f"validate {CLAIMS} claims (debug on, queued)", validate, OPS // 10
+        )
+    )
+    disable_queued_logging()
+
+
+def main():
+    # the messages logged with debug on are not interesting here
+    cast("logging.StreamHandler[TextIO]", streamHandler).setStream(io.StringIO())
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
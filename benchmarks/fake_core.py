@@ -0,0 +1,371 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+A stand-in for the SuperTokens core used by the benchmarks.
+
+It is a plain ASGI app (so it has no dependencies other than the ASGI server
+used to serve it) that answers the core endpoints needed by the benchmark
+scenarios. It has one user for each of emailpassword, passwordless and
+thirdparty, and issues access tokens signed with its own key (served in its
+JWKS), so that sessions can be verified locally.
+"""
+import json
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl
+
+import jwt
+import uvicorn
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+Handler = Callable[[Dict[str, str], Dict[str, Any]], Awaitable[Tuple[int, Any]]]
+
+
+EMAIL = "user@example.com"
+PASSWORD = "password123"
+PHONE_NUMBER = "+14155552671"
+THIRD_PARTY_ID = "custom"
+THIRD_PARTY_USER_ID = "tp-user"
+KEY_ID = "d-benchmark"
+
+
+def _create_user(user_id: str, login_method: Dict[str, Any]) -> Dict[str, Any]:
+    login_method = {
+        "recipeUserId": user_id,
+        "tenantIds": ["public"],
+        "timeJoined": 0,
+        "verified": True,
+        **login_method,
+    }
+    return {
+        "id": user_id,
+        "isPrimaryUser": False,
+        "tenantIds": ["public"],
+        "emails": [login_method["email"]] if "email" in login_method else [],
+        "phoneNumbers": (
+            [login_method["phoneNumber"]] if "phoneNumber" in login_method else []
+        ),
+        "thirdParty": (
+            [login_method["thirdParty"]] if "thirdParty" in login_method else []
+        ),
+        "loginMethods": [login_method],
+        "timeJoined": 0,
+    }
+
+
+class FakeCore:
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self.request_count = 0
+
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.jwk: Dict[str, Any] = json.loads(
+            RSAAlgorithm.to_jwk(self.private_key.public_key())
+        )
+        self.jwk.update({"kid": KEY_ID, "alg": "RS256", "use": "sig"})
+
+        self.users = [
+            _create_user("ep-user", {"recipeId": "emailpassword", "email": EMAIL}),
+            _create_user(
+                "pless-user", {"recipeId": "passwordless", "phoneNumber": PHONE_NUMBER}
+            ),
+            _create_user(
+                "tp-user",
+                {
+                    "recipeId": "thirdparty",
+                    "email": EMAIL,
+                    "thirdParty": {
+                        "id": THIRD_PARTY_ID,
+                        "userId": THIRD_PARTY_USER_ID,
+                    },
+                },
+            ),
+        ]
+        self.users_by_id = {user["id"]: user for user in self.users}
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        # (method, path) of the requests that had no route, so that a scenario
+        # that calls an endpoint the fake core doesn't know about can be caught
+        self.unhandled_requests: List[Tuple[str, str]] = []
+
+        self.add_route("GET", "/apiversion", self.api_version)
+        self.add_route("GET", "/hello", self.hello)
+        self.add_route("GET", "/.well-known/jwks.json", self.jwks)
+        self.add_route("GET", "/public/recipe/multitenancy/tenant/v2", self.get_tenant)
+        self.add_route("GET", "/public/users", self.list_users)
+        self.add_route(
+            "GET", "/public/users/by-accountinfo", self.list_users_by_account_info
+        )
+        self.add_route("GET", "/user/id", self.get_user)
+        self.add_route("GET", "/recipe/user/metadata", self.get_user_metadata)
+        self.add_route("POST", "/public/recipe/session", self.create_session)
+        self.add_route("POST", "/recipe/session/refresh", self.refresh_session)
+        self.add_route("POST", "/public/recipe/signin", self.emailpassword_sign_in)
+        self.add_route(
+            "GET", "/public/recipe/signinup/codes", self.passwordless_list_codes
+        )
+        self.add_route(
+            "POST", "/public/recipe/signinup/code/consume", self.passwordless_consume
+        )
+        self.add_route("POST", "/public/recipe/signinup", self.thirdparty_sign_in_up)
+
+    def add_route(self, method: str, path: str, handler: Handler) -> None:
+        self.routes[(method, path)] = handler
+
+    def create_access_token(
+        self, session: Dict[str, Any], user_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        now = int(time.time())
+        expiry = now + 3600
+        payload: Dict[str, Any] = {
+            **(user_data or session["userDataInJWT"]),
+            "sub": session["userId"],
+            "rsub": session["recipeUserId"],
+            "exp": expiry,
+            "iat": now,
+            "sessionHandle": session["handle"],
+            "refreshTokenHash1": "hash",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+            "tId": session["tenantId"],
+        }
+        token = jwt.encode(
+            payload,
+            self.private_key,  # type: ignore
+            algorithm="RS256",
+            headers={"kid": KEY_ID, "version": "5"},
+        )
+        return {"token": token, "expiry": expiry * 1000, "createdTime": now}
+
+    def _session_response(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        refresh_token = str(uuid.uuid4())
+        self.sessions[refresh_token] = session
+        return {
+            "status": "OK",
+            "session": session,
+            "accessToken": self.create_access_token(session),
+            "refreshToken": {
+                "token": refresh_token,
+                "expiry": int(time.time() + 86400) * 1000,
+                "createdTime": int(time.time()) * 1000,
+            },
+        }
+
+    async def jwks(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        return 200, {"keys": [self.jwk]}
+
+    async def get_tenant(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        return 200, {
+            "status": "OK",
+            "tenantId": "public",
+            "thirdParty": {"providers": []},
+            "coreConfig": {},
+            "firstFactors": None,
+            "requiredSecondaryFactors": None,
+        }
+
+    async def list_users(
+        self, query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        limit = int(query.get("limit", "100"))
+        return 200, {"status": "OK", "users": self.users[:limit]}
+
+    async def list_users_by_account_info(
+        self, query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        users = [
+            user
+            for user in self.users
+            if query.get("email") in user["emails"]
+            or query.get("phoneNumber") in user["phoneNumbers"]
+            or any(
+                tp["id"] == query.get("thirdPartyId")
+                and tp["userId"] == query.get("thirdPartyUserId")
+                for tp in user["thirdParty"]
+            )
+        ]
+        return 200, {"status": "OK", "users": users}
+
+    async def get_user(
+        self, query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        user = self.users_by_id.get(query.get("userId", ""))
+        if user is None:
+            return 200, {"status": "UNKNOWN_USER_ID_ERROR"}
+        return 200, {"status": "OK", "user": user}
+
+    async def get_user_metadata(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        return 200, {"status": "OK", "metadata": {"first_name": "Jane"}}
+
+    async def create_session(
+        self, _query: Dict[str, str], body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        session = {
+            "handle": str(uuid.uuid4()),
+            "userId": body["userId"],
+            "recipeUserId": body.get("recipeUserId", body["userId"]),
+            "userDataInJWT": body.get("userDataInJWT", {}),
+            "tenantId": "public",
+        }
+        return 200, self._session_response(session)
+
+    async def refresh_session(
+        self, _query: Dict[str, str], body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        session = self.sessions.get(body["refreshToken"])
+        if session is None:
+            return 200, {"status": "UNAUTHORISED", "message": "unknown refresh token"}
+        return 200, self._session_response(session)
+
+    async def emailpassword_sign_in(
+        self, _query: Dict[str, str], body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        if body["email"] != EMAIL or body["password"] != PASSWORD:
+            return 200, {"status": "WRONG_CREDENTIALS_ERROR"}
+        user = self.users_by_id["ep-user"]
+        return 200, {"status": "OK", "user": user, "recipeUserId": user["id"]}
+
+    async def passwordless_list_codes(
+        self, query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        device: Dict[str, Any] = {
+            "preAuthSessionId": query.get("preAuthSessionId"),
+            "failedCodeInputAttemptCount": 0,
+            "phoneNumber": PHONE_NUMBER,
+            "codes": [],
+        }
+        return 200, {"status": "OK", "devices": [device]}
+
+    async def passwordless_consume(
+        self, _query: Dict[str, str], body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        user = self.users_by_id["pless-user"]
+        return 200, {
+            "status": "OK",
+            "createdNewUser": False,
+            "user": user,
+            "recipeUserId": user["id"],
+            "consumedDevice": {
+                "preAuthSessionId": body["preAuthSessionId"],
+                "failedCodeInputAttemptCount": 0,
+                "phoneNumber": PHONE_NUMBER,
+            },
+        }
+
+    async def thirdparty_sign_in_up(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        user = self.users_by_id["tp-user"]
+        return 200, {
+            "status": "OK",
+            "createdNewUser": False,
+            "user": user,
+            "recipeUserId": user["id"],
+        }
+
+    async def api_version(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        return 200, {"versions": ["5.2"]}
+
+    async def hello(
+        self, _query: Dict[str, str], _body: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        return 200, {"status": "OK"}
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] != "http":
+            return
+
+        self.request_count += 1
+
+        raw_body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            raw_body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        query = dict(parse_qsl(scope["query_string"].decode("latin-1")))
+        body: Dict[str, Any] = json.loads(raw_body) if raw_body else {}
+
+        handler = self.routes.get((scope["method"], scope["path"]))
+        if handler is None:
+            self.unhandled_requests.append((scope["method"], scope["path"]))
+            status, res = 404, {"message": "Not found"}
+        else:
+            status, res = await handler(query, body)
+
+        content = json.dumps(res).encode()
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(content)).encode()),
+        ]
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": content})
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def run_fake_core(app: FakeCore) -> Generator[str, None, None]:
+    """Serves the app on a free local port in a background thread and yields its URL."""
+    port = _get_free_port()
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="error", lifespan="off"
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    while not server.started:
+        time.sleep(0.01)
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
@@ -0,0 +1,120 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Overhead of Supertokens.middleware for requests it doesn't handle (paths outside
+of the API base path, and unknown paths inside it), and of finding the API for a
+request by asking every recipe (the old behaviour) compared to the route index.
+
+Run with: python -m benchmarks.middleware_dispatch
+"""
+import asyncio
+from typing import Any, Dict
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    multifactorauth,
+    passwordless,
+    session,
+    thirdparty,
+    totp,
+    usermetadata,
+    userroles,
+)
+from supertokens_python.route_index import RouteIndex
+
+from .utils import run_async_benchmark
+
+OPS = 20_000
+
+
+def _create_request(path: str) -> FastApiRequest:
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+    return FastApiRequest(Request(scope))
+
+
+async def _run():
+    st = Supertokens.get_instance()
+    response = FastApiResponse(Response())
+    print(f"{len(st.recipe_modules)} recipes")
+
+    for path in ["/hello", "/auth/unknown", "/auth/public/unknown"]:
+        request = _create_request(path)
+
+        async def middleware():
+            await st.middleware(request, response, {})
+
+        print(await run_async_benchmark(f"middleware {path}", middleware, OPS))
+
+    path = NormalisedURLPath("/auth/public/unknown")
+
+    async def ask_every_recipe():
+        for recipe in st.recipe_modules:
+            await recipe.return_api_id_if_can_handle_request(path, "get", {})
+
+    route_index = RouteIndex("/auth", st.recipe_modules)
+
+    async def use_route_index():
+        route_index.find(path.get_as_string_dangerous(), "get")
+
+    print(await run_async_benchmark("find API (every recipe)", ask_every_recipe, OPS))
+    print(await run_async_benchmark("find API (route index)", use_route_index, OPS))
+
+
+def main():
+    init(
+        app_info=InputAppInfo(
+            app_name="benchmark",
+            api_domain="http://localhost:8000",
+            website_domain="http://localhost:3000",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        recipe_list=[
+            session.init(),
+            emailpassword.init(),
+            passwordless.init(
+                contact_config=passwordless.ContactEmailOrPhoneConfig(),
+                flow_type="USER_INPUT_CODE_AND_MAGIC_LINK",
+            ),
+            thirdparty.init(),
+            emailverification.init(mode="OPTIONAL"),
+            dashboard.init(),
+            userroles.init(),
+            usermetadata.init(),
+            multifactorauth.init(),
+            totp.init(),
+        ],
+        telemetry=False,
+    )
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Requests/sec of Querier against a local stand-in core, with a pooled HTTP
+client (the default) and with a new client per request (the old behaviour).
+
+Run with: python -m benchmarks.querier_pool
+"""
+import asyncio
+from typing import List
+
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.supertokens import Host
+
+from .fake_core import FakeCore, run_fake_core
+from .utils import BenchmarkResult, run_async_benchmark
+
+OPS = 500
+
+
+async def _run(core_url: str, pooled: bool) -> List[BenchmarkResult]:
+    Querier.init(
+        [Host(NormalisedURLDomain(core_url), NormalisedURLPath(""))],
+    )
+    Querier.api_version = "5.2"
+    if not pooled:
+        # emulate opening a new AsyncClient for every request
+        setattr(Querier, "_Querier__get_http_client", staticmethod(lambda: None))
+
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/hello")
+
+    async def call():
+        await q.send_get_request(path, None, None)
+
+    label = "pooled client" if pooled else "client per request"
+    results = [
+        await run_async_benchmark(f"GET /hello ({label})", call, OPS),
+        await run_async_benchmark(
+            f"GET /hello ({label}, 20 concurrent)", call, OPS, concurrency=20
+        ),
+    ]
+    await Querier.close_http_clients()
+    return results
+
+
+def main():
+    get_http_client = getattr(Querier, "_Querier__get_http_client")
+    with run_fake_core(FakeCore()) as core_url:
+        for pooled in (False, True):
+            setattr(Querier, "_Querier__init_called", False)
+            setattr(Querier, "_Querier__get_http_client", get_http_client)
+            for result in asyncio.run(_run(core_url, pooled)):
+                print(result)
+
+
+if __name__ == "__main__":
+    main()
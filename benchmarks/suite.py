@@ -0,0 +1,240 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+End to end scenarios through the FastAPI middleware, against the fake core
+(see fake_core.py), reporting ops/sec and the memory allocated per operation
+for each of them.
+
+Run with: python -m benchmarks.suite
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    passwordless,
+    session,
+    thirdparty,
+)
+from supertokens_python.recipe.session import SessionContainer
+from supertokens_python.recipe.session.framework.fastapi import verify_session
+from supertokens_python.recipe.thirdparty.provider import Provider
+from supertokens_python.recipe.thirdparty.types import UserInfo, UserInfoEmail
+
+from .fake_core import (
+    EMAIL,
+    PASSWORD,
+    THIRD_PARTY_ID,
+    THIRD_PARTY_USER_ID,
+    FakeCore,
+    run_fake_core,
+)
+from .utils import measure_async_allocations, run_async_benchmark
+
+OPS = 1_000
+ALLOCATION_OPS = 100
+DASHBOARD_API_KEY = "benchmark-api-key"
+
+Scenario = Callable[[], Awaitable[Any]]
+
+
+def _override_provider(original_implementation: Provider) -> Provider:
+    # The benchmark signs in with oAuthTokens, so the only call to the
+    # provider is for the user info
+    async def get_user_info(
+        oauth_tokens: Dict[str, Any], user_context: Dict[str, Any]
+    ) -> UserInfo:
+        return UserInfo(
+            third_party_user_id=THIRD_PARTY_USER_ID,
+            email=UserInfoEmail(EMAIL, True),
+        )
+
+    original_implementation.get_user_info = get_user_info  # type: ignore
+    return original_implementation
+
+
+def _init(core_url: str):
+    init(
+        app_info=InputAppInfo(
+            app_name="benchmark",
+            api_domain="http://localhost:8000",
+            website_domain="http://localhost:3000",
+        ),
+        framework="fastapi",
+        supertokens_config=SupertokensConfig(core_url),
+        recipe_list=[
+            session.init(get_token_transfer_method=lambda _, __, ___: "header"),
+            emailpassword.init(),
+            passwordless.init(
+                contact_config=passwordless.ContactPhoneOnlyConfig(),
+                flow_type="USER_INPUT_CODE",
+            ),
+            thirdparty.init(
+                sign_in_and_up_feature=thirdparty.SignInAndUpFeature(
+                    providers=[
+                        thirdparty.ProviderInput(
+                            config=thirdparty.ProviderConfig(
+                                third_party_id=THIRD_PARTY_ID,
+                                clients=[
+                                    thirdparty.ProviderClientConfig(client_id="id")
+                                ],
+                            ),
+                            override=_override_provider,
+                        )
+                    ]
+                )
+            ),
+            dashboard.init(api_key=DASHBOARD_API_KEY),
+        ],
+        telemetry=False,
+    )
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.get("/hello")
+    async def hello() -> Dict[str, Any]:  # type: ignore
+        return {}
+
+    @app.get("/session")
+    async def get_session(s: SessionContainer = Depends(verify_session())):  # type: ignore
+        return {"userId": s.get_user_id()}
+
+    return app
+
+
+def _create_scenarios(
+    client: httpx.AsyncClient, access_token: str, refresh_token: str
+) -> List[Tuple[str, Scenario]]:
+    async def request(method: str, path: str, **kwargs: Any):
+        response = await client.request(method, path, **kwargs)
+        if response.status_code != 200 or response.json().get("status", "OK") != "OK":
+            raise Exception(f"{method} {path}: {response.status_code} {response.text}")
+
+    async def middleware_dispatch():
+        await request("GET", "/hello")
+
+    async def get_session_local_verify():
+        await request(
+            "GET", "/session", headers={"authorization": f"Bearer {access_token}"}
+        )
+
+    async def refresh():
+        await request(
+            "POST",
+            "/auth/session/refresh",
+            headers={"authorization": f"Bearer {refresh_token}"},
+        )
+
+    async def emailpassword_sign_in():
+        await request(
+            "POST",
+            "/auth/signin",
+            json={
+                "formFields": [
+                    {"id": "email", "value": EMAIL},
+                    {"id": "password", "value": PASSWORD},
+                ]
+            },
+        )
+
+    async def passwordless_consume_code():
+        await request(
+            "POST",
+            "/auth/signinup/code/consume",
+            json={
+                "preAuthSessionId": "pre-auth-session-id",
+                "deviceId": "device-id",
+                "userInputCode": "123456",
+            },
+        )
+
+    async def thirdparty_sign_in_up():
+        await request(
+            "POST",
+            "/auth/signinup",
+            json={
+                "thirdPartyId": THIRD_PARTY_ID,
+                "oAuthTokens": {"access_token": "token"},
+            },
+        )
+
+    async def dashboard_users_list():
+        await request(
+            "GET",
+            "/auth/dashboard/api/users?limit=10",
+            headers={"authorization": f"Bearer {DASHBOARD_API_KEY}"},
+        )
+
+    return [
+        ("middleware dispatch", middleware_dispatch),
+        ("get_session (local verify)", get_session_local_verify),
+        ("refresh session", refresh),
+        ("emailpassword sign in", emailpassword_sign_in),
+        ("passwordless consume code", passwordless_consume_code),
+        ("thirdparty sign in up", thirdparty_sign_in_up),
+        ("dashboard users list", dashboard_users_list),
+    ]
+
+
+async def _run(core: FakeCore):
+    app = _create_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),  # type: ignore
+        base_url="http://localhost:8000",
+    ) as client:
+        response = await client.post(
+            "/auth/signin",
+            json={
+                "formFields": [
+                    {"id": "email", "value": EMAIL},
+                    {"id": "password", "value": PASSWORD},
+                ]
+            },
+            headers={"st-auth-mode": "header"},
+        )
+        access_token = response.headers["st-access-token"]
+        refresh_token = response.headers["st-refresh-token"]
+
+        for name, scenario in _create_scenarios(client, access_token, refresh_token):
+            result = await run_async_benchmark(name, scenario, OPS)
+            result.allocations = await measure_async_allocations(
+                scenario, ALLOCATION_OPS
+            )
+            print(result)
+
+            if core.unhandled_requests:
+                raise Exception(
+                    f"{name} called core endpoints that the fake core doesn't"
+                    f" handle: {sorted(set(core.unhandled_requests))}"
+                )
+
+
+def main():
+    core = FakeCore()
+    with run_fake_core(core) as core_url:
+        _init(core_url)
+        asyncio.run(_run(core))
+
+
+if __name__ == "__main__":
+    main()
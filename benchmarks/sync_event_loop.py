@@ -0,0 +1,88 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Requests/sec of the sync (WSGI) entry points against a local stand-in core,
+from several threads at once: through asgiref's async_to_sync (used by the
+Django middleware), through sync with an event loop per thread, and through
+sync with the shared background event loop (SUPERTOKENS_BACKGROUND_EVENT_LOOP=1).
+
+Run with: python -m benchmarks.sync_event_loop
+"""
+import os
+
+from asgiref.sync import async_to_sync
+
+from supertokens_python.async_to_sync_wrapper import (
+    stop_background_event_loop,
+    sync,
+)
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.supertokens import Host
+
+from .fake_core import FakeCore, run_fake_core
+from .utils import run_threaded_benchmark
+
+OPS = 1000
+THREADS = 8
+
+
+def main():
+    with run_fake_core(FakeCore()) as core_url:
+        Querier.init(
+            [Host(NormalisedURLDomain(core_url), NormalisedURLPath(""))],
+        )
+        Querier.api_version = "5.2"
+        q = Querier.get_instance()
+        path = NormalisedURLPath("/hello")
+
+        async def call():
+            await q.send_get_request(path, None, None)
+
+        print(
+            run_threaded_benchmark(
+                f"async_to_sync ({THREADS} threads)",
+                lambda: async_to_sync(call)(),
+                OPS,
+                THREADS,
+            )
+        )
+        print(
+            run_threaded_benchmark(
+                f"sync, loop per thread ({THREADS} threads)",
+                lambda: sync(call()),
+                OPS,
+                THREADS,
+            )
+        )
+
+        os.environ["SUPERTOKENS_BACKGROUND_EVENT_LOOP"] = "1"
+        try:
+            print(
+                run_threaded_benchmark(
+                    f"sync, background loop ({THREADS} threads)",
+                    lambda: sync(call()),
+                    OPS,
+                    THREADS,
+                )
+            )
+            sync(Querier.close_http_clients())
+        finally:
+            del os.environ["SUPERTOKENS_BACKGROUND_EVENT_LOOP"]
+            stop_background_event_loop()
+
+
+if __name__ == "__main__":
+    main()
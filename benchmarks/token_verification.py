@@ -0,0 +1,100 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Access token verification with 1, 10 and 100 keys in the JWKS: the lookup of the
+key by kid on its own (compared to scanning the list of keys, the old behaviour),
+and the full verification of a token signed with the last key.
+
+Run with: python -m benchmarks.token_verification
+"""
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import PyJWK
+from jwt.algorithms import RSAAlgorithm
+
+from supertokens_python.recipe.session.access_token import (
+    _get_info_from_access_token_using_keys,  # type: ignore
+)
+from supertokens_python.recipe.session.jwks import CachedKeys, find_matching_keys
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+
+from .utils import run_benchmark
+
+LOOKUP_OPS = 200_000
+VERIFY_OPS = 5_000
+
+
+def _create_keys(count: int) -> Tuple[Any, List[Dict[str, Any]]]:
+    private_key: Any = None
+    jwks: List[Dict[str, Any]] = []
+    for i in range(count):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk.update({"kid": f"d-{i}", "alg": "RS256", "use": "sig"})
+        jwks.append(jwk)
+    # the last key is the one that signs the token, so scanning the list is the worst case
+    return private_key, jwks
+
+
+def _create_access_token(private_key: Any, kid: str) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": "user-id",
+        "rsub": "user-id",
+        "exp": now + 3600,
+        "iat": now,
+        "sessionHandle": "session-handle",
+        "refreshTokenHash1": "hash",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": None,
+        "tId": "public",
+    }
+    return jwt.encode(
+        payload, private_key, algorithm="RS256", headers={"kid": kid, "version": "5"}
+    )
+
+
+def main():
+    for count in (1, 10, 100):
+        private_key, jwks = _create_keys(count)
+        kid = jwks[-1]["kid"]
+        cached_keys = CachedKeys([PyJWK(jwk) for jwk in jwks], 60)
+        jwt_info = parse_jwt_without_signature_verification(
+            _create_access_token(private_key, kid)
+        )
+
+        def scan():
+            return [key for key in cached_keys.keys if key.key_id == kid]  # type: ignore
+
+        def lookup():
+            return find_matching_keys(cached_keys, kid)
+
+        def verify():
+            keys = find_matching_keys(cached_keys, kid)
+            assert keys is not None
+            return _get_info_from_access_token_using_keys(jwt_info, keys, False)
+
+        print(run_benchmark(f"{count} keys: find key (list scan)", scan, LOOKUP_OPS))
+        print(run_benchmark(f"{count} keys: find key (kid index)", lookup, LOOKUP_OPS))
+        print(run_benchmark(f"{count} keys: verify access token", verify, VERIFY_OPS))
+
+
+if __name__ == "__main__":
+    main()
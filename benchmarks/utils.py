@@ -0,0 +1,143 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, ops: int, duration_sec: float):
+        self.name = name
+        self.ops = ops
+        self.duration_sec = duration_sec
+        # Set by measure_async_allocations
+        self.allocations: Optional["AllocationResult"] = None
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.duration_sec
+
+    def __str__(self) -> str:
+        result = f"{self.name:<50} {self.ops_per_sec:>12.1f} ops/sec"
+        if self.allocations is not None:
+            result += f" {self.allocations}"
+        return result
+
+
+class AllocationResult:
+    def __init__(self, ops: int, peak_bytes: int, retained_bytes: int):
+        self.ops = ops
+        self.peak_bytes = peak_bytes
+        self.retained_bytes = retained_bytes
+
+    @property
+    def peak_bytes_per_op(self) -> float:
+        return self.peak_bytes / self.ops
+
+    def __str__(self) -> str:
+        return (
+            f"{self.peak_bytes_per_op / 1024:>10.1f} KiB allocated/op"
+            f" {self.retained_bytes / 1024:>10.1f} KiB retained"
+        )
+
+
+async def measure_async_allocations(
+    fn: Callable[[], Awaitable[Any]], ops: int
+) -> AllocationResult:
+    """
+    Runs fn ops times with tracemalloc enabled. For every call, the most memory
+    that was in use during the call above what was in use before it is added to
+    peak_bytes, and retained_bytes is how much more memory is in use after all
+    the calls than before them.
+    """
+    tracemalloc.start()
+    try:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        peak_bytes = 0
+        for _ in range(ops):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += peak - before
+        end_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return AllocationResult(ops, peak_bytes, end_bytes - start_bytes)
+
+
+async def run_async_benchmark(
+    name: str,
+    fn: Callable[[], Awaitable[Any]],
+    ops: int,
+    concurrency: int = 1,
+    warmup_ops: int = 10,
+) -> BenchmarkResult:
+    for _ in range(warmup_ops):
+        await fn()
+
+    per_worker = ops // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            await fn()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult(name, per_worker * concurrency, duration)
+
+
+def run_benchmark(
+    name: str, fn: Callable[[], Any], ops: int, warmup_ops: int = 10
+) -> BenchmarkResult:
+    for _ in range(warmup_ops):
+        fn()
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        fn()
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult(name, ops, duration)
+
+
+def run_threaded_benchmark(
+    name: str, fn: Callable[[], Any], ops: int, threads: int, warmup_ops: int = 10
+) -> BenchmarkResult:
+    """Like run_benchmark, but splits the ops between threads (like a WSGI server)."""
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        for _ in range(warmup_ops):
+            fn()
+        barrier.wait()
+        for _ in range(per_thread):
+            fn()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult(name, per_thread * threads, duration)
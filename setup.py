@@ -63,6 +63,7 @@ extras_require = {
 
 exclude_list = [
     "tests",
+    "benchmarks",
     "examples",
     "hooks",
     ".gitignore",
@@ -19,13 +19,17 @@ from typing_extensions import Literal
 from supertokens_python.framework.request import BaseRequest
 from supertokens_python.types import RecipeUserId
 
-from . import supertokens
+from . import core_call_cache, rate_limit_retry, request_hedging, supertokens
 from .recipe_module import RecipeModule
 
 InputAppInfo = supertokens.InputAppInfo
 Supertokens = supertokens.Supertokens
 SupertokensConfig = supertokens.SupertokensConfig
 AppInfo = supertokens.AppInfo
+CoreCallCacheConfig = core_call_cache.CoreCallCacheConfig
+CoreCallCachePolicy = core_call_cache.CoreCallCachePolicy
+CoreRequestHedgingConfig = request_hedging.CoreRequestHedgingConfig
+CoreRateLimitRetryConfig = rate_limit_retry.CoreRateLimitRetryConfig
 
 
 def init(
@@ -13,7 +13,10 @@
 # under the License.
 
 import asyncio
-from typing import Any, Coroutine, TypeVar
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
 from os import getenv
 
 _T = TypeVar("_T")
@@ -23,6 +26,10 @@ def nest_asyncio_enabled():
     return getenv("SUPERTOKENS_NEST_ASYNCIO", "") == "1"
 
 
+def background_event_loop_enabled():
+    return getenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "") == "1"
+
+
 def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
     try:
         return asyncio.get_event_loop()
@@ -40,6 +47,92 @@ def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
         raise ex
 
 
+class BackgroundEventLoop:
+    """
+    An event loop that runs in a daemon thread, which sync submits coroutines to (from any
+    thread) if SUPERTOKENS_BACKGROUND_EVENT_LOOP=1. Since there is a single loop, the pooled
+    connections to the core and the caches that are kept per event loop are shared by all
+    the threads of WSGI servers.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.__run, name="supertokens-event-loop", daemon=True
+        )
+        self.thread.start()
+
+    def __run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def is_running(self) -> bool:
+        # threads do not survive a fork, so a new loop is started in forked workers
+        return self.thread.is_alive()
+
+    def run(self, co: Coroutine[Any, Any, _T]) -> _T:
+        # The coroutine runs in a copy of the context of the calling thread (like it would
+        # in a loop of that thread), so that context variables (e.g. the current span) are
+        # kept
+        context = contextvars.copy_context()
+        future: "concurrent.futures.Future[_T]" = concurrent.futures.Future()
+
+        def on_done(task: "asyncio.Task[_T]"):
+            if task.cancelled():
+                future.cancel()
+                return
+            exception = task.exception()
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(task.result())
+
+        def start():
+            if not future.set_running_or_notify_cancel():
+                co.close()
+                return
+            # tasks run in a copy of the context they are created in
+            task = context.run(self.loop.create_task, co)
+            task.add_done_callback(on_done)
+
+        self.loop.call_soon_threadsafe(start)
+        return future.result()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+_background_event_loop: Optional[BackgroundEventLoop] = None
+_background_event_loop_lock = threading.Lock()
+
+
+def get_background_event_loop() -> BackgroundEventLoop:
+    global _background_event_loop
+    background_loop = _background_event_loop
+    if background_loop is not None and background_loop.is_running():
+        return background_loop
+
+    with _background_event_loop_lock:
+        if _background_event_loop is None or not _background_event_loop.is_running():
+            _background_event_loop = BackgroundEventLoop()
+        return _background_event_loop
+
+
+def stop_background_event_loop():
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is not None:
+            _background_event_loop.stop()
+            _background_event_loop = None
+
+
 def sync(co: Coroutine[Any, Any, _T]) -> _T:
+    if background_event_loop_enabled():
+        background_loop = get_background_event_loop()
+        # Code running in the background loop can't wait for it, so it falls back to
+        # running the coroutine in the current loop (like without the background loop)
+        if threading.current_thread() is not background_loop.thread:
+            return background_loop.run(co)
+
     loop = create_or_get_event_loop()
     return loop.run_until_complete(co)
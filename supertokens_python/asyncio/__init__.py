@@ -81,6 +81,14 @@ async def get_user_count(
     )
 
 
+async def warmup(user_context: Optional[Dict[str, Any]] = None) -> None:
+    return await Supertokens.get_instance().warmup(user_context)
+
+
+async def shutdown() -> None:
+    return await Supertokens.get_instance().shutdown()
+
+
 async def delete_user(
     user_id: str,
     remove_all_linked_accounts: bool = True,
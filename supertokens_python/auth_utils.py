@@ -36,6 +36,7 @@ from supertokens_python.recipe.emailverification import (
     EmailVerificationClaim,
 )
 from supertokens_python.exceptions import BadInputError, raise_bad_input_exception
+from supertokens_python.logger import LazyLogArg
 from supertokens_python.utils import log_debug_message
 from .asyncio import get_user
 
@@ -118,7 +119,8 @@ async def pre_auth_checks(
     )
     if auth_type_info.status != "OK":
         log_debug_message(
-            f"preAuthChecks returning {auth_type_info.status} from checkAuthType results"
+            "preAuthChecks returning %s from checkAuthType results",
+            auth_type_info.status,
         )
         return auth_type_info
 
@@ -220,8 +222,10 @@ async def post_auth_checks(
     request: BaseRequest,
 ) -> Union[PostAuthChecksOkResponse, PostAuthChecksSignInNotAllowedResponse]:
     log_debug_message(
-        f"postAuthChecks called {'with' if session is not None else 'without'} a session to "
-        f"{'sign up' if is_sign_up else 'sign in'} with {factor_id}"
+        "postAuthChecks called %s a session to %s with %s",
+        "with" if session is not None else "without",
+        "sign up" if is_sign_up else "sign in",
+        factor_id,
     )
 
     mfa_instance = MultiFactorAuthRecipe.get_instance()
@@ -298,7 +302,8 @@ async def get_authenticating_user_and_add_to_current_tenant_if_required(
             "thirdParty": third_party,
         }
         log_debug_message(
-            f"getAuthenticatingUserAndAddToCurrentTenantIfRequired called with {account_info}"
+            "getAuthenticatingUserAndAddToCurrentTenantIfRequired called with %s",
+            account_info,
         )
         existing_users = await AccountLinkingRecipe.get_instance().recipe_implementation.list_users_by_account_info(
             tenant_id=tenant_id,
@@ -904,7 +909,8 @@ async def filter_out_invalid_second_factors_or_throw_if_all_are_invalid(
     user_context: Dict[str, Any],
 ) -> List[str]:
     log_debug_message(
-        f"filter_out_invalid_second_factors_or_throw_if_all_are_invalid called for {', '.join(factor_ids)}"
+        "filter_out_invalid_second_factors_or_throw_if_all_are_invalid called for %s",
+        LazyLogArg(", ".join, factor_ids),
     )
 
     mfa_instance = MultiFactorAuthRecipe.get_instance()
@@ -31,3 +31,7 @@ API_VERSION_HEADER = "cdi-version"
 DASHBOARD_VERSION = "0.13"
 ONE_YEAR_IN_MS = 31536000000
 RATE_LIMIT_STATUS_CODE = 429
+MAX_RATE_LIMIT_RETRIES = 5
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_SEC = 5.0
@@ -0,0 +1,176 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from httpx import Response
+
+from .utils import TTLCache, get_timestamp_ms
+
+DEFAULT_CORE_CALL_CACHE_MAX_SIZE = 1000
+
+
+class CoreCallCachePolicy:
+    """
+    How long the responses of GET requests to a core path are cached for, and which
+    write paths (apart from the path itself) change the data returned by it.
+    Paths are given without the tenant id prefix.
+    """
+
+    def __init__(self, ttl_sec: float, invalidated_by: Optional[List[str]] = None):
+        self.ttl_sec = ttl_sec
+        self.invalidated_by = invalidated_by if invalidated_by is not None else []
+
+
+DEFAULT_CORE_CALL_CACHE_POLICIES: Dict[str, CoreCallCachePolicy] = {
+    "/recipe/user/roles": CoreCallCachePolicy(
+        10,
+        [
+            "/recipe/user/role",
+            "/recipe/user/role/remove",
+            "/recipe/role/remove",
+            "/user/remove",
+        ],
+    ),
+    "/recipe/role/permissions": CoreCallCachePolicy(
+        10,
+        ["/recipe/role", "/recipe/role/permissions/remove", "/recipe/role/remove"],
+    ),
+    "/recipe/permission/roles": CoreCallCachePolicy(
+        10,
+        ["/recipe/role", "/recipe/role/permissions/remove", "/recipe/role/remove"],
+    ),
+    "/recipe/roles": CoreCallCachePolicy(10, ["/recipe/role", "/recipe/role/remove"]),
+    "/recipe/user/metadata": CoreCallCachePolicy(
+        10, ["/recipe/user/metadata/remove", "/user/remove"]
+    ),
+    "/recipe/multitenancy/tenant/v2": CoreCallCachePolicy(
+        10,
+        [
+            "/recipe/multitenancy/tenant/remove",
+            "/recipe/multitenancy/config/thirdparty",
+            "/recipe/multitenancy/config/thirdparty/remove",
+        ],
+    ),
+    "/recipe/multitenancy/tenant/list/v2": CoreCallCachePolicy(
+        10,
+        [
+            "/recipe/multitenancy/tenant/v2",
+            "/recipe/multitenancy/tenant/remove",
+            "/recipe/multitenancy/config/thirdparty",
+            "/recipe/multitenancy/config/thirdparty/remove",
+        ],
+    ),
+}
+
+
+class CoreCallCacheConfig:
+    """
+    Enables a cache of core GET responses that is shared across requests. Only the paths
+    that have a policy are cached (DEFAULT_CORE_CALL_CACHE_POLICIES if policies is None).
+
+    Entries are invalidated when this process sends a write request to a path that
+    invalidates them, but not when the data is changed by other processes, so the
+    TTL of a policy is how long other processes' changes can go unnoticed.
+
+    The cache is not used if a network_interceptor is set, since that can change the
+    request.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, CoreCallCachePolicy]] = None,
+        max_size: int = DEFAULT_CORE_CALL_CACHE_MAX_SIZE,
+    ):
+        self.policies = (
+            policies if policies is not None else DEFAULT_CORE_CALL_CACHE_POLICIES
+        )
+        self.max_size = max_size
+
+
+def get_path_without_tenant_id(path: str) -> str:
+    # tenant specific paths look like /<tenant id>/recipe/...
+    index = path.find("/recipe/")
+    if index > 0:
+        return path[index:]
+    return path
+
+
+class SharedCoreCallCache:
+    def __init__(self, config: CoreCallCacheConfig):
+        self.policies = {**config.policies}
+        self.__entries: TTLCache[Tuple[int, Response]] = TTLCache(config.max_size)
+        # Every cached path has a generation, which is bumped to invalidate all its entries
+        self.__generations: Dict[str, int] = {}
+        self.__generations_lock = threading.Lock()
+        self.__invalidated_paths = self.__get_invalidated_paths()
+
+    def __get_invalidated_paths(self) -> Dict[str, List[str]]:
+        invalidated_paths: Dict[str, List[str]] = {}
+        for path, policy in self.policies.items():
+            for write_path in [path, *policy.invalidated_by]:
+                invalidated_paths.setdefault(write_path, []).append(path)
+        return invalidated_paths
+
+    def set_policy(self, path: str, policy: CoreCallCachePolicy):
+        """
+        Caches the responses of path (given without the tenant id prefix) with policy,
+        instead of its current policy (if any)
+        """
+        with self.__generations_lock:
+            self.policies[path] = policy
+            self.__invalidated_paths = self.__get_invalidated_paths()
+            # responses cached with the previous policy are not used anymore
+            self.__generations[path] = self.__generations.get(path, 0) + 1
+
+    def get_generation(self, path: str) -> Optional[int]:
+        """
+        Returns None if the responses of this path are not cached
+        """
+        path = get_path_without_tenant_id(path)
+        if path not in self.policies:
+            return None
+        return self.__generations.get(path, 0)
+
+    def get(self, key: str, generation: int) -> Optional[Response]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != generation:
+            self.__entries.delete(key)
+            return None
+        return entry[1]
+
+    def set(self, path: str, key: str, generation: int, response: Response):
+        """
+        generation must be the one of the path before the request was sent, so that
+        the response is not used if the path was invalidated while it was in flight
+        """
+        policy = self.policies[get_path_without_tenant_id(path)]
+        self.__entries.set(
+            key, (generation, response), get_timestamp_ms() + int(policy.ttl_sec * 1000)
+        )
+
+    def invalidate(self, write_path: str):
+        paths = self.__invalidated_paths.get(get_path_without_tenant_id(write_path))
+        if paths is None:
+            return
+        with self.__generations_lock:
+            for path in paths:
+                self.__generations[path] = self.__generations.get(path, 0) + 1
+
+    def clear(self):
+        self.__entries.clear()
@@ -11,7 +11,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Union
+from typing import Any, Callable, Dict, Union
 
 
 def get_middleware():
@@ -33,6 +33,20 @@ def get_middleware():
         FastApiResponse,
     )
 
+    def may_be_handled_by_supertokens(st: Supertokens, scope: Scope) -> bool:
+        # This is checked on the raw path, so that the request and response objects are
+        # not created for requests that are not for SuperTokens. It is less strict than the
+        # check in Supertokens.middleware (normalising the path can only shorten it), so it
+        # never skips a request that the middleware would handle.
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path != "" and path.startswith(root_path):
+            path = path[len(root_path) :]
+        full_path = (
+            st.app_info.api_gateway_path.get_as_string_dangerous() + path
+        ).lower()
+        return full_path.startswith(st.app_info.api_base_path.get_as_string_dangerous())
+
     class ASGIMiddleware:
         def __init__(self, app: ASGIApp) -> None:
             self.app = app
@@ -44,6 +58,20 @@ def get_middleware():
 
             st = Supertokens.get_instance()
 
+            if not may_be_handled_by_supertokens(st, scope):
+                await self.app(
+                    scope,
+                    receive,
+                    self.wrap_send(
+                        scope,
+                        send,
+                        lambda: default_user_context(
+                            FastApiRequest(Request(scope, receive=receive))
+                        ),
+                    ),
+                )
+                return
+
             request = Request(scope, receive=receive)
             custom_request = FastApiRequest(request)
             user_context = default_user_context(custom_request)
@@ -57,28 +85,11 @@ def get_middleware():
                     # This means that the supertokens middleware did not handle the request,
                     # however, we may need to handle the header changes in the response,
                     # based on response mutators used by the session.
-                    async def send_wrapper(message: Message):
-                        if message["type"] == "http.response.start":
-                            # Start message has the headers, so we update the headers here
-                            # by using `manage_session_post_response` function, which will
-                            # apply all the Response Mutators. In the end, we just replace
-                            # the updated headers in the message.
-                            if hasattr(request.state, "supertokens") and isinstance(
-                                request.state.supertokens, SessionContainer
-                            ):
-                                fapi_response = Response()
-                                fapi_response.raw_headers = message["headers"]
-                                response = FastApiResponse(fapi_response)
-                                manage_session_post_response(
-                                    request.state.supertokens, response, user_context
-                                )
-                                message["headers"] = fapi_response.raw_headers
-
-                        # For `http.response.start` message, we might have the headers updated,
-                        # otherwise, we just send all the messages as is
-                        await send(message)
-
-                    await self.app(scope, receive, send_wrapper)
+                    await self.app(
+                        scope,
+                        receive,
+                        self.wrap_send(scope, send, lambda: user_context),
+                    )
                     return
 
                 # This means that the request was handled by the supertokens middleware
@@ -107,4 +118,32 @@ def get_middleware():
 
             raise Exception("Should never come here")
 
+        @staticmethod
+        def wrap_send(
+            scope: Scope, send: Send, get_user_context: Callable[[], Dict[str, Any]]
+        ) -> Send:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    # Start message has the headers, so we update the headers here
+                    # by using `manage_session_post_response` function, which will
+                    # apply all the Response Mutators. In the end, we just replace
+                    # the updated headers in the message.
+                    # request.state is kept in scope["state"], so this is the session
+                    # attached by verify_session (if any)
+                    session = scope.get("state", {}).get("supertokens")
+                    if isinstance(session, SessionContainer):
+                        fapi_response = Response()
+                        fapi_response.raw_headers = message["headers"]
+                        response = FastApiResponse(fapi_response)
+                        manage_session_post_response(
+                            session, response, get_user_context()
+                        )
+                        message["headers"] = fapi_response.raw_headers
+
+                # For `http.response.start` message, we might have the headers updated,
+                # otherwise, we just send all the messages as is
+                await send(message)
+
+            return send_wrapper
+
     return ASGIMiddleware
@@ -0,0 +1,111 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from urllib.parse import parse_qsl
+
+from supertokens_python.framework.request import BaseRequest
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+    from starlette.types import Receive, Scope
+    from supertokens_python.recipe.session.interfaces import SessionContainer
+
+
+class FastApiScopeRequest(BaseRequest):
+    """
+    A request that reads the headers and cookies straight from the ASGI scope, so verifying
+    a session does not need a starlette Request (or its parsed headers and cookies). The
+    starlette Request is only created (and set as `request`) if the body, query params or
+    url are read.
+    """
+
+    def __init__(self, scope: Scope, receive: Optional[Receive] = None):
+        super().__init__()
+        self.request: Optional[Request] = None
+        self.scope = scope
+        self.receive = receive
+        self.__headers: Optional[Dict[str, str]] = None
+        self.__cookies: Optional[Dict[str, str]] = None
+
+    def __get_request(self) -> Request:
+        if self.request is None:
+            from starlette.requests import Request, empty_receive
+
+            self.request = Request(self.scope, self.receive or empty_receive)
+        return self.request
+
+    def __get_headers(self) -> Dict[str, str]:
+        if self.__headers is None:
+            headers: Dict[str, str] = {}
+            for key, value in self.scope["headers"]:
+                # like starlette, the first value is used for repeated headers
+                headers.setdefault(key.decode("latin-1"), value.decode("latin-1"))
+            self.__headers = headers
+        return self.__headers
+
+    def get_original_url(self) -> str:
+        return self.__get_request().url.components.geturl()
+
+    def get_query_param(
+        self, key: str, default: Union[str, None] = None
+    ) -> Union[str, None]:
+        return self.__get_request().query_params.get(key, default)
+
+    def get_query_params(self) -> Dict[str, Any]:
+        return dict(self.__get_request().query_params.items())  # type: ignore
+
+    async def json(self) -> Union[Any, None]:
+        try:
+            return await self.__get_request().json()
+        except Exception:
+            return {}
+
+    def method(self) -> str:
+        return self.scope["method"]
+
+    def get_cookie(self, key: str) -> Union[str, None]:
+        if self.__cookies is None:
+            from starlette.requests import cookie_parser
+
+            cookie_header = self.__get_headers().get("cookie")
+            self.__cookies = (
+                {} if cookie_header is None else cookie_parser(cookie_header)
+            )
+        return self.__cookies.get(key)
+
+    def get_header(self, key: str) -> Union[str, None]:
+        return self.__get_headers().get(key.lower())
+
+    def get_session(self) -> Union[SessionContainer, None]:
+        return self.scope.get("state", {}).get("supertokens")
+
+    def set_session(self, session: SessionContainer):
+        self.scope.setdefault("state", {})["supertokens"] = session
+
+    def set_session_as_none(self):
+        self.scope.setdefault("state", {})["supertokens"] = None
+
+    def get_path(self) -> str:
+        root_path = self.scope.get("root_path")
+        if root_path is None:
+            raise Exception("should never happen")
+
+        path = self.scope["path"]
+        # Same as FastApiRequest.get_path
+        return path[path.startswith(root_path) and len(root_path) :]
+
+    async def form_data(self):
+        return dict(parse_qsl((await self.__get_request().body()).decode("utf-8")))
@@ -0,0 +1,180 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import threading
+from typing import List, Optional, Set, Tuple
+
+from .utils import get_timestamp_ms
+
+# A host is ejected after this many consecutive connection failures
+HOST_FAILURE_THRESHOLD = 3
+# Ejected hosts are not used until this has passed. After that, a single request is sent
+# to the host to check if it has recovered (and it is ejected again if that fails).
+HOST_EJECTION_DURATION_MS = 30000
+# Weight of the latest request in the moving average of the latency of a host
+HOST_LATENCY_SMOOTHING = 0.3
+
+
+class HostHealth:
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.ejected_until: Optional[int] = None
+        self.probe_in_flight = False
+        self.average_latency_ms: Optional[float] = None
+
+
+class HostSelector:
+    """
+    Picks the core host to send a request to. Hosts that keep failing are ejected for a
+    while, and the others are picked with a probability inversely proportional to their
+    average latency.
+    """
+
+    def __init__(self, host_urls: List[str]):
+        self.host_urls = host_urls
+        self.hosts = [HostHealth() for _ in host_urls]
+        self.__next_index = 0
+        self.__lock = threading.Lock()
+
+    def select(self, tried_indexes: Set[int]) -> Tuple[int, bool]:
+        """
+        Returns the index of the host to use, and whether the request probes that host after
+        it was ejected (in which case release_probe must be called once it is done). Hosts in
+        tried_indexes are not picked, unless all of them have been tried.
+        """
+        no_of_hosts = len(self.hosts)
+        if no_of_hosts == 1:
+            return 0, False
+
+        with self.__lock:
+            now = get_timestamp_ms()
+            candidates: List[int] = []
+            for offset in range(no_of_hosts):
+                index = (self.__next_index + offset) % no_of_hosts
+                if index not in tried_indexes:
+                    candidates.append(index)
+            self.__next_index = (self.__next_index + 1) % no_of_hosts
+            if len(candidates) == 0:
+                candidates = list(range(no_of_hosts))
+
+            available = [i for i in candidates if self.__is_available(i, now)]
+            if len(available) == 0:
+                # All the hosts that are left are ejected, trying them is better than failing
+                return candidates[0], False
+
+            index = self.__pick_by_latency(available)
+            host = self.hosts[index]
+            if host.ejected_until is not None:
+                # the ejection window has passed, so this request probes the host
+                host.probe_in_flight = True
+                return index, True
+            return index, False
+
+    def __is_available(self, index: int, now: int) -> bool:
+        host = self.hosts[index]
+        if host.ejected_until is None:
+            return True
+        return host.ejected_until <= now and not host.probe_in_flight
+
+    def __pick_by_latency(self, indexes: List[int]) -> int:
+        if len(indexes) == 1:
+            return indexes[0]
+
+        latencies: List[float] = []
+        for i in indexes:
+            latency = self.hosts[i].average_latency_ms
+            if latency is not None:
+                latencies.append(latency)
+        if len(latencies) == 0:
+            return indexes[0]
+
+        # hosts without a latency yet are treated like the fastest one, so that they get used
+        fastest = max(min(latencies), 1)
+        weights = [
+            1 / max(self.hosts[i].average_latency_ms or fastest, 1) for i in indexes
+        ]
+        return random.choices(indexes, weights)[0]
+
+    def get_index(self, url: str) -> Optional[int]:
+        index: Optional[int] = None
+        for i, host_url in enumerate(self.host_urls):
+            if url.startswith(host_url) and (
+                index is None or len(host_url) > len(self.host_urls[index])
+            ):
+                index = i
+        return index
+
+    def on_success(self, url: str, latency_ms: float):
+        if len(self.hosts) == 1:
+            return
+        index = self.get_index(url)
+        if index is None:
+            return
+        with self.__lock:
+            host = self.hosts[index]
+            host.consecutive_failures = 0
+            host.ejected_until = None
+            self.__add_latency(host, latency_ms)
+
+    def on_cancelled(self, url: str, latency_ms: float):
+        """
+        The request was cancelled (for example, because another host responded first), so
+        the time it was waiting for is the lower bound of the latency of the host
+        """
+        if len(self.hosts) == 1:
+            return
+        index = self.get_index(url)
+        if index is None:
+            return
+        with self.__lock:
+            self.__add_latency(self.hosts[index], latency_ms)
+
+    @staticmethod
+    def __add_latency(host: HostHealth, latency_ms: float):
+        if host.average_latency_ms is None:
+            host.average_latency_ms = latency_ms
+        else:
+            host.average_latency_ms += HOST_LATENCY_SMOOTHING * (
+                latency_ms - host.average_latency_ms
+            )
+
+    def on_failure(self, url: str):
+        if len(self.hosts) == 1:
+            return
+        index = self.get_index(url)
+        if index is None:
+            return
+        with self.__lock:
+            host = self.hosts[index]
+            host.consecutive_failures += 1
+            if (
+                host.ejected_until is not None
+                or host.consecutive_failures >= HOST_FAILURE_THRESHOLD
+            ):
+                host.ejected_until = get_timestamp_ms() + HOST_EJECTION_DURATION_MS
+
+    def release_probe(self, index: int):
+        """
+        Called once the request that probes the host is done, so that the next request can
+        probe it again if the host is still ejected. Other requests to the host must not call
+        this, as another probe would be sent while this one is still in flight.
+        """
+        with self.__lock:
+            self.hosts[index].probe_in_flight = False
+
+    def is_ejected(self, index: int) -> bool:
+        ejected_until = self.hosts[index].ejected_until
+        return ejected_until is not None and ejected_until > get_timestamp_ms()
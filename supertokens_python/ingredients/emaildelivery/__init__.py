@@ -12,21 +12,39 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+import time
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfigWithService,
     EmailDeliveryInterface,
 )
+from supertokens_python.metrics import delivery_duration
 
 _T = TypeVar("_T")
 
 
+class TimedEmailDeliveryInterface(EmailDeliveryInterface[_T]):
+    """Observes the duration of sending each email in the delivery_duration metric"""
+
+    def __init__(self, email_delivery: EmailDeliveryInterface[_T]) -> None:
+        self.email_delivery = email_delivery
+
+    async def send_email(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        try:
+            await self.email_delivery.send_email(template_vars, user_context)
+        finally:
+            delivery_duration.observe(
+                time.perf_counter() - start, "email", type(template_vars).__name__
+            )
+
+
 class EmailDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: EmailDeliveryInterface[_T]
 
     def __init__(self, config: EmailDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+        self.ingredient_interface_impl = TimedEmailDeliveryInterface(
             config.service
             if config.override is None
             else config.override(config.service)
@@ -12,21 +12,39 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+import time
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.smsdelivery.types import (
     SMSDeliveryConfigWithService,
     SMSDeliveryInterface,
 )
+from supertokens_python.metrics import delivery_duration
 
 _T = TypeVar("_T")
 
 
+class TimedSMSDeliveryInterface(SMSDeliveryInterface[_T]):
+    """Observes the duration of sending each SMS in the delivery_duration metric"""
+
+    def __init__(self, sms_delivery: SMSDeliveryInterface[_T]) -> None:
+        self.sms_delivery = sms_delivery
+
+    async def send_sms(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        try:
+            await self.sms_delivery.send_sms(template_vars, user_context)
+        finally:
+            delivery_duration.observe(
+                time.perf_counter() - start, "sms", type(template_vars).__name__
+            )
+
+
 class SMSDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: SMSDeliveryInterface[_T]
 
     def __init__(self, config: SMSDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+        self.ingredient_interface_impl = TimedSMSDeliveryInterface(
             config.service
             if config.override is None
             else config.override(config.service)
@@ -11,16 +11,21 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import atexit
+import copy
 import json
 import logging
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from os import getenv, path
-from typing import Union
+from queue import Queue
+from typing import Any, Callable, Dict, Optional
 
 from .constants import VERSION
 
 NAMESPACE = "com.supertokens"
 DEBUG_ENV_VAR = "SUPERTOKENS_DEBUG"
+QUEUED_LOGGING_ENV_VAR = "SUPERTOKENS_QUEUED_LOGGING"
 
 supertokens_dir = path.dirname(__file__)
 
@@ -40,28 +45,102 @@ def _get_log_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()[:-3] + "Z"
 
 
-class CustomStreamHandler(logging.StreamHandler):  # type: ignore
-    def emit(self, record: logging.LogRecord):
-        relative_path = path.relpath(record.pathname, supertokens_dir)
+class CustomFormatter(logging.Formatter):
+    """
+    Formats records as "{name} {message}\n", where message is a JSON object with the
+    formatted log message. Unlike modifying record.msg, this leaves the record as it
+    is for other handlers.
+    """
+
+    def __init__(self):
+        super().__init__("{name} {message}\n", style="{")
+        # There are only as many paths as source files that log, so this is never evicted
+        self.__relative_paths: Dict[str, str] = {}
+
+    def __get_relative_path(self, pathname: str) -> str:
+        relative_path = self.__relative_paths.get(pathname)
+        if relative_path is None:
+            relative_path = path.relpath(pathname, supertokens_dir)
+            self.__relative_paths[pathname] = relative_path
+        return relative_path
 
-        record.msg = json.dumps(
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = json.dumps(
             {
-                "t": _get_log_timestamp(),
+                "t": getattr(record, "st_timestamp", None) or _get_log_timestamp(),
                 "sdkVer": VERSION,
-                "message": record.msg,
-                "file": f"{relative_path}:{record.lineno}",
+                "message": record.message,
+                "file": f"{self.__get_relative_path(record.pathname)}:{record.lineno}",
             }
         )
+        return self._fmt.format(name=record.name, message=message)  # type: ignore
+
+
+class CustomStreamHandler(logging.StreamHandler):  # type: ignore
+    pass
 
-        return super().emit(record)
+
+class CustomQueueHandler(QueueHandler):
+    """
+    Puts records in a queue, so that they are formatted and written by the thread of a
+    QueueListener. Only the log message (and its timestamp) is formatted by the thread that
+    logs, since its arguments may change after it returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        setattr(record, "st_timestamp", _get_log_timestamp())
+        return record
 
 
 # Add stream handler and format
 streamHandler = CustomStreamHandler()
-streamFormatter = logging.Formatter("{name} {message}\n", style="{")
+streamFormatter = CustomFormatter()
 streamHandler.setFormatter(streamFormatter)
 _logger.addHandler(streamHandler)
 
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[CustomQueueHandler] = None
+
+
+def enable_queued_logging():
+    """
+    Writes the logs from a background thread, so that logging (e.g. debug logging under
+    load) does not block the threads handling requests on formatting and writing logs.
+    The queued logs are written when the process exits normally, but are lost if it is
+    killed.
+    """
+    global _queue_listener, _queue_handler
+    if _queue_listener is not None:
+        return
+    log_queue: "Queue[logging.LogRecord]" = Queue()
+    _queue_handler = CustomQueueHandler(log_queue)
+    _queue_listener = QueueListener(log_queue, streamHandler)
+    _queue_listener.start()
+    _logger.addHandler(_queue_handler)
+    _logger.removeHandler(streamHandler)
+
+
+def disable_queued_logging():
+    """Writes the logs from the thread that logs them again, after writing the queued logs"""
+    global _queue_listener, _queue_handler
+    if _queue_listener is None or _queue_handler is None:
+        return
+    _logger.addHandler(streamHandler)
+    _logger.removeHandler(_queue_handler)
+    _queue_listener.stop()
+    _queue_listener = None
+    _queue_handler = None
+
+
+# Runs before logging closes its handlers at exit, since it is registered after logging
+atexit.register(disable_queued_logging)
+
+if getenv(QUEUED_LOGGING_ENV_VAR, "") == "1":
+    enable_queued_logging()
+
 
 # The debug logger can be used like this:
 # log_debug_message("Hello")
@@ -72,7 +151,24 @@ _logger.addHandler(streamHandler)
 log_debug_message = _logger.debug
 
 
-def get_maybe_none_as_str(o: Union[str, None]) -> str:
-    if o is None:
-        return "None"
-    return o
+def is_debug_logging_enabled() -> bool:
+    """Can be used to skip preparing the arguments of debug messages, when they are not logged"""
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
+class LazyLogArg:
+    """
+    An argument of a log message that is only computed when the message is formatted, i.e.
+    it is not computed at all if debug logging is disabled:
+    log_debug_message("Response: %s", LazyLogArg(json.dumps, response))
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
@@ -0,0 +1,242 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+In-process counters and histograms of the SDK, which can be exposed in the Prometheus text
+format by an endpoint of the app:
+
+    @app.get("/metrics")
+    def metrics():
+        return PlainTextResponse(generate_metrics_text())
+"""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if len(names) == 0:
+        return ""
+    labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + labels + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.__values: Dict[Tuple[str, ...], float] = {}
+        self.__lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self.__lock:
+            self.__values[label_values] = self.__values.get(label_values, 0) + amount
+
+    def get(self, *label_values: str) -> float:
+        return self.__values.get(label_values, 0)
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self.__lock:
+            values = list(self.__values.items())
+        for label_values, value in values:
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+
+
+class HistogramValues:
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.__values: Dict[Tuple[str, ...], HistogramValues] = {}
+        self.__lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        # the count of a bucket only has the observations that are in it, they are
+        # added up to get the cumulative counts when collecting
+        bucket_index = bisect_left(self.buckets, value)
+        with self.__lock:
+            values = self.__values.get(label_values)
+            if values is None:
+                values = HistogramValues(len(self.buckets) + 1)
+                self.__values[label_values] = values
+            values.bucket_counts[bucket_index] += 1
+            values.count += 1
+            values.sum += value
+
+    def get_count(self, *label_values: str) -> int:
+        values = self.__values.get(label_values)
+        return 0 if values is None else values.count
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self.__lock:
+            values = [
+                (label_values, list(v.bucket_counts), v.count, v.sum)
+                for label_values, v in self.__values.items()
+            ]
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, bucket_counts, count, total in values:
+            cumulative_count = 0
+            for bound, bucket_count in zip(
+                self.buckets + (float("inf"),), bucket_counts
+            ):
+                cumulative_count += bucket_count
+                labels = _format_labels(
+                    bucket_label_names, label_values + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative_count}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: Dict[str, Union[Counter, Histogram]] = {}
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, label_names)
+        self.metrics[name] = metric
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, label_names, buckets)
+        self.metrics[name] = metric
+        return metric
+
+    def generate_text(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for metric in self.metrics.values():
+            metric.clear()
+
+
+metrics_registry = MetricsRegistry()
+
+core_request_duration = metrics_registry.histogram(
+    "supertokens_core_request_duration_seconds",
+    "Duration of requests to the core (paths are without the tenant id).",
+    ("path", "host"),
+)
+core_rate_limit_retries = metrics_registry.counter(
+    "supertokens_core_rate_limit_retries_total",
+    "Requests to the core that were retried because the core returned 429.",
+    ("path",),
+)
+jwks_refreshes = metrics_registry.counter(
+    "supertokens_jwks_refreshes_total",
+    "Fetches of the JWKS from the core, by result (success or failure).",
+    ("result",),
+)
+jwks_refresh_duration = metrics_registry.histogram(
+    "supertokens_jwks_refresh_duration_seconds",
+    "Duration of fetching the JWKS from the core.",
+)
+session_verifications = metrics_registry.counter(
+    "supertokens_session_verifications_total",
+    "Sessions verified locally with the JWKS (local) or by the core (core).",
+    ("method",),
+)
+claim_refetches = metrics_registry.counter(
+    "supertokens_claim_refetches_total",
+    "Claim values fetched while validating claims, by claim key.",
+    ("claim",),
+)
+delivery_duration = metrics_registry.histogram(
+    "supertokens_delivery_duration_seconds",
+    "Duration of sending emails and SMSs, by channel and template type.",
+    ("channel", "template"),
+)
+
+
+def generate_metrics_text() -> str:
+    """The metrics of the SDK in the Prometheus text exposition format"""
+    return metrics_registry.generate_text()
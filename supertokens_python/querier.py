@@ -14,11 +14,20 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from json import JSONDecodeError
 from os import environ
+from urllib.parse import urlsplit
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from httpx import (
+    AsyncClient,
+    ConnectTimeout,
+    Limits,
+    NetworkError,
+    Response,
+    TimeoutException,
+)
 
 from .constants import (
     API_KEY_HEADER,
@@ -27,7 +36,21 @@ from .constants import (
     RID_KEY_HEADER,
     SUPPORTED_CDI_VERSIONS,
     RATE_LIMIT_STATUS_CODE,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SEC,
+)
+from .core_call_cache import (
+    CoreCallCacheConfig,
+    CoreCallCachePolicy,
+    SharedCoreCallCache,
+    get_path_without_tenant_id,
 )
+from .host_selector import HostSelector
+from .metrics import core_rate_limit_retries, core_request_duration
+from .rate_limit_retry import CoreRateLimitRetryConfig, RateLimitRetrier
+from .request_hedging import CoreRequestHedgingConfig, RequestHedger
+from .tracing import NO_OP_SPAN, get_current_span, trace
 from .normalised_url_path import NormalisedURLPath
 
 if TYPE_CHECKING:
@@ -46,8 +69,8 @@ class Querier:
     __init_called = False
     __hosts: List[Host] = []
     __api_key: Union[None, str] = None
-    api_version = None
-    __last_tried_index: int = 0
+    api_version: Optional[str] = None
+    __host_selector = HostSelector([])
     __hosts_alive_for_testing: Set[str] = set()
     network_interceptor: Optional[
         Callable[
@@ -70,6 +93,26 @@ class Querier:
     ] = None
     __global_cache_tag = get_timestamp_ms()
     __disable_cache = False
+    # cache of GET responses shared across requests, only used if configured
+    __shared_cache: Optional[SharedCoreCallCache] = None
+    # identical GET requests that are sent concurrently share the response of the first one
+    __in_flight_get_requests: Dict[
+        Tuple[asyncio.AbstractEventLoop, str], asyncio.Future[Response]
+    ] = {}
+    __coalesced_get_requests_count = 0
+    __request_hedger: Optional[RequestHedger] = None
+    # shared by all the requests of the process, so that the retries of 429s are limited
+    __rate_limit_retrier = RateLimitRetrier(CoreRateLimitRetryConfig())
+    # concurrent callers of get_api_version (in the same event loop) share one request
+    __api_version_requests: Dict[asyncio.AbstractEventLoop, asyncio.Future[str]] = {}
+    # httpx clients are bound to the event loop they were first used on, so we
+    # keep one long lived (pooled) client per event loop.
+    __http_clients: Dict[asyncio.AbstractEventLoop, AsyncClient] = {}
+    __http_limits: Limits = Limits(
+        max_connections=DEFAULT_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=DEFAULT_HTTP_KEEPALIVE_EXPIRY_SEC,
+    )
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -93,6 +136,60 @@ class Querier:
             raise Exception("calling testing function in non testing env")
         return Querier.__hosts_alive_for_testing
 
+    @staticmethod
+    def __get_http_client() -> Optional[AsyncClient]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        client = Querier.__http_clients.get(loop)
+        if client is None or client.is_closed:
+            # clients of event loops that have been closed can never be used
+            # again (for example, the per test loops of pytest-asyncio)
+            stale_loops = [
+                other_loop
+                for other_loop in Querier.__http_clients
+                if other_loop.is_closed()
+            ]
+            for stale_loop in stale_loops:
+                del Querier.__http_clients[stale_loop]
+            client = AsyncClient(timeout=30.0, limits=Querier.__http_limits)
+            Querier.__http_clients[loop] = client
+        return client
+
+    @staticmethod
+    async def close_http_clients():
+        clients = Querier.__http_clients
+        Querier.__http_clients = {}
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for loop, client in clients.items():
+            if loop is current_loop:
+                await client.aclose()
+            elif not loop.is_closed() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            # clients of loops that are not running are just dropped. Their
+            # connections are released when they are garbage collected.
+
+    @staticmethod
+    async def __send_with_client(
+        client: AsyncClient, url: str, method: str, *args: Any, **kwargs: Any
+    ) -> Response:
+        if method == "GET":
+            return await client.get(url, *args, **kwargs)  # type: ignore
+        if method == "POST":
+            return await client.post(url, *args, **kwargs)  # type: ignore
+        if method == "PUT":
+            return await client.put(url, *args, **kwargs)  # type: ignore
+        if method == "DELETE":
+            return await client.delete(url, *args, **kwargs)  # type: ignore
+        raise Exception("Shouldn't come here")
+
     async def api_request(
         self,
         url: str,
@@ -105,16 +202,32 @@ class Querier:
             raise Exception("Retry request failed")
 
         try:
-            async with AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    return await client.get(url, *args, **kwargs)  # type: ignore
-                if method == "POST":
-                    return await client.post(url, *args, **kwargs)  # type: ignore
-                if method == "PUT":
-                    return await client.put(url, *args, **kwargs)  # type: ignore
-                if method == "DELETE":
-                    return await client.delete(url, *args, **kwargs)  # type: ignore
-                raise Exception("Shouldn't come here")
+            client = Querier.__get_http_client()
+            start = time.perf_counter()
+            try:
+                if client is not None:
+                    response = await Querier.__send_with_client(
+                        client, url, method, *args, **kwargs
+                    )
+                else:
+                    async with AsyncClient(
+                        timeout=30.0, limits=Querier.__http_limits
+                    ) as transient_client:
+                        response = await Querier.__send_with_client(
+                            transient_client, url, method, *args, **kwargs
+                        )
+            except (ConnectionError, NetworkError, TimeoutException):
+                Querier.__host_selector.on_failure(url)
+                raise
+            except asyncio.CancelledError:
+                Querier.__host_selector.on_cancelled(
+                    url, (time.perf_counter() - start) * 1000
+                )
+                raise
+            duration_sec = time.perf_counter() - start
+            Querier.__host_selector.on_success(url, duration_sec * 1000)
+            Querier.__observe_request_duration(url, duration_sec)
+            return response
         except AsyncLibraryNotFoundError:
             # Retry
             loop = create_or_get_event_loop()
@@ -122,13 +235,43 @@ class Querier:
                 self.api_request(url, method, attempts_remaining - 1, *args, **kwargs)
             )
 
-    async def get_api_version(self, user_context: Union[Dict[str, Any], None] = None):
-        if user_context is None:
-            user_context = {}
+    @staticmethod
+    def __observe_request_duration(url: str, duration_sec: float):
+        host_index = Querier.__host_selector.get_index(url)
+        if host_index is not None:
+            host = Querier.__host_selector.host_urls[host_index]
+            path = url[len(host) :]
+        else:
+            # the url was changed by the network interceptor
+            split_url = urlsplit(url)
+            host = f"{split_url.scheme}://{split_url.netloc}"
+            path = split_url.path
+        core_request_duration.observe(
+            duration_sec, get_path_without_tenant_id(path), host
+        )
 
+    async def get_api_version(
+        self, user_context: Union[Dict[str, Any], None] = None
+    ) -> str:
         if Querier.api_version is not None:
             return Querier.api_version
 
+        loop = asyncio.get_running_loop()
+        request = Querier.__api_version_requests.get(loop)
+        if request is None:
+            request = asyncio.ensure_future(self.__fetch_api_version(user_context))
+            Querier.__api_version_requests[loop] = request
+            request.add_done_callback(
+                lambda _: Querier.__api_version_requests.pop(loop, None)
+            )
+        return await asyncio.shield(request)
+
+    async def __fetch_api_version(
+        self, user_context: Union[Dict[str, Any], None]
+    ) -> str:
+        if user_context is None:
+            user_context = {}
+
         ProcessState.get_instance().add_state(
             PROCESS_STATE.CALLING_SERVICE_IN_GET_API_VERSION
         )
@@ -217,16 +360,61 @@ class Querier:
             ]
         ] = None,
         disable_cache: bool = False,
+        http_max_connections: Optional[int] = None,
+        http_max_keepalive_connections: Optional[int] = None,
+        http_keepalive_expiry_sec: Optional[float] = None,
+        core_call_cache: Optional[CoreCallCacheConfig] = None,
+        request_hedging: Optional[CoreRequestHedgingConfig] = None,
+        rate_limit_retry: Optional[CoreRateLimitRetryConfig] = None,
     ):
         if not Querier.__init_called:
             Querier.__init_called = True
             Querier.__hosts = hosts
             Querier.__api_key = api_key
             Querier.api_version = None
-            Querier.__last_tried_index = 0
+            Querier.__host_selector = HostSelector(
+                [
+                    h.domain.get_as_string_dangerous()
+                    + h.base_path.get_as_string_dangerous()
+                    for h in hosts
+                ]
+            )
             Querier.__hosts_alive_for_testing = set()
             Querier.network_interceptor = network_interceptor
             Querier.__disable_cache = disable_cache
+            Querier.__shared_cache = (
+                SharedCoreCallCache(core_call_cache)
+                if core_call_cache is not None
+                else None
+            )
+            Querier.__in_flight_get_requests = {}
+            Querier.__coalesced_get_requests_count = 0
+            Querier.__request_hedger = (
+                RequestHedger(request_hedging) if request_hedging is not None else None
+            )
+            Querier.__rate_limit_retrier = RateLimitRetrier(
+                rate_limit_retry
+                if rate_limit_retry is not None
+                else CoreRateLimitRetryConfig()
+            )
+            Querier.__http_clients = {}
+            Querier.__http_limits = Limits(
+                max_connections=(
+                    http_max_connections
+                    if http_max_connections is not None
+                    else DEFAULT_HTTP_MAX_CONNECTIONS
+                ),
+                max_keepalive_connections=(
+                    http_max_keepalive_connections
+                    if http_max_keepalive_connections is not None
+                    else DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                keepalive_expiry=(
+                    http_keepalive_expiry_sec
+                    if http_keepalive_expiry_sec is not None
+                    else DEFAULT_HTTP_KEEPALIVE_EXPIRY_SEC
+                ),
+            )
 
     async def __get_headers_with_api_version(
         self, path: NormalisedURLPath, user_context: Union[Dict[str, Any], None]
@@ -283,8 +471,29 @@ class Querier:
                 if not Querier.__disable_cache and unique_key in user_context.get(
                     "_default", {}
                 ).get("core_call_cache", {}):
+                    get_current_span().set_attribute("cache_hit", True)
                     return user_context["_default"]["core_call_cache"][unique_key]
 
+            # Like coalescing, the shared cache is keyed by the request before the network
+            # interceptor changes it, so it isn't used if there is an interceptor
+            shared_cache = (
+                Querier.__shared_cache if Querier.network_interceptor is None else None
+            )
+            shared_cache_generation: Optional[int] = None
+            if shared_cache is not None:
+                shared_cache_generation = shared_cache.get_generation(
+                    path.get_as_string_dangerous()
+                )
+                if shared_cache_generation is not None:
+                    cached_response = shared_cache.get(
+                        unique_key, shared_cache_generation
+                    )
+                    if cached_response is not None:
+                        get_current_span().set_attribute("cache_hit", True)
+                        return cached_response
+
+            get_current_span().set_attribute("cache_hit", False)
+
             if Querier.network_interceptor is not None:
                 (
                     url,
@@ -296,13 +505,22 @@ class Querier:
                     url, method, headers, params, {}, user_context
                 )
 
-            response = await self.api_request(
-                url,
-                method,
-                2,
-                headers=headers,
-                params=params,
-            )
+            async def send() -> Response:
+                return await self.api_request(
+                    url,
+                    method,
+                    2,
+                    headers=headers,
+                    params=params,
+                )
+
+            # The key is built before the network interceptor changes the request, which can
+            # differ for the same key (e.g. based on the user context), so such requests
+            # are not coalesced
+            if Querier.__disable_cache or Querier.network_interceptor is not None:
+                response = await send()
+            else:
+                response = await Querier.__send_coalesced_get_request(unique_key, send)
 
             if (
                 response.status_code == 200
@@ -318,6 +536,18 @@ class Querier:
                     "global_cache_tag": Querier.__global_cache_tag,
                 }
 
+            if (
+                response.status_code == 200
+                and shared_cache is not None
+                and shared_cache_generation is not None
+            ):
+                shared_cache.set(
+                    path.get_as_string_dangerous(),
+                    unique_key,
+                    shared_cache_generation,
+                    response,
+                )
+
             return response
 
         return await self.__send_request_helper(path, "GET", f, len(self.__hosts))
@@ -363,7 +593,12 @@ class Querier:
                 json=data,
             )
 
-        return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        finally:
+            # This is done after the request, so that responses of GET requests that
+            # were sent before the write completed are not cached
+            Querier.__invalidate_shared_cache(path)
 
     async def send_delete_request(
         self,
@@ -396,7 +631,14 @@ class Querier:
                 params=params,
             )
 
-        return await self.__send_request_helper(path, "DELETE", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(
+                path, "DELETE", f, len(self.__hosts)
+            )
+        finally:
+            # This is done after the request, so that responses of GET requests that
+            # were sent before the write completed are not cached
+            Querier.__invalidate_shared_cache(path)
 
     async def send_put_request(
         self,
@@ -430,7 +672,12 @@ class Querier:
                 url, method, 2, headers=headers, json=data, params=query_params
             )
 
-        return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        finally:
+            # This is done after the request, so that responses of GET requests that
+            # were sent before the write completed are not cached
+            Querier.__invalidate_shared_cache(path)
 
     def invalidate_core_call_cache(
         self,
@@ -454,6 +701,40 @@ class Querier:
             "core_call_cache": {},
         }
 
+    @staticmethod
+    async def __send_coalesced_get_request(
+        unique_key: str, send: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        key = (asyncio.get_running_loop(), unique_key)
+        in_flight = Querier.__in_flight_get_requests.get(key)
+        if in_flight is not None:
+            Querier.__coalesced_get_requests_count += 1
+            # shielded so that a cancelled caller doesn't cancel the request for the others
+            return await asyncio.shield(in_flight)
+
+        request = asyncio.ensure_future(send())
+        Querier.__in_flight_get_requests[key] = request
+
+        def remove_request(_: asyncio.Future[Response]):
+            if Querier.__in_flight_get_requests.get(key) is request:
+                del Querier.__in_flight_get_requests[key]
+
+        request.add_done_callback(remove_request)
+        return await asyncio.shield(request)
+
+    @staticmethod
+    def get_coalesced_get_requests_count() -> int:
+        """
+        The number of GET requests to the core that were not sent because an identical
+        request was already in flight (they used its response instead)
+        """
+        return Querier.__coalesced_get_requests_count
+
+    @staticmethod
+    def __invalidate_shared_cache(path: NormalisedURLPath):
+        if Querier.__shared_cache is not None:
+            Querier.__shared_cache.invalidate(path.get_as_string_dangerous())
+
     def get_all_core_urls_for_path(self, path: str) -> List[str]:
         normalized_path = NormalisedURLPath(path)
 
@@ -470,59 +751,227 @@ class Querier:
             )
         return result
 
+    def __get_host_url(self, host_index: int) -> str:
+        host = self.__hosts[host_index]
+        return (
+            host.domain.get_as_string_dangerous()
+            + host.base_path.get_as_string_dangerous()
+        )
+
+    async def __send_to_host(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        http_function: Callable[[str, str], Awaitable[Response]],
+        host_index: int,
+        is_probe: bool,
+    ) -> Response:
+        host_url = self.__get_host_url(host_index)
+        try:
+            response = await http_function(
+                host_url + path.get_as_string_dangerous(), method
+            )
+            get_current_span().set_attribute("host", host_url)
+            return response
+        finally:
+            if is_probe:
+                Querier.__host_selector.release_probe(host_index)
+
+    async def __send_hedged_request(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        http_function: Callable[[str, str], Awaitable[Response]],
+        host_index: int,
+        is_probe: bool,
+        tried_host_indexes: Set[int],
+        delay_sec: float,
+    ) -> Response:
+        """
+        Sends the request to host_index, and if it doesn't respond within delay_sec, to
+        another host as well. The first successful response is returned.
+        """
+        hedger = Querier.__request_hedger
+        assert hedger is not None
+
+        start = time.perf_counter()
+        pending: Set[asyncio.Future[Response]] = {
+            asyncio.ensure_future(
+                self.__send_to_host(path, method, http_function, host_index, is_probe)
+            )
+        }
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay_sec)
+            if len(done) == 0:
+                hedge_host_index, hedge_is_probe = Querier.__host_selector.select(
+                    tried_host_indexes | {host_index}
+                )
+                # the budget is only used if there is another host to send the request to
+                if hedge_host_index != host_index and hedger.try_acquire_hedge():
+                    pending.add(
+                        asyncio.ensure_future(
+                            self.__send_to_host(
+                                path,
+                                method,
+                                http_function,
+                                hedge_host_index,
+                                hedge_is_probe,
+                            )
+                        )
+                    )
+                elif hedge_is_probe:
+                    Querier.__host_selector.release_probe(hedge_host_index)
+
+            error: Optional[BaseException] = None
+            while True:
+                for request in done:
+                    if request.exception() is None:
+                        hedger.on_response(
+                            path.get_as_string_dangerous(),
+                            (time.perf_counter() - start) * 1000,
+                        )
+                        return request.result()
+                    error = request.exception()
+                if len(pending) == 0:
+                    assert error is not None
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for request in pending:
+                request.cancel()
+
+    @staticmethod
+    def set_core_call_cache_policy(path: str, policy: CoreCallCachePolicy):
+        """
+        Caches the responses of GET requests to path (given without the tenant id prefix)
+        in the cache shared across requests with policy. If core_call_cache is not set in
+        the SuperTokens config, the shared cache is enabled for this path only.
+        """
+        if Querier.__shared_cache is None:
+            Querier.__shared_cache = SharedCoreCallCache(CoreCallCacheConfig({}))
+        Querier.__shared_cache.set_policy(path, policy)
+
+    @staticmethod
+    def get_rate_limit_retries_denied_count() -> int:
+        """
+        The number of 429 responses from the core that were not retried because the
+        retry budget of the process was used up
+        """
+        return Querier.__rate_limit_retrier.retries_denied
+
+    @staticmethod
+    def get_hedged_requests_count() -> int:
+        """
+        The number of requests to the core that were also sent to a second host because
+        the first one was slow to respond
+        """
+        if Querier.__request_hedger is None:
+            return 0
+        return Querier.__request_hedger.hedges_sent
+
     async def __send_request_helper(
         self,
         path: NormalisedURLPath,
         method: str,
         http_function: Callable[[str, str], Awaitable[Response]],
         no_of_tries: int,
-        retry_info_map: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
-        if no_of_tries == 0:
-            raise Exception("No SuperTokens core available to query")
+        retries_by_url: Dict[str, int] = {}
+        tried_host_indexes: Set[int] = set()
+        with trace(
+            "supertokens.core_request",
+            {"path": path.get_as_string_dangerous(), "method": method},
+        ) as span:
+            try:
+                return await self.__send_request_with_retries(
+                    path,
+                    method,
+                    http_function,
+                    no_of_tries,
+                    retries_by_url,
+                    tried_host_indexes,
+                )
+            finally:
+                if span is not NO_OP_SPAN:
+                    span.set_attribute(
+                        "retry_count",
+                        len(tried_host_indexes) + sum(retries_by_url.values()),
+                    )
+
+    async def __send_request_with_retries(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        http_function: Callable[[str, str], Awaitable[Response]],
+        no_of_tries: int,
+        retries_by_url: Dict[str, int],
+        tried_host_indexes: Set[int],
+    ) -> Dict[str, Any]:
+        retrier = Querier.__rate_limit_retrier
+        while True:
+            if no_of_tries == 0:
+                raise Exception("No SuperTokens core available to query")
+
+            # hosts that have been ejected for failing (or were already tried for this
+            # request) are only picked if there is no other host left
+            host_index, is_probe = Querier.__host_selector.select(tried_host_indexes)
+
+            try:
+                current_host = self.__get_host_url(host_index)
+                url = current_host + path.get_as_string_dangerous()
+
+                ProcessState.get_instance().add_state(
+                    PROCESS_STATE.CALLING_SERVICE_IN_REQUEST_HELPER
+                )
+                hedge_delay_sec: Optional[float] = None
+                if Querier.__request_hedger is not None and len(self.__hosts) > 1:
+                    hedge_delay_sec = Querier.__request_hedger.get_delay_sec(
+                        path.get_as_string_dangerous()
+                    )
+
+                if hedge_delay_sec is None:
+                    response = await self.__send_to_host(
+                        path, method, http_function, host_index, is_probe
+                    )
+                else:
+                    response = await self.__send_hedged_request(
+                        path,
+                        method,
+                        http_function,
+                        host_index,
+                        is_probe,
+                        tried_host_indexes,
+                        hedge_delay_sec,
+                    )
+            except (ConnectionError, NetworkError, ConnectTimeout) as _:
+                tried_host_indexes.add(host_index)
+                no_of_tries -= 1
+                continue
 
-        try:
-            current_host_domain = self.__hosts[
-                Querier.__last_tried_index
-            ].domain.get_as_string_dangerous()
-            current_host_base_path = self.__hosts[
-                Querier.__last_tried_index
-            ].base_path.get_as_string_dangerous()
-            current_host: str = current_host_domain + current_host_base_path
-            Querier.__last_tried_index += 1
-            Querier.__last_tried_index %= len(self.__hosts)
-            url = current_host + path.get_as_string_dangerous()
-
-            max_retries = 5
-
-            if retry_info_map is None:
-                retry_info_map = {}
-
-            if retry_info_map.get(url) is None:
-                retry_info_map[url] = max_retries
-
-            ProcessState.get_instance().add_state(
-                PROCESS_STATE.CALLING_SERVICE_IN_REQUEST_HELPER
-            )
-            response = await http_function(url, method)
             if ("SUPERTOKENS_ENV" in environ) and (
                 environ["SUPERTOKENS_ENV"] == "testing"
             ):
                 Querier.__hosts_alive_for_testing.add(current_host)
 
+            get_current_span().set_attribute("status", response.status_code)
             if response.status_code == RATE_LIMIT_STATUS_CODE:
-                retries_left = retry_info_map[url]
-
-                if retries_left > 0:
-                    retry_info_map[url] = retries_left - 1
-
-                    attempts_made = max_retries - retries_left
-                    delay = (10 + attempts_made * 250) / 1000
-
-                    await asyncio.sleep(delay)
-                    return await self.__send_request_helper(
-                        path, method, http_function, no_of_tries, retry_info_map
+                attempts_made = retries_by_url.get(url, 0)
+                if (
+                    attempts_made < retrier.config.max_retries
+                    and retrier.try_acquire_retry()
+                ):
+                    retries_by_url[url] = attempts_made + 1
+                    core_rate_limit_retries.inc(
+                        get_path_without_tenant_id(path.get_as_string_dangerous())
+                    )
+                    await asyncio.sleep(
+                        retrier.get_delay_sec(
+                            attempts_made, response.headers.get("retry-after")
+                        )
                     )
+                    continue
 
             if is_4xx_error(response.status_code) or is_5xx_error(response.status_code):  # type: ignore
                 raise Exception(
@@ -544,8 +993,3 @@ class Querier:
                 res["_text"] = response.text
 
             return res
-
-        except (ConnectionError, NetworkError, ConnectTimeout) as _:
-            return await self.__send_request_helper(
-                path, method, http_function, no_of_tries - 1, retry_info_map
-            )
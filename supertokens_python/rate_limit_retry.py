@@ -0,0 +1,107 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .constants import MAX_RATE_LIMIT_RETRIES
+
+
+class CoreRateLimitRetryConfig:
+    """
+    Controls how requests that the core rejects with a 429 are retried.
+
+    Each request is retried at most max_retries times. Before the nth retry, it waits for
+    a random delay between 0 and min(max_delay_ms, base_delay_ms * 2 ** n) (exponential
+    backoff with full jitter), or, if the core sent a Retry-After header, for the time it
+    asked for (capped at max_retry_after_ms) plus up to base_delay_ms of jitter.
+
+    Retries of all the requests of the process also share a token bucket that holds at
+    most retry_budget_size retries and is refilled with retry_budget_refill_per_sec retries
+    per second. Once it is empty, 429s are returned to the caller without being retried,
+    so that the retries don't add to the load of a core that is already overloaded.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RATE_LIMIT_RETRIES,
+        base_delay_ms: float = 100,
+        max_delay_ms: float = 2000,
+        max_retry_after_ms: float = 10000,
+        retry_budget_size: float = 50,
+        retry_budget_refill_per_sec: float = 10,
+    ):
+        self.max_retries = max_retries
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.max_retry_after_ms = max_retry_after_ms
+        self.retry_budget_size = retry_budget_size
+        self.retry_budget_refill_per_sec = retry_budget_refill_per_sec
+
+
+def parse_retry_after_sec(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, which is either a number of seconds or an HTTP date
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+class RateLimitRetrier:
+    def __init__(self, config: CoreRateLimitRetryConfig):
+        self.config = config
+        self.__budget = float(config.retry_budget_size)
+        self.__budget_updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+        self.retries_denied = 0
+
+    def try_acquire_retry(self) -> bool:
+        with self.__lock:
+            now = time.monotonic()
+            self.__budget = min(
+                self.__budget
+                + (now - self.__budget_updated_at)
+                * self.config.retry_budget_refill_per_sec,
+                self.config.retry_budget_size,
+            )
+            self.__budget_updated_at = now
+            if self.__budget < 1:
+                self.retries_denied += 1
+                return False
+            self.__budget -= 1
+            return True
+
+    def get_delay_sec(self, attempts_made: int, retry_after: Optional[str]) -> float:
+        retry_after_sec = parse_retry_after_sec(retry_after)
+        if retry_after_sec is not None:
+            return min(
+                retry_after_sec, self.config.max_retry_after_ms / 1000
+            ) + random.uniform(0, self.config.base_delay_ms / 1000)
+
+        max_delay_ms = min(
+            self.config.max_delay_ms, self.config.base_delay_ms * 2**attempts_made
+        )
+        return random.uniform(0, max_delay_ms / 1000)
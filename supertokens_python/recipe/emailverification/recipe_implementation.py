@@ -16,6 +16,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Awaitable, Dict, Union, Optional, Callable
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.session.claim_value_cache import (
+    invalidate_cached_claim_values,
+)
 
 from .interfaces import (
     CreateEmailVerificationTokenEmailAlreadyVerifiedError,
@@ -37,6 +40,14 @@ if TYPE_CHECKING:
     from supertokens_python.querier import Querier
 
 
+def invalidate_cached_claims(recipe_user_id: RecipeUserId):
+    from .recipe import EmailVerificationClaim
+
+    invalidate_cached_claim_values(
+        [EmailVerificationClaim.key], recipe_user_id.get_as_string()
+    )
+
+
 class RecipeImplementation(RecipeInterface):
     def __init__(
         self,
@@ -91,6 +102,7 @@ class RecipeImplementation(RecipeInterface):
         )
         if response["status"] == "OK":
             recipe_user_id = RecipeUserId(response["userId"])
+            invalidate_cached_claims(recipe_user_id)
             if attempt_account_linking:
                 updated_user = await get_user(
                     recipe_user_id.get_as_string(), user_context
@@ -152,4 +164,5 @@ class RecipeImplementation(RecipeInterface):
         await self.querier.send_post_request(
             NormalisedURLPath("/recipe/user/email/verify/remove"), data, user_context
         )
+        invalidate_cached_claims(recipe_user_id)
         return UnverifyEmailOkResult()
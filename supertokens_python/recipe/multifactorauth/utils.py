@@ -31,6 +31,7 @@ from supertokens_python.types import RecipeUserId
 import math
 import time
 from typing_extensions import Literal
+from supertokens_python.logger import is_debug_logging_enabled
 from supertokens_python.utils import log_debug_message
 
 if TYPE_CHECKING:
@@ -278,10 +279,16 @@ async def is_valid_first_factor(
 
     first_factors_from_mfa = mt_recipe.static_first_factors
 
-    log_debug_message(
-        f"is_valid_first_factor got {', '.join(tenant_config.first_factors) if tenant_config.first_factors else None} from tenant config"
-    )
-    log_debug_message(f"is_valid_first_factor got {first_factors_from_mfa} from MFA")
+    if is_debug_logging_enabled():
+        log_debug_message(
+            "is_valid_first_factor got %s from tenant config",
+            (
+                ", ".join(tenant_config.first_factors)
+                if tenant_config.first_factors
+                else None
+            ),
+        )
+    log_debug_message("is_valid_first_factor got %s from MFA", first_factors_from_mfa)
 
     configured_first_factors: Union[List[str], None] = (
         tenant_config.first_factors or first_factors_from_mfa
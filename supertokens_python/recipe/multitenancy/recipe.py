@@ -148,6 +148,10 @@ class MultitenancyRecipe(RecipeModule):
     def get_all_cors_headers(self) -> List[str]:
         return []
 
+    async def warmup(self, user_context: Dict[str, Any]) -> None:
+        # This is kept by the shared core call cache (if it is enabled)
+        await self.recipe_implementation.list_all_tenants(user_context)
+
     @staticmethod
     def init(
         get_allowed_domains_for_tenant_id: Union[
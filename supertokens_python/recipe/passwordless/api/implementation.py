@@ -97,7 +97,9 @@ async def get_passwordless_user_by_account_info(
         user_context=user_context,
     )
     log_debug_message(
-        f"get_passwordless_user_by_account_info got {len(existing_users)} from core resp {account_info}"
+        "get_passwordless_user_by_account_info got %s from core resp %s",
+        len(existing_users),
+        account_info,
     )
 
     users_with_matching_login_methods = [
@@ -23,11 +23,12 @@ if TYPE_CHECKING:
     from .utils import TokenTransferMethod
 
 from . import exceptions as ex
-from . import interfaces, utils
+from . import claim_value_cache, interfaces, utils
 from .recipe import SessionRecipe
 
 InputErrorHandlers = utils.InputErrorHandlers
 InputOverrideConfig = utils.InputOverrideConfig
+ClaimValueCacheConfig = claim_value_cache.ClaimValueCacheConfig
 SessionContainer = interfaces.SessionContainer
 exceptions = ex
 
@@ -52,6 +53,10 @@ def init(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    jwks_background_refresh: Union[bool, None] = None,
+    access_token_verification_cache_size: Union[int, None] = None,
+    claim_refetch_concurrency: Union[int, None] = None,
+    claim_value_cache: Union[ClaimValueCacheConfig, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return SessionRecipe.init(
         cookie_domain,
@@ -67,4 +72,8 @@ def init(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        jwks_background_refresh,
+        access_token_verification_cache_size,
+        claim_refetch_concurrency,
+        claim_value_cache,
     )
@@ -13,14 +13,16 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+from copy import deepcopy
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jwt
-from jwt.exceptions import DecodeError
+from jwt.exceptions import DecodeError, InvalidAlgorithmError
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.session.utils import SessionConfig
-from supertokens_python.utils import get_timestamp_ms
+from supertokens_python.utils import TTLCache, get_timestamp_ms
 
 from .exceptions import raise_try_refresh_token_exception
 from .jwt import ParsedJWTInfo
@@ -45,7 +47,99 @@ def sanitize_number(n: Any) -> Union[Union[int, float], None]:
     return None
 
 
-from supertokens_python.recipe.session.jwks import get_latest_keys
+from supertokens_python.recipe.session.jwks import (
+    VerificationKey,
+    get_keys_generation,
+    get_latest_verification_keys,
+    get_latest_verification_keys_async,
+)
+
+
+# Holds the result of verifying access tokens (keyed by the hash of the token), so that
+# verifying the same token again doesn't require checking its signature.
+# It is only used if access_token_verification_cache_size is set in the session config.
+# Entries hold the keys_generation of the keys that verified the token, and are not used
+# once the fetched keys change, so tokens of rotated or revoked keys are verified again.
+_verified_access_token_cache: Optional[TTLCache[Tuple[int, Dict[str, Any]]]] = None
+
+
+def _get_verified_access_token_cache(
+    config: SessionConfig,
+) -> Optional[TTLCache[Tuple[int, Dict[str, Any]]]]:
+    global _verified_access_token_cache
+    if config.access_token_verification_cache_size <= 0:
+        return None
+    if (
+        _verified_access_token_cache is None
+        or _verified_access_token_cache.max_size
+        != config.access_token_verification_cache_size
+    ):
+        _verified_access_token_cache = TTLCache(
+            config.access_token_verification_cache_size
+        )
+    return _verified_access_token_cache
+
+
+def _get_access_token_cache_key(jwt_info: ParsedJWTInfo) -> str:
+    return sha256(jwt_info.raw_token_string.encode()).hexdigest()
+
+
+def _copy_access_token_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    # Claims edit the payload in userData in place, so every caller needs its own copy of it
+    return {**info, "userData": deepcopy(info["userData"])}
+
+
+def _get_cached_info_from_access_token(
+    config: SessionConfig, jwt_info: ParsedJWTInfo, do_anti_csrf_check: bool
+) -> Optional[Dict[str, Any]]:
+    cache = _get_verified_access_token_cache(config)
+    if cache is None:
+        return None
+
+    key = _get_access_token_cache_key(jwt_info)
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    keys_generation, info = entry
+    if keys_generation != get_keys_generation():
+        cache.delete(key)
+        return None
+
+    # The entry expires with the token, so only the checks that depend on the call are repeated here
+    if info["antiCsrfToken"] is None and do_anti_csrf_check:
+        raise Exception("Access token does not contain the anti-csrf token")
+
+    return _copy_access_token_info(info)
+
+
+def _cache_info_from_access_token(
+    config: SessionConfig,
+    jwt_info: ParsedJWTInfo,
+    keys: List[VerificationKey],
+    info: Dict[str, Any],
+):
+    cache = _get_verified_access_token_cache(config)
+    # v2 tokens share their user data with the session, so they are not cached
+    if cache is None or jwt_info.version < 3:
+        return
+
+    cache.set(
+        _get_access_token_cache_key(jwt_info),
+        # the token was verified, so there was at least one key
+        (keys[0].keys_generation, _copy_access_token_info(info)),
+        int(info["expiryTime"]),
+    )
+
+
+def remove_access_token_from_verification_cache(jwt_info: ParsedJWTInfo):
+    if _verified_access_token_cache is not None:
+        _verified_access_token_cache.delete(_get_access_token_cache_key(jwt_info))
+
+
+# only for testing purposes
+def reset_access_token_verification_cache():
+    global _verified_access_token_cache
+    _verified_access_token_cache = None
 
 
 def get_info_from_access_token(
@@ -53,85 +147,23 @@ def get_info_from_access_token(
     jwt_info: ParsedJWTInfo,
     do_anti_csrf_check: bool,
 ):
+    """
+    Blocking version of get_info_from_access_token_async, for use outside of an event loop.
+    """
     try:
-        payload: Optional[Dict[str, Any]] = None
-        decode_algo = (
-            jwt_info.parsed_header["alg"]
-            if jwt_info.parsed_header is not None
-            else "RS256"
+        cached_info = _get_cached_info_from_access_token(
+            config, jwt_info, do_anti_csrf_check
         )
+        if cached_info is not None:
+            return cached_info
 
-        if jwt_info.version >= 3:
-            matching_keys = get_latest_keys(config, jwt_info.kid)
-            payload = jwt.decode(  # type: ignore
-                jwt_info.raw_token_string,
-                matching_keys[0].key,  # type: ignore
-                algorithms=[decode_algo],
-                options={"verify_signature": True, "verify_exp": True},
-            )
-        else:
-            # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
-            # If any of them work, we'll use that payload
-            for k in get_latest_keys(config):
-                try:
-                    payload = jwt.decode(  # type: ignore
-                        jwt_info.raw_token_string,
-                        k.key,  # type: ignore
-                        algorithms=[decode_algo],
-                        options={"verify_signature": True, "verify_exp": True},
-                    )
-                    break
-                except DecodeError:
-                    pass
-
-        if payload is None:
-            raise DecodeError("Could not decode the token")
-
-        validate_access_token_structure(payload, jwt_info.version)
-
-        if jwt_info.version == 2:
-            user_id = sanitize_string(payload.get("userId"))
-            expiry_time = sanitize_number(payload.get("expiryTime"))
-            time_created = sanitize_number(payload.get("timeCreated"))
-            user_data = payload.get("userData")
-        else:
-            user_id = sanitize_string(payload.get("sub"))
-            expiry_time = sanitize_number(payload.get("exp", 0) * 1000)
-            time_created = sanitize_number(payload.get("iat", 0) * 1000)
-            user_data = payload
-
-        session_handle = sanitize_string(payload.get("sessionHandle"))
-        recipe_user_id = sanitize_string(payload.get("rsub", user_id))
-        refresh_token_hash_1 = sanitize_string(payload.get("refreshTokenHash1"))
-        parent_refresh_token_hash_1 = sanitize_string(
-            payload.get("parentRefreshTokenHash1")
+        # v2 tokens don't have a kid, so all keys will be returned for them
+        keys = get_latest_verification_keys(config, jwt_info.kid)
+        info = _get_info_from_access_token_using_keys(
+            jwt_info, keys, do_anti_csrf_check
         )
-        anti_csrf_token = sanitize_string(payload.get("antiCsrfToken"))
-        tenant_id = DEFAULT_TENANT_ID
-
-        if jwt_info.version >= 4:
-            tenant_id = sanitize_string(payload.get("tId"))
-
-        if anti_csrf_token is None and do_anti_csrf_check:
-            raise Exception("Access token does not contain the anti-csrf token")
-
-        assert isinstance(expiry_time, (float, int))
-
-        if expiry_time < get_timestamp_ms():
-            raise Exception("Access token expired")
-
-        return {
-            "sessionHandle": session_handle,
-            "userId": user_id,
-            "refreshTokenHash1": refresh_token_hash_1,
-            "parentRefreshTokenHash1": parent_refresh_token_hash_1,
-            "userData": user_data,
-            "antiCsrfToken": anti_csrf_token,
-            "expiryTime": expiry_time,
-            "timeCreated": time_created,
-            "tenantId": tenant_id,
-            "recipeUserId": recipe_user_id,
-        }
+        _cache_info_from_access_token(config, jwt_info, keys, info)
+        return info
     except Exception as e:
         log_debug_message(
             "getInfoFromAccessToken: Returning TRY_REFRESH_TOKEN because access token validation failed - %s",
@@ -140,6 +172,115 @@ def get_info_from_access_token(
         raise_try_refresh_token_exception(e)
 
 
+async def get_info_from_access_token_async(
+    config: SessionConfig,
+    jwt_info: ParsedJWTInfo,
+    do_anti_csrf_check: bool,
+):
+    try:
+        cached_info = _get_cached_info_from_access_token(
+            config, jwt_info, do_anti_csrf_check
+        )
+        if cached_info is not None:
+            return cached_info
+
+        # v2 tokens don't have a kid, so all keys will be returned for them
+        keys = await get_latest_verification_keys_async(config, jwt_info.kid)
+        info = _get_info_from_access_token_using_keys(
+            jwt_info, keys, do_anti_csrf_check
+        )
+        _cache_info_from_access_token(config, jwt_info, keys, info)
+        return info
+    except Exception as e:
+        log_debug_message(
+            "getInfoFromAccessToken: Returning TRY_REFRESH_TOKEN because access token validation failed - %s",
+            e,
+        )
+        raise_try_refresh_token_exception(e)
+
+
+def _get_info_from_access_token_using_keys(
+    jwt_info: ParsedJWTInfo,
+    keys: List[VerificationKey],
+    do_anti_csrf_check: bool,
+) -> Dict[str, Any]:
+    payload: Optional[Dict[str, Any]] = None
+    decode_algo = (
+        jwt_info.parsed_header["alg"] if jwt_info.parsed_header is not None else "RS256"
+    )
+
+    if jwt_info.version >= 3:
+        payload = jwt.decode(  # type: ignore
+            jwt_info.raw_token_string,
+            keys[0].key,
+            algorithms=keys[0].algorithms or [decode_algo],
+            options={"verify_signature": True, "verify_exp": True},
+        )
+    else:
+        # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
+        # If any of them work, we'll use that payload
+        for k in keys:
+            try:
+                payload = jwt.decode(  # type: ignore
+                    jwt_info.raw_token_string,
+                    k.key,
+                    algorithms=k.algorithms or [decode_algo],
+                    options={"verify_signature": True, "verify_exp": True},
+                )
+                break
+            except (DecodeError, InvalidAlgorithmError):
+                pass
+
+    if payload is None:
+        raise DecodeError("Could not decode the token")
+
+    validate_access_token_structure(payload, jwt_info.version)
+
+    if jwt_info.version == 2:
+        user_id = sanitize_string(payload.get("userId"))
+        expiry_time = sanitize_number(payload.get("expiryTime"))
+        time_created = sanitize_number(payload.get("timeCreated"))
+        user_data = payload.get("userData")
+    else:
+        user_id = sanitize_string(payload.get("sub"))
+        expiry_time = sanitize_number(payload.get("exp", 0) * 1000)
+        time_created = sanitize_number(payload.get("iat", 0) * 1000)
+        user_data = payload
+
+    session_handle = sanitize_string(payload.get("sessionHandle"))
+    recipe_user_id = sanitize_string(payload.get("rsub", user_id))
+    refresh_token_hash_1 = sanitize_string(payload.get("refreshTokenHash1"))
+    parent_refresh_token_hash_1 = sanitize_string(
+        payload.get("parentRefreshTokenHash1")
+    )
+    anti_csrf_token = sanitize_string(payload.get("antiCsrfToken"))
+    tenant_id = DEFAULT_TENANT_ID
+
+    if jwt_info.version >= 4:
+        tenant_id = sanitize_string(payload.get("tId"))
+
+    if anti_csrf_token is None and do_anti_csrf_check:
+        raise Exception("Access token does not contain the anti-csrf token")
+
+    assert isinstance(expiry_time, (float, int))
+
+    if expiry_time < get_timestamp_ms():
+        raise Exception("Access token expired")
+
+    return {
+        "sessionHandle": session_handle,
+        "userId": user_id,
+        "refreshTokenHash1": refresh_token_hash_1,
+        "parentRefreshTokenHash1": parent_refresh_token_hash_1,
+        "userData": user_data,
+        "antiCsrfToken": anti_csrf_token,
+        "expiryTime": expiry_time,
+        "timeCreated": time_created,
+        "tenantId": tenant_id,
+        "recipeUserId": recipe_user_id,
+    }
+
+
 def validate_access_token_structure(payload: Dict[str, Any], version: int) -> None:
     if version >= 5:
         if (
@@ -0,0 +1,207 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+
+from supertokens_python.utils import TTLCache, get_timestamp_ms
+
+# The keys of UserRoleClaim, PermissionClaim and EmailVerificationClaim
+DEFAULT_CACHED_CLAIM_KEYS = ["st-role", "st-perm", "st-ev"]
+DEFAULT_CLAIM_VALUE_CACHE_MAX_SIZE = 10000
+
+
+class ClaimValueCacheConfig:
+    """
+    Enables a cache of the claim values fetched while validating claims, which is shared by
+    all the sessions of the process. Values are cached by claim key, tenant, user id and
+    recipe user id, so that the sessions of a user on multiple devices don't each fetch
+    the same value. Only the claims in claim_keys (DEFAULT_CACHED_CLAIM_KEYS if it is None)
+    are cached.
+
+    A cached value is used if it was fetched less than max_ttl_sec ago, and within the
+    max age of the validator that needs it. Values are invalidated when this process
+    changes the roles, permissions or email verification status of users, but not when
+    they are changed by other processes, so max_ttl_sec is how long other processes'
+    changes can go unnoticed.
+
+    A cached value is added to the payload with the time it was fetched at (as the "t" of
+    the claim, which is where the built-in claims keep it), so its age keeps counting
+    towards the max age of the validators.
+    """
+
+    def __init__(
+        self,
+        claim_keys: Optional[List[str]] = None,
+        max_ttl_sec: float = 10,
+        max_size: int = DEFAULT_CLAIM_VALUE_CACHE_MAX_SIZE,
+    ):
+        self.claim_keys = (
+            claim_keys if claim_keys is not None else DEFAULT_CACHED_CLAIM_KEYS
+        )
+        self.max_ttl_sec = max_ttl_sec
+        self.max_size = max_size
+
+
+class ClaimValueCache:
+    def __init__(self, config: ClaimValueCacheConfig):
+        self.config = config
+        self.__claim_keys = set(config.claim_keys)
+        # (generation, fetched at in ms, value)
+        self.__entries: TTLCache[Tuple[int, int, Any]] = TTLCache(config.max_size)
+        # Every invalidation gets a new generation, which is recorded for the claim keys
+        # (or claim keys and user id) it invalidated, with the time (in ms) of the invalidation. Values are only
+        # used if they were fetched after the last invalidation of their claim and users.
+        self.__generation = 0
+        self.__invalidations: Dict[str, Tuple[int, int]] = {}
+        self.__lock = threading.Lock()
+
+    def is_cached(self, claim_key: str) -> bool:
+        return claim_key in self.__claim_keys
+
+    def get_generation(self, claim_key: str, user_id: str, recipe_user_id: str) -> int:
+        """
+        Must be called before fetching a value, and the result passed to set, so that
+        the value is not cached if it was invalidated while being fetched
+        """
+        with self.__lock:
+            return self.__get_generation(claim_key, user_id, recipe_user_id)
+
+    def __get_generation(self, claim_key: str, user_id: str, recipe_user_id: str):
+        return max(
+            self.__invalidations.get(key, (0, 0))[0]
+            for key in (
+                claim_key,
+                _get_key(claim_key, user_id),
+                _get_key(claim_key, recipe_user_id),
+            )
+        )
+
+    def get(
+        self,
+        claim_key: str,
+        tenant_id: str,
+        user_id: str,
+        recipe_user_id: str,
+        max_age_in_sec: Optional[float],
+    ) -> Optional[Tuple[Any, int]]:
+        """
+        Returns a copy of the cached value, and the time (in ms) it was fetched at
+        """
+        entry = self.__entries.get(
+            _get_key(claim_key, tenant_id, user_id, recipe_user_id)
+        )
+        if entry is None:
+            return None
+        generation, fetched_at, value = entry
+        if generation < self.get_generation(claim_key, user_id, recipe_user_id):
+            return None
+        if (
+            max_age_in_sec is not None
+            and fetched_at < get_timestamp_ms() - max_age_in_sec * 1000
+        ):
+            return None
+        return deepcopy(value), fetched_at
+
+    def set(
+        self,
+        claim_key: str,
+        tenant_id: str,
+        user_id: str,
+        recipe_user_id: str,
+        generation: int,
+        fetched_at: int,
+        value: Any,
+    ):
+        with self.__lock:
+            if generation < self.__get_generation(claim_key, user_id, recipe_user_id):
+                return
+            self.__entries.set(
+                _get_key(claim_key, tenant_id, user_id, recipe_user_id),
+                (generation, fetched_at, deepcopy(value)),
+                fetched_at + int(self.config.max_ttl_sec * 1000),
+            )
+
+    def invalidate(self, claim_keys: List[str], user_id: Optional[str] = None):
+        """
+        Invalidates the values of the claims for the user (which can be a recipe user
+        id), or for all users if user_id is None
+        """
+        now = get_timestamp_ms()
+        with self.__lock:
+            self.__generation += 1
+            for claim_key in claim_keys:
+                key = claim_key if user_id is None else _get_key(claim_key, user_id)
+                self.__invalidations[key] = (self.__generation, now)
+
+            # Values cached before an invalidation expire max_ttl_sec after it at the
+            # latest (since set doesn't cache values fetched before it), so it can be
+            # forgotten after that
+            if len(self.__invalidations) > self.config.max_size:
+                expired_at = now - int(self.config.max_ttl_sec * 1000)
+                self.__invalidations = {
+                    key: invalidation
+                    for key, invalidation in self.__invalidations.items()
+                    if invalidation[1] >= expired_at
+                }
+
+    def clear(self):
+        self.__entries.clear()
+
+
+def _get_key(*parts: str) -> str:
+    return "\x00".join(parts)
+
+
+def set_fetched_at_in_payload(payload: Dict[str, Any], claim_key: str, fetched_at: int):
+    """
+    Replaces the time at which the claim was added to the payload with the time its cached
+    value was fetched at, for claims that save it like the built-in claims
+    """
+    claim_payload = payload.get(claim_key)
+    if isinstance(claim_payload, dict) and "t" in claim_payload:
+        claim_payload["t"] = fetched_at
+
+
+# It is only used if claim_value_cache is set in the session config.
+_claim_value_cache: Optional[ClaimValueCache] = None
+
+
+def get_claim_value_cache(
+    config: Optional[ClaimValueCacheConfig],
+) -> Optional[ClaimValueCache]:
+    global _claim_value_cache
+    if config is None:
+        return None
+    if _claim_value_cache is None or _claim_value_cache.config is not config:
+        _claim_value_cache = ClaimValueCache(config)
+    return _claim_value_cache
+
+
+def invalidate_cached_claim_values(
+    claim_keys: List[str], user_id: Optional[str] = None
+):
+    """
+    Called when this process changes the data that the claims are fetched from. If user_id
+    is None, the values of all users are invalidated.
+    """
+    if _claim_value_cache is not None:
+        _claim_value_cache.invalidate(claim_keys, user_id)
+
+
+def reset_claim_value_cache():
+    global _claim_value_cache
+    _claim_value_cache = None
@@ -18,6 +18,9 @@ from typing import Any, Callable, Coroutine, Dict, Union, List, Optional
 from supertokens_python import Supertokens
 from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
 from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.framework.fastapi.fastapi_scope_request import (
+    FastApiScopeRequest,
+)
 from supertokens_python.recipe.session import SessionRecipe
 from supertokens_python.exceptions import SuperTokensError
 from supertokens_python.types import MaybeAwaitable
@@ -30,6 +33,8 @@ from supertokens_python.utils import (
 )
 
 from fastapi import Request
+from starlette.requests import HTTPConnection
+from starlette.types import Receive, Scope
 
 
 def verify_session(
@@ -73,6 +78,77 @@ def verify_session(
     return func
 
 
+async def verify_session_in_scope(
+    scope: Scope,
+    receive: Optional[Receive] = None,
+    anti_csrf_check: Union[bool, None] = None,
+    session_required: bool = True,
+    check_database: bool = False,
+    override_global_claim_validators: Optional[
+        Callable[
+            [List[SessionClaimValidator], SessionContainer, Dict[str, Any]],
+            MaybeAwaitable[List[SessionClaimValidator]],
+        ]
+    ] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> Union[SessionContainer, None]:
+    """Verifies the session of an ASGI request (reading its headers from the scope) and stores
+    it in `scope["state"]["supertokens"]` (which is `request.state.supertokens`)
+
+    It can be called from pure ASGI middlewares, see `verify_session_from_scope` for routes
+    """
+    base_req = FastApiScopeRequest(scope, receive)
+    user_context = set_request_in_user_context_if_not_defined(user_context, base_req)
+
+    recipe = SessionRecipe.get_instance()
+    session = await recipe.verify_session(
+        base_req,
+        anti_csrf_check,
+        session_required,
+        check_database,
+        override_global_claim_validators,
+        user_context,
+    )
+    if session is None:
+        if session_required:
+            raise Exception("Should never come here")
+        base_req.set_session_as_none()
+    else:
+        base_req.set_session(session)
+    return session
+
+
+def verify_session_from_scope(
+    anti_csrf_check: Union[bool, None] = None,
+    session_required: bool = True,
+    check_database: bool = False,
+    override_global_claim_validators: Optional[
+        Callable[
+            [List[SessionClaimValidator], SessionContainer, Dict[str, Any]],
+            MaybeAwaitable[List[SessionClaimValidator]],
+        ]
+    ] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> Callable[..., Coroutine[Any, Any, Union[SessionContainer, None]]]:
+    """Same as `verify_session`, but the request's headers and cookies are read from its ASGI
+    scope instead of the FastAPI request (see `verify_session_in_scope`)
+    """
+
+    # Only the scope of the connection is used, so this doesn't depend on a Request
+    async def func(connection: HTTPConnection) -> Union[SessionContainer, None]:
+        return await verify_session_in_scope(
+            connection.scope,
+            connection.receive if isinstance(connection, Request) else None,
+            anti_csrf_check,
+            session_required,
+            check_database,
+            override_global_claim_validators,
+            user_context,
+        )
+
+    return func
+
+
 async def session_exception_handler(
     request: Request, exc: SuperTokensError
 ) -> JSONResponse:
@@ -12,9 +12,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+import threading
+import time
 import requests
 from os import environ
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from typing_extensions import TypedDict
 
 from jwt import PyJWK, PyJWKSet
@@ -23,6 +26,8 @@ from supertokens_python.recipe.session.utils import SessionConfig
 from supertokens_python.utils import RWMutex, RWLockContext, get_timestamp_ms
 from supertokens_python.querier import Querier
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import jwks_refresh_duration, jwks_refreshes
+from supertokens_python.tracing import trace
 
 
 class JWKSConfigType(TypedDict):
@@ -33,10 +38,47 @@ JWKSConfig: JWKSConfigType = {
     "request_timeout": 10000,  # 10s
 }
 
+# The background refresher replaces the keys once this fraction of the refresh interval has passed,
+# so that requests never have to wait for the keys to be fetched.
+JWKS_BACKGROUND_REFRESH_AT = 0.8
+# If the background refresher fails to refresh the keys (for example, if the core is down), the
+# stale keys are still served until they are this many refresh intervals old.
+JWKS_MAX_STALENESS_INTERVALS = 2
+JWKS_BACKGROUND_REFRESH_RETRY_DELAY_SEC = 10
+
+
+class VerificationKey:
+    """
+    A key from the JWKS, prepared once when the keys are fetched, so that verifying a token
+    doesn't need to find or prepare the key again.
+    """
+
+    def __init__(self, jwk: PyJWK, keys_generation: int = 0):
+        self.jwk = jwk
+        # the keys_generation of the keys this key was fetched with
+        self.keys_generation = keys_generation
+        self.key_id: Optional[str] = jwk.key_id  # type: ignore
+        self.key: Any = jwk.key  # type: ignore
+        # Older versions of PyJWT don't expose the algorithm of the key, in which case the
+        # algorithm from the token header is used.
+        algorithm: Optional[str] = getattr(jwk, "algorithm_name", None)
+        self.algorithms: Optional[List[str]] = (
+            [algorithm] if algorithm is not None else None
+        )
+
 
 class CachedKeys:
-    def __init__(self, keys: List[PyJWK], refresh_interval_sec: int):
+    def __init__(
+        self, keys: List[PyJWK], refresh_interval_sec: int, keys_generation: int = 0
+    ):
         self.keys = keys
+        self.verification_keys = [VerificationKey(key, keys_generation) for key in keys]
+        self.verification_keys_by_kid: Dict[str, List[VerificationKey]] = {}
+        for verification_key in self.verification_keys:
+            if verification_key.key_id is not None:
+                self.verification_keys_by_kid.setdefault(
+                    verification_key.key_id, []
+                ).append(verification_key)
         self.last_refresh_time = get_timestamp_ms()
         self.refresh_interval_sec = refresh_interval_sec
 
@@ -46,9 +88,23 @@ class CachedKeys:
             < self.refresh_interval_sec * 1000
         )
 
+    def can_be_served_stale(self):
+        return (
+            get_timestamp_ms() - self.last_refresh_time
+            < self.refresh_interval_sec * 1000 * JWKS_MAX_STALENESS_INTERVALS
+        )
+
 
 cached_keys: Optional[CachedKeys] = None
 mutex = RWMutex()
+# Incremented when the fetched keys are not the same as the cached ones (i.e. a key was
+# added, or rotated or revoked keys were removed), so that results derived from the
+# previous keys (like verified access tokens) can be dropped.
+keys_generation = 0
+
+
+def get_keys_generation() -> int:
+    return keys_generation
 
 
 # only for testing purposes
@@ -58,7 +114,7 @@ def reset_jwks_cache():
         cached_keys = None
 
 
-def get_cached_keys() -> Optional[List[PyJWK]]:
+def _get_usable_cached_keys() -> Optional[CachedKeys]:
     if cached_keys is not None:
         # This means that we have valid JWKs for the given core path
         # We check if we need to refresh before returning
@@ -68,58 +124,195 @@ def get_cached_keys() -> Optional[List[PyJWK]]:
         # if it has a valid cache entry from one of the core URLs. It will only attempt to fetch
         # from the cores again after the entry in the cache is expired
         if cached_keys.is_fresh():
-            return cached_keys.keys
+            return cached_keys
+
+        # The background refresher is replacing the keys, so until it does, we can keep using
+        # the stale ones instead of fetching them in the request. If the token uses a kid that
+        # is not in these keys, get_latest_keys will still fetch them.
+        if is_jwks_background_refresh_running() and cached_keys.can_be_served_stale():
+            return cached_keys
 
     return None
 
 
+def get_cached_keys() -> Optional[List[PyJWK]]:
+    keys = _get_usable_cached_keys()
+    return keys.keys if keys is not None else None
+
+
 def find_matching_keys(
-    keys: Optional[List[PyJWK]], kid: Optional[str]
-) -> Optional[List[PyJWK]]:
-    if kid is None or keys is None:
+    keys: Optional[CachedKeys], kid: Optional[str]
+) -> Optional[List[VerificationKey]]:
+    if keys is None:
+        return None
+
+    if kid is None:
         # return all keys since the token does not have a kid
-        return keys
+        return keys.verification_keys
+
+    return keys.verification_keys_by_kid.get(kid)
+
+
+def _get_jwks_urls() -> List[str]:
+    core_paths = Querier.get_instance().get_all_core_urls_for_path(
+        "./.well-known/jwks.json"
+    )
+
+    if len(core_paths) == 0:
+        raise Exception(
+            "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
+        )
 
-    # kid has been provided so filter the keys
-    matching_keys = [key for key in keys if key.key_id == kid]  # type: ignore
-    if len(matching_keys) > 0:
+    return core_paths
+
+
+def _get_key_ids(keys: List[PyJWK]) -> List[str]:
+    # the core gives every key it creates a new kid
+    return sorted(str(key.key_id) for key in keys)  # type: ignore
+
+
+def _set_cached_keys(config: SessionConfig, jwks: List[PyJWK]):
+    global cached_keys, keys_generation
+    if cached_keys is None or _get_key_ids(cached_keys.keys) != _get_key_ids(jwks):
+        keys_generation += 1
+    cached_keys = CachedKeys(jwks, config.jwks_refresh_interval_sec, keys_generation)
+
+
+def _update_cache_and_find_matching_keys(
+    config: SessionConfig, jwks: List[PyJWK], kid: Optional[str]
+) -> List[VerificationKey]:
+    _set_cached_keys(config, jwks)
+    log_debug_message("Returning JWKS from fetch")
+    matching_keys = find_matching_keys(_get_usable_cached_keys(), kid)
+    if matching_keys is not None:
         return matching_keys
 
-    return None
+    raise Exception("No matching JWKS found")
 
 
 def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[PyJWK]:
-    global cached_keys
+    """
+    Blocking version of get_latest_keys_async. This must not be used from inside
+    an event loop (async code should use get_latest_keys_async instead).
+    """
+    return [key.jwk for key in get_latest_verification_keys(config, kid)]
+
+
+async def get_latest_keys_async(
+    config: SessionConfig, kid: Optional[str] = None
+) -> List[PyJWK]:
+    return [key.jwk for key in await get_latest_verification_keys_async(config, kid)]
 
+
+def get_latest_verification_keys(
+    config: SessionConfig, kid: Optional[str] = None
+) -> List[VerificationKey]:
     if environ.get("SUPERTOKENS_ENV") == "testing":
         log_debug_message("Called find_jwk_client")
 
     with RWLockContext(mutex, read=True):
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
+        matching_keys = find_matching_keys(_get_usable_cached_keys(), kid)
         if matching_keys is not None:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Returning JWKS from cache")
             return matching_keys
         # otherwise unknown kid, will continue to reload the keys
 
-    core_paths = Querier.get_instance().get_all_core_urls_for_path(
-        "./.well-known/jwks.json"
-    )
+    core_paths = _get_jwks_urls()
+
+    with RWLockContext(mutex, read=False):
+        # check again if the keys are in cache
+        # because another thread might have fetched the keys while this one was waiting for the lock
+        matching_keys = find_matching_keys(_get_usable_cached_keys(), kid)
+        if matching_keys is not None:
+            return matching_keys
+
+        jwks = _fetch_jwks_from_core(core_paths)
+        return _update_cache_and_find_matching_keys(config, jwks, kid)
 
-    if len(core_paths) == 0:
-        raise Exception(
-            "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
-        )
 
+def _fetch_jwks_from_core(core_paths: List[str]) -> List[PyJWK]:
+    start = time.perf_counter()
+    try:
+        jwks = _fetch_jwks_from_core_paths(core_paths)
+    except Exception:
+        jwks_refreshes.inc("failure")
+        raise
+    jwks_refreshes.inc("success")
+    jwks_refresh_duration.observe(time.perf_counter() - start)
+    return jwks
+
+
+def _fetch_jwks_from_core_paths(core_paths: List[str]) -> List[PyJWK]:
     last_error: Exception = Exception("No valid JWKS found")
 
-    with RWLockContext(mutex, read=False):
+    for path in core_paths:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+        try:
+            log_debug_message("Fetching jwk set from the configured uri")
+            with trace("supertokens.jwks_fetch", {"url": path}) as span:
+                with requests.get(
+                    path, timeout=JWKSConfig["request_timeout"] / 1000
+                ) as response:  # 5 second timeout
+                    span.set_attribute("status", response.status_code)
+                    response.raise_for_status()
+                    # we found a valid JWKS
+                    return PyJWKSet.from_dict(response.json()).keys  # type: ignore
+        except Exception as e:
+            last_error = e
+
+    raise last_error
+
+
+# asyncio locks can only be used from the event loop they were created on, so
+# the async path keeps one lock per event loop.
+_async_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+def _get_async_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _async_locks.get(loop)
+    if lock is None:
+        stale_loops = [
+            other_loop for other_loop in _async_locks if other_loop.is_closed()
+        ]
+        for stale_loop in stale_loops:
+            del _async_locks[stale_loop]
+        lock = asyncio.Lock()
+        _async_locks[loop] = lock
+    return lock
+
+
+async def get_latest_verification_keys_async(
+    config: SessionConfig, kid: Optional[str] = None
+) -> List[VerificationKey]:
+    if environ.get("SUPERTOKENS_ENV") == "testing":
+        log_debug_message("Called find_jwk_client")
+
+    matching_keys = find_matching_keys(_get_usable_cached_keys(), kid)
+    if matching_keys is not None:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Returning JWKS from cache")
+        return matching_keys
+    # otherwise unknown kid, will continue to reload the keys
+
+    core_paths = _get_jwks_urls()
+
+    last_error: Exception = Exception("No valid JWKS found")
+
+    # Only one coroutine (per event loop) fetches the keys, the others wait for it
+    # and then use the updated cache.
+    async with _get_async_lock():
         # check again if the keys are in cache
-        # because another thread might have fetched the keys while this one was waiting for the lock
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
+        # because another coroutine might have fetched the keys while this one was waiting for the lock
+        matching_keys = find_matching_keys(_get_usable_cached_keys(), kid)
         if matching_keys is not None:
             return matching_keys
 
+        querier = Querier.get_instance()
+        start = time.perf_counter()
         for path in core_paths:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Attempting to fetch JWKS from path: %s", path)
@@ -127,21 +320,95 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
             cached_jwks: Optional[List[PyJWK]] = None
             try:
                 log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
-                    path, timeout=JWKSConfig["request_timeout"] / 1000
-                ) as response:  # 5 second timeout
+                with trace("supertokens.jwks_fetch", {"url": path}) as span:
+                    response = await querier.api_request(
+                        path, "GET", 2, timeout=JWKSConfig["request_timeout"] / 1000
+                    )
+                    span.set_attribute("status", response.status_code)
                     response.raise_for_status()
                     cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
             except Exception as e:
                 last_error = e
 
             if cached_jwks is not None:  # we found a valid JWKS
-                cached_keys = CachedKeys(cached_jwks, config.jwks_refresh_interval_sec)
-                log_debug_message("Returning JWKS from fetch")
-                matching_keys = find_matching_keys(get_cached_keys(), kid)
-                if matching_keys is not None:
-                    return matching_keys
+                jwks_refreshes.inc("success")
+                jwks_refresh_duration.observe(time.perf_counter() - start)
+                return _update_cache_and_find_matching_keys(config, cached_jwks, kid)
 
-                raise Exception("No matching JWKS found")
+        jwks_refreshes.inc("failure")
 
     raise last_error
+
+
+class JWKSBackgroundRefresher:
+    """
+    Refreshes the cached keys in a daemon thread, ahead of their expiry. This way the keys are
+    only fetched while handling a request if a token uses a kid that is not in the cached keys.
+    """
+
+    def __init__(self, config: SessionConfig):
+        self.config = config
+        self.__stop_event = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__run, name="supertokens-jwks-refresh", daemon=True
+        )
+
+    def start(self):
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop_event.set()
+
+    def is_running(self) -> bool:
+        # threads do not survive a fork, so this is False in workers forked after init
+        return self.__thread.is_alive() and not self.__stop_event.is_set()
+
+    def __get_delay_until_next_refresh_sec(self) -> float:
+        keys = cached_keys
+        if keys is None:
+            return 0
+        refresh_at = (
+            keys.last_refresh_time
+            + keys.refresh_interval_sec * 1000 * JWKS_BACKGROUND_REFRESH_AT
+        )
+        return max(0, (refresh_at - get_timestamp_ms()) / 1000)
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            delay = self.__get_delay_until_next_refresh_sec()
+            if delay > 0:
+                self.__stop_event.wait(delay)
+                continue
+
+            try:
+                # The keys are fetched without holding the lock, so requests keep using the
+                # current keys while the refresh is in flight.
+                jwks = _fetch_jwks_from_core(_get_jwks_urls())
+                with RWLockContext(mutex, read=False):
+                    _set_cached_keys(self.config, jwks)
+                log_debug_message("JWKS refreshed in the background")
+            except Exception as e:
+                log_debug_message("Refreshing JWKS in the background failed: %s", e)
+                self.__stop_event.wait(JWKS_BACKGROUND_REFRESH_RETRY_DELAY_SEC)
+
+
+background_refresher: Optional[JWKSBackgroundRefresher] = None
+
+
+def start_jwks_background_refresh(config: SessionConfig):
+    global background_refresher
+    if background_refresher is not None and background_refresher.is_running():
+        return
+    background_refresher = JWKSBackgroundRefresher(config)
+    background_refresher.start()
+
+
+def stop_jwks_background_refresh():
+    global background_refresher
+    if background_refresher is not None:
+        background_refresher.stop()
+        background_refresher = None
+
+
+def is_jwks_background_refresh_running() -> bool:
+    return background_refresher is not None and background_refresher.is_running()
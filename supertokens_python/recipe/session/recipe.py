@@ -38,6 +38,7 @@ if TYPE_CHECKING:
 from supertokens_python.exceptions import SuperTokensError, raise_general_exception
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.post_init_callbacks import PostSTInitCallbacks
 from supertokens_python.querier import Querier
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 
@@ -61,6 +62,13 @@ from .utils import (
     validate_and_normalise_user_input,
 )
 from .cookie_and_header import clear_session_from_all_token_transfer_methods
+from .jwks import (
+    get_latest_keys_async,
+    start_jwks_background_refresh,
+    stop_jwks_background_refresh,
+)
+from .access_token import reset_access_token_verification_cache
+from .claim_value_cache import ClaimValueCacheConfig, reset_claim_value_cache
 
 
 class SessionRecipe(RecipeModule):
@@ -92,6 +100,10 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        jwks_background_refresh: Union[bool, None] = None,
+        access_token_verification_cache_size: Union[int, None] = None,
+        claim_refetch_concurrency: Union[int, None] = None,
+        claim_value_cache: Union[ClaimValueCacheConfig, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -109,6 +121,10 @@ class SessionRecipe(RecipeModule):
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
             jwks_refresh_interval_sec,
+            jwks_background_refresh,
+            access_token_verification_cache_size,
+            claim_refetch_concurrency,
+            claim_value_cache,
         )
         log_debug_message(
             "session init: anti_csrf: %s", self.config.anti_csrf_function_or_string
@@ -159,6 +175,14 @@ class SessionRecipe(RecipeModule):
         self.claims_added_by_other_recipes: List[SessionClaim[Any]] = []
         self.claim_validators_added_by_other_recipes: List[SessionClaimValidator] = []
 
+        if self.config.jwks_background_refresh:
+            config = self.config
+
+            def callback():
+                start_jwks_background_refresh(config)
+
+            PostSTInitCallbacks.add_post_init_callback(callback)
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and (
             isinstance(err, SuperTokensSessionError)
@@ -294,6 +318,10 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        jwks_background_refresh: Union[bool, None] = None,
+        access_token_verification_cache_size: Union[int, None] = None,
+        claim_refetch_concurrency: Union[int, None] = None,
+        claim_value_cache: Union[ClaimValueCacheConfig, None] = None,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -313,6 +341,10 @@ class SessionRecipe(RecipeModule):
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
                     jwks_refresh_interval_sec,
+                    jwks_background_refresh,
+                    access_token_verification_cache_size,
+                    claim_refetch_concurrency,
+                    claim_value_cache,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
@@ -335,8 +367,17 @@ class SessionRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        stop_jwks_background_refresh()
+        reset_access_token_verification_cache()
+        reset_claim_value_cache()
         SessionRecipe.__instance = None
 
+    async def shutdown(self) -> None:
+        stop_jwks_background_refresh()
+
+    async def warmup(self, user_context: Dict[str, Any]) -> None:
+        await get_latest_keys_async(self.config)
+
     def add_claim_from_other_recipe(self, claim: SessionClaim[Any]):
         # We are throwing here (and not in addClaimValidatorFromOtherRecipe) because if multiple
         # claims are added with the same key they will overwrite each other. Validators will all run
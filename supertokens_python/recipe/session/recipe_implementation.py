@@ -13,16 +13,20 @@
 # under the License.
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import asyncio
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
-from supertokens_python.utils import resolve
+from supertokens_python.metrics import claim_refetches
+from supertokens_python.tracing import trace
+from supertokens_python.utils import get_timestamp_ms, resolve
 
 from ...types import MaybeAwaitable, RecipeUserId
 from . import session_functions
 from .access_token import validate_access_token_structure
+from .claim_value_cache import get_claim_value_cache, set_fetched_at_in_payload
 from .cookie_and_header import build_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
@@ -114,39 +118,119 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         user_context: Dict[str, Any],
     ) -> ClaimsValidationResult:
         access_token_payload_update = None
-        original_access_token_payload = json.dumps(access_token_payload)
-
+        # Set when adding a refetched value changes the payload of its claim. Only the
+        # payload of that claim is compared, rather than the serialised payloads.
+        payload_modified = False
+
+        # The claims are refetched concurrently, but the payload is updated in the order of
+        # the validators, so the result doesn't depend on which fetch finishes first. A
+        # claim that is checked by more than one validator is only fetched once.
+        claims_to_refetch: List[Tuple[SessionClaim[Any], SessionClaimValidator]] = []
+        claim_keys_to_refetch: Set[str] = set()
         for validator in claim_validators:
             log_debug_message(
                 "update_claims_in_payload_if_needed checking should_refetch for %s",
                 validator.id,
             )
-            if validator.claim is not None and validator.should_refetch(
-                access_token_payload, user_context
+            if (
+                validator.claim is not None
+                and validator.claim.key not in claim_keys_to_refetch
+                and validator.should_refetch(access_token_payload, user_context)
             ):
-                log_debug_message(
-                    "update_claims_in_payload_if_needed refetching for %s", validator.id
+                claims_to_refetch.append((validator.claim, validator))
+                claim_keys_to_refetch.add(validator.claim.key)
+
+        if len(claims_to_refetch) > 0:
+            semaphore = asyncio.Semaphore(self.config.claim_refetch_concurrency)
+            tenant_id = access_token_payload.get("tId", DEFAULT_TENANT_ID)
+            cache = get_claim_value_cache(self.config.claim_value_cache)
+
+            # Returns the value, and the time it was fetched at if it is a cached value
+            async def refetch(
+                claim: SessionClaim[Any], validator: SessionClaimValidator
+            ) -> Tuple[Any, Optional[int]]:
+                if cache is None or not cache.is_cached(claim.key):
+                    return await fetch(claim, validator.id), None
+
+                # the value isn't used if it's older than the max age of the validator
+                max_age_in_sec: Optional[float] = getattr(
+                    validator, "max_age_in_sec", None
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        recipe_user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        access_token_payload,
-                        user_context,
-                    )
+                cached = cache.get(
+                    claim.key,
+                    tenant_id,
+                    user_id,
+                    recipe_user_id.get_as_string(),
+                    max_age_in_sec,
                 )
-                log_debug_message(
-                    "update_claims_in_payload_if_needed %s refetch result %s",
-                    validator.id,
-                    value,
+                if cached is not None:
+                    log_debug_message(
+                        "update_claims_in_payload_if_needed using the cached value for %s",
+                        validator.id,
+                    )
+                    return cached
+
+                generation = cache.get_generation(
+                    claim.key, user_id, recipe_user_id.get_as_string()
                 )
+                fetched_at = get_timestamp_ms()
+                value = await fetch(claim, validator.id)
                 if value is not None:
-                    access_token_payload = validator.claim.add_to_payload_(
-                        access_token_payload, value, user_context
+                    cache.set(
+                        claim.key,
+                        tenant_id,
+                        user_id,
+                        recipe_user_id.get_as_string(),
+                        generation,
+                        fetched_at,
+                        value,
                     )
+                return value, None
 
-        if json.dumps(access_token_payload) != original_access_token_payload:
+            async def fetch(claim: SessionClaim[Any], validator_id: str) -> Any:
+                async with semaphore:
+                    log_debug_message(
+                        "update_claims_in_payload_if_needed refetching for %s",
+                        validator_id,
+                    )
+                    claim_refetches.inc(claim.key)
+                    with trace("supertokens.claim_refetch", {"claim": claim.key}):
+                        value = await resolve(
+                            claim.fetch_value(
+                                user_id,
+                                recipe_user_id,
+                                tenant_id,
+                                access_token_payload,
+                                user_context,
+                            )
+                        )
+                    log_debug_message(
+                        "update_claims_in_payload_if_needed %s refetch result %s",
+                        validator_id,
+                        value,
+                    )
+                    return value
+
+            values = await asyncio.gather(
+                *[refetch(claim, validator) for claim, validator in claims_to_refetch]
+            )
+            for (claim, _), (value, fetched_at) in zip(claims_to_refetch, values):
+                if value is not None:
+                    # copied, since claims may change their payload in place
+                    previous_claim_payload = deepcopy(
+                        access_token_payload.get(claim.key)
+                    )
+                    access_token_payload = claim.add_to_payload_(
+                        access_token_payload, value, user_context
+                    )
+                    if fetched_at is not None:
+                        set_fetched_at_in_payload(
+                            access_token_payload, claim.key, fetched_at
+                        )
+                    if access_token_payload.get(claim.key) != previous_claim_payload:
+                        payload_modified = True
+
+        if payload_modified:
             access_token_payload_update = access_token_payload
 
         invalid_claims = await validate_claims_in_payload(
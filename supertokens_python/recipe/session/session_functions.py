@@ -19,13 +19,17 @@ from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
 from supertokens_python.recipe.session.interfaces import SessionInformationResult
 from supertokens_python.types import RecipeUserId
 
-from .access_token import get_info_from_access_token
+from .access_token import (
+    get_info_from_access_token_async,
+    remove_access_token_from_verification_cache,
+)
 from .jwt import ParsedJWTInfo
 
 if TYPE_CHECKING:
     from .recipe_implementation import RecipeImplementation
 
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import session_verifications
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.process_state import PROCESS_STATE, ProcessState
 from supertokens_python.recipe.session.interfaces import TokenInfo
@@ -169,7 +173,7 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
+        access_token_info = await get_info_from_access_token_async(
             config,
             parsed_access_token,
             config.anti_csrf_function_or_string == "VIA_TOKEN" and do_anti_csrf_check,
@@ -272,6 +276,7 @@ async def get_session(
         and not always_check_core
         and access_token_info["parentRefreshTokenHash1"] is None
     ):
+        session_verifications.inc("local")
         return GetSessionAPIResponse(
             GetSessionAPIResponseSession(
                 access_token_info["sessionHandle"],
@@ -284,6 +289,7 @@ async def get_session(
         )
 
     ProcessState.get_instance().add_state(PROCESS_STATE.CALLING_SERVICE_IN_VERIFY)
+    session_verifications.inc("core")
 
     data = {
         "accessToken": parsed_access_token.raw_token_string,
@@ -334,6 +340,7 @@ async def get_session(
         )
     if response["status"] == "UNAUTHORISED":
         log_debug_message("getSession: Returning UNAUTHORISED because of core response")
+        remove_access_token_from_verification_cache(parsed_access_token)
         raise_unauthorised_exception(response["message"])
 
     log_debug_message(
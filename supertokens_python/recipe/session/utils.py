@@ -31,6 +31,7 @@ from supertokens_python.utils import (
 )
 
 from ...types import MaybeAwaitable, RecipeUserId
+from .claim_value_cache import ClaimValueCacheConfig
 from .constants import AUTH_MODE_HEADER_KEY, SESSION_REFRESH
 from .exceptions import ClaimValidationError
 
@@ -49,7 +50,7 @@ if TYPE_CHECKING:
     )
     from .recipe import SessionRecipe
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import LazyLogArg, log_debug_message
 
 
 def normalise_session_scope(session_scope: str) -> str:
@@ -391,6 +392,10 @@ class SessionConfig:
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
         jwks_refresh_interval_sec: int,
+        jwks_background_refresh: bool,
+        access_token_verification_cache_size: int,
+        claim_refetch_concurrency: int,
+        claim_value_cache: Optional[ClaimValueCacheConfig],
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -411,6 +416,10 @@ class SessionConfig:
         self.framework = framework
         self.mode = mode
         self.jwks_refresh_interval_sec = jwks_refresh_interval_sec
+        self.jwks_background_refresh = jwks_background_refresh
+        self.access_token_verification_cache_size = access_token_verification_cache_size
+        self.claim_refetch_concurrency = claim_refetch_concurrency
+        self.claim_value_cache = claim_value_cache
 
 
 def validate_and_normalise_user_input(
@@ -434,6 +443,10 @@ def validate_and_normalise_user_input(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    jwks_background_refresh: Union[bool, None] = None,
+    access_token_verification_cache_size: Union[int, None] = None,
+    claim_refetch_concurrency: Union[int, None] = None,
+    claim_value_cache: Union[ClaimValueCacheConfig, None] = None,
 ):
     _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
@@ -544,6 +557,17 @@ def validate_and_normalise_user_input(
     if jwks_refresh_interval_sec is None:
         jwks_refresh_interval_sec = 4 * 3600  # 4 hours
 
+    if jwks_background_refresh is None:
+        jwks_background_refresh = False
+
+    if access_token_verification_cache_size is None:
+        access_token_verification_cache_size = 0
+
+    if claim_refetch_concurrency is None:
+        claim_refetch_concurrency = 4
+    elif claim_refetch_concurrency < 1:
+        raise ValueError("claim_refetch_concurrency must be at least 1")
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -561,6 +585,10 @@ def validate_and_normalise_user_input(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        jwks_background_refresh,
+        access_token_verification_cache_size,
+        claim_refetch_concurrency,
+        claim_value_cache,
     )
 
 
@@ -612,7 +640,7 @@ async def validate_claims_in_payload(
         log_debug_message(
             "validate_claims_in_payload %s validate res %s",
             validator.id,
-            json.dumps(claim_validation_res.__dict__),
+            LazyLogArg(json.dumps, claim_validation_res.__dict__),
         )
         if not claim_validation_res.is_valid:
             validation_errors.append(
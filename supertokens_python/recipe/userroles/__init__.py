@@ -17,10 +17,11 @@ from typing import TYPE_CHECKING, Callable, Union, Optional
 
 from . import utils
 from .recipe import UserRolesRecipe
-from . import recipe
+from . import recipe, snapshot
 
 PermissionClaim = recipe.PermissionClaim
 UserRoleClaim = recipe.UserRoleClaim
+LocalRoleSnapshotConfig = snapshot.LocalRoleSnapshotConfig
 
 if TYPE_CHECKING:
     from supertokens_python.supertokens import AppInfo
@@ -32,9 +33,13 @@ def init(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[utils.InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Optional[float] = None,
+    local_role_snapshot: Optional[snapshot.LocalRoleSnapshotConfig] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return UserRolesRecipe.init(
         skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token,
         override,
+        role_permissions_cache_ttl_sec,
+        local_role_snapshot,
     )
@@ -14,9 +14,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from os import environ
 from typing import Any, Dict, List, Optional, Set, Union
 
+from supertokens_python.core_call_cache import (
+    DEFAULT_CORE_CALL_CACHE_POLICIES,
+    CoreCallCachePolicy,
+)
 from supertokens_python.exceptions import SuperTokensError, raise_general_exception
 from supertokens_python.framework import BaseRequest, BaseResponse
 from supertokens_python.normalised_url_path import NormalisedURLPath
@@ -35,8 +40,11 @@ from ..session import SessionRecipe
 from ..session.claim_base_classes.primitive_array_claim import PrimitiveArrayClaim
 from .exceptions import SuperTokensUserRolesError
 from .interfaces import GetPermissionsForRoleOkResult, UnknownRoleError
+from .snapshot import LocalRoleSnapshotConfig
 from .utils import InputOverrideConfig
 
+MAX_CONCURRENT_PERMISSION_FETCHES = 10
+
 
 class UserRolesRecipe(RecipeModule):
     recipe_id = "userroles"
@@ -49,6 +57,8 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Optional[float] = None,
+        local_role_snapshot: Optional[LocalRoleSnapshotConfig] = None,
     ):
         from ..oauth2provider.recipe import OAuth2ProviderRecipe
 
@@ -59,8 +69,23 @@ class UserRolesRecipe(RecipeModule):
             skip_adding_roles_to_access_token,
             skip_adding_permissions_to_access_token,
             override,
+            role_permissions_cache_ttl_sec,
+            local_role_snapshot,
+        )
+        if self.config.role_permissions_cache_ttl_sec > 0:
+            path = "/recipe/role/permissions"
+            Querier.set_core_call_cache_policy(
+                path,
+                CoreCallCachePolicy(
+                    self.config.role_permissions_cache_ttl_sec,
+                    DEFAULT_CORE_CALL_CACHE_POLICIES[path].invalidated_by,
+                ),
+            )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id),
+            self.config.local_role_snapshot,
         )
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
+        self.local_role_snapshot = recipe_implementation.local_role_snapshot
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -105,22 +130,9 @@ class UserRolesRecipe(RecipeModule):
                     payload["roles"] = user_roles
 
                 if "permissions" in scopes:
-                    user_permissions: Set[str] = set()
-                    for role in user_roles:
-                        role_permissions = (
-                            await self.recipe_implementation.get_permissions_for_role(
-                                role=role,
-                                user_context=user_context,
-                            )
-                        )
-
-                        if isinstance(role_permissions, UnknownRoleError):
-                            raise Exception("Failed to fetch permissions for the role")
-
-                        for perm in role_permissions.permissions:
-                            user_permissions.add(perm)
-
-                    payload["permissions"] = list(user_permissions)
+                    payload["permissions"] = await self.get_permissions_for_roles(
+                        user_roles, True, user_context
+                    )
 
                 return payload
 
@@ -155,22 +167,9 @@ class UserRolesRecipe(RecipeModule):
                     user_info["roles"] = user_roles
 
                 if "permissions" in scopes:
-                    user_permissions: Set[str] = set()
-                    for role in user_roles:
-                        role_permissions = (
-                            await self.recipe_implementation.get_permissions_for_role(
-                                role=role,
-                                user_context=user_context,
-                            )
-                        )
-
-                        if isinstance(role_permissions, UnknownRoleError):
-                            raise Exception("Failed to fetch permissions for the role")
-
-                        for perm in role_permissions.permissions:
-                            user_permissions.add(perm)
-
-                    user_info["permissions"] = list(user_permissions)
+                    user_info["permissions"] = await self.get_permissions_for_roles(
+                        user_roles, True, user_context
+                    )
 
                 return user_info
 
@@ -180,6 +179,41 @@ class UserRolesRecipe(RecipeModule):
 
         PostSTInitCallbacks.add_post_init_callback(callback)
 
+    async def get_permissions_for_roles(
+        self,
+        roles: List[str],
+        throw_on_unknown_role: bool,
+        user_context: Dict[str, Any],
+    ) -> List[str]:
+        """
+        Returns the permissions of all the roles. The permissions of the roles are fetched
+        concurrently (at most MAX_CONCURRENT_PERMISSION_FETCHES at a time), so that users
+        with many roles don't need a request to the core after another.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PERMISSION_FETCHES)
+
+        async def get_permissions_for_role(
+            role: str,
+        ) -> Union[GetPermissionsForRoleOkResult, UnknownRoleError]:
+            async with semaphore:
+                return await self.recipe_implementation.get_permissions_for_role(
+                    role=role, user_context=user_context
+                )
+
+        results = await asyncio.gather(
+            *[get_permissions_for_role(role) for role in roles]
+        )
+
+        user_permissions: Set[str] = set()
+        for role_permissions in results:
+            if isinstance(role_permissions, UnknownRoleError):
+                if throw_on_unknown_role:
+                    raise Exception("Failed to fetch permissions for the role")
+                continue
+            user_permissions.update(role_permissions.permissions)
+
+        return list(user_permissions)
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and (
             isinstance(err, SuperTokensUserRolesError)
@@ -212,11 +246,21 @@ class UserRolesRecipe(RecipeModule):
     def get_all_cors_headers(self) -> List[str]:
         return []
 
+    async def shutdown(self) -> None:
+        if self.local_role_snapshot is not None:
+            self.local_role_snapshot.stop_background_refresh()
+
+    async def warmup(self, user_context: Dict[str, Any]) -> None:
+        if self.local_role_snapshot is not None:
+            await self.local_role_snapshot.refresh(user_context)
+
     @staticmethod
     def init(
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Optional[float] = None,
+        local_role_snapshot: Optional[LocalRoleSnapshotConfig] = None,
     ):
         def func(app_info: AppInfo):
             if UserRolesRecipe.__instance is None:
@@ -226,6 +270,8 @@ class UserRolesRecipe(RecipeModule):
                     skip_adding_roles_to_access_token,
                     skip_adding_permissions_to_access_token,
                     override,
+                    role_permissions_cache_ttl_sec,
+                    local_role_snapshot,
                 )
                 return UserRolesRecipe.__instance
             raise Exception(
@@ -241,6 +287,11 @@ class UserRolesRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        if (
+            UserRolesRecipe.__instance is not None
+            and UserRolesRecipe.__instance.local_role_snapshot is not None
+        ):
+            UserRolesRecipe.__instance.local_role_snapshot.stop_background_refresh()
         UserRolesRecipe.__instance = None
 
     @staticmethod
@@ -270,20 +321,9 @@ class PermissionClaimClass(PrimitiveArrayClaim[List[str]]):
                 user_id, tenant_id, user_context
             )
 
-            user_permissions: Set[str] = set()
-
-            for role in user_roles.roles:
-                role_permissions = (
-                    await recipe.recipe_implementation.get_permissions_for_role(
-                        role, user_context
-                    )
-                )
-
-                if isinstance(role_permissions, GetPermissionsForRoleOkResult):
-                    for permission in role_permissions.permissions:
-                        user_permissions.add(permission)
-
-            return list(user_permissions)
+            return await recipe.get_permissions_for_roles(
+                user_roles.roles, False, user_context
+            )
 
         super().__init__(key, fetch_value, default_max_age_in_sec)
 
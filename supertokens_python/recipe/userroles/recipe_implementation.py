@@ -13,11 +13,14 @@
 # under the License.
 
 
-from typing import Any, Dict, List, Union
+import asyncio
+from typing import Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
-
+from supertokens_python.recipe.session.claim_value_cache import (
+    invalidate_cached_claim_values,
+)
 from .interfaces import (
     AddRoleToUserOkResult,
     CreateNewRoleOrAddPermissionsOkResult,
@@ -32,12 +35,69 @@ from .interfaces import (
     RemoveUserRoleOkResult,
     UnknownRoleError,
 )
+from .snapshot import LocalRoleSnapshot, LocalRoleSnapshotConfig
+
+
+def invalidate_cached_claims(roles: bool, user_id: Optional[str] = None):
+    """
+    Invalidates the cached values of the permission claim (and of the role claim if
+    roles is True) of the user, or of all users if user_id is None
+    """
+    from .recipe import PermissionClaim, UserRoleClaim
+
+    claim_keys = [PermissionClaim.key]
+    if roles:
+        claim_keys.append(UserRoleClaim.key)
+    invalidate_cached_claim_values(claim_keys, user_id)
+
+
+# The number of roles whose permissions are fetched at a time when loading the local
+# role snapshot
+MAX_CONCURRENT_SNAPSHOT_FETCHES = 10
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(
+        self,
+        querier: Querier,
+        local_role_snapshot: Optional[LocalRoleSnapshotConfig] = None,
+    ):
         super().__init__()
         self.querier = querier
+        # If enabled, get_permissions_for_role and get_roles_that_have_permission are
+        # answered from an in-memory snapshot of all the roles and their permissions
+        self.local_role_snapshot = (
+            None
+            if local_role_snapshot is None
+            else LocalRoleSnapshot(local_role_snapshot, self.__load_role_snapshot)
+        )
+
+    async def __load_role_snapshot(
+        self, user_context: Dict[str, Any]
+    ) -> Dict[str, List[str]]:
+        response = await self.querier.send_get_request(
+            NormalisedURLPath("/recipe/roles"),
+            {},
+            user_context=user_context,
+        )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SNAPSHOT_FETCHES)
+
+        async def get_permissions(role: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.querier.send_get_request(
+                    NormalisedURLPath("/recipe/role/permissions"),
+                    {"role": role},
+                    user_context=user_context,
+                )
+
+        roles: List[str] = response["roles"]
+        results = await asyncio.gather(*[get_permissions(role) for role in roles])
+        # roles deleted while the snapshot was being loaded are left out
+        return {
+            role: result["permissions"]
+            for role, result in zip(roles, results)
+            if result["status"] == "OK"
+        }
 
     async def add_role_to_user(
         self,
@@ -54,6 +114,7 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if response["status"] == "OK":
+            invalidate_cached_claims(True, user_id)
             return AddRoleToUserOkResult(
                 did_user_already_have_role=response["didUserAlreadyHaveRole"]
             )
@@ -73,6 +134,7 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if response["status"] == "OK":
+            invalidate_cached_claims(True, user_id)
             return RemoveUserRoleOkResult(
                 did_user_have_role=response["didUserHaveRole"]
             )
@@ -112,6 +174,9 @@ class RecipeImplementation(RecipeInterface):
             None,
             user_context=user_context,
         )
+        if self.local_role_snapshot is not None:
+            self.local_role_snapshot.on_permissions_added(role, permissions)
+        invalidate_cached_claims(False)
         return CreateNewRoleOrAddPermissionsOkResult(
             created_new_role=response["createdNewRole"]
         )
@@ -119,6 +184,14 @@ class RecipeImplementation(RecipeInterface):
     async def get_permissions_for_role(
         self, role: str, user_context: Dict[str, Any]
     ) -> Union[GetPermissionsForRoleOkResult, UnknownRoleError]:
+        if self.local_role_snapshot is not None:
+            snapshot = await self.local_role_snapshot.get(user_context)
+            permissions = snapshot.permissions_by_role.get(role)
+            if permissions is not None:
+                return GetPermissionsForRoleOkResult(permissions=[*permissions])
+            # the role may have been created by another process after the snapshot was
+            # loaded, so we ask the core
+
         params = {"role": role}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/role/permissions"),
@@ -139,12 +212,21 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if response["status"] == "OK":
+            if self.local_role_snapshot is not None:
+                self.local_role_snapshot.on_permissions_removed(role, permissions)
+            invalidate_cached_claims(False)
             return RemovePermissionsFromRoleOkResult()
         return UnknownRoleError()
 
     async def get_roles_that_have_permission(
         self, permission: str, user_context: Dict[str, Any]
     ) -> GetRolesThatHavePermissionOkResult:
+        if self.local_role_snapshot is not None:
+            snapshot = await self.local_role_snapshot.get(user_context)
+            return GetRolesThatHavePermissionOkResult(
+                roles=[*snapshot.roles_by_permission.get(permission, [])]
+            )
+
         params = {"permission": permission}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/permission/roles"),
@@ -162,6 +244,9 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        if self.local_role_snapshot is not None:
+            self.local_role_snapshot.on_role_deleted(role)
+        invalidate_cached_claims(True)
         return DeleteRoleOkResult(did_role_exist=response["didRoleExist"])
 
     async def get_all_roles(self, user_context: Dict[str, Any]) -> GetAllRolesOkResult:
@@ -0,0 +1,176 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.utils import get_timestamp_ms
+
+
+class LocalRoleSnapshotConfig:
+    """
+    Enables answering get_permissions_for_role and get_roles_that_have_permission from an
+    in-memory snapshot of all the roles and their permissions, instead of the core.
+
+    The snapshot is loaded by Supertokens.warmup (or by the first call that needs it), and
+    is refreshed in the background when it is used more than refresh_interval_sec after it
+    was loaded, while the old snapshot is still served. Changes made through this process
+    are applied to the snapshot right away, but changes made by other processes are only
+    picked up by the next refresh.
+    """
+
+    def __init__(self, refresh_interval_sec: float = 60):
+        self.refresh_interval_sec = refresh_interval_sec
+
+
+class RoleSnapshot:
+    def __init__(self, permissions_by_role: Dict[str, List[str]], loaded_at: int):
+        self.permissions_by_role = permissions_by_role
+        self.loaded_at = loaded_at
+        self.roles_by_permission: Dict[str, List[str]] = {}
+        for role, permissions in permissions_by_role.items():
+            for permission in permissions:
+                self.roles_by_permission.setdefault(permission, []).append(role)
+
+
+class LocalRoleSnapshot:
+    def __init__(
+        self,
+        config: LocalRoleSnapshotConfig,
+        load: Callable[[Dict[str, Any]], Awaitable[Dict[str, List[str]]]],
+    ):
+        self.config = config
+        self.__load = load
+        self.__snapshot: Optional[RoleSnapshot] = None
+        self.__lock = threading.Lock()
+        # changes made through this process while a snapshot is being loaded are logged,
+        # and replayed on the loaded snapshot since it may not contain them. Replaying a
+        # change that is already in the snapshot does nothing.
+        self.__generation = 0
+        self.__update_log: List[Callable[[Dict[str, List[str]]], Any]] = []
+        self.__update_log_start_generation = 0
+        self.__refreshes_in_flight = 0
+        self.__refresh_task: Optional[asyncio.Task[None]] = None
+        self.__initial_load_task: Optional[asyncio.Task[RoleSnapshot]] = None
+
+    async def get(self, user_context: Dict[str, Any]) -> RoleSnapshot:
+        snapshot = self.__snapshot
+        if snapshot is None:
+            return await self.__load_initial_snapshot(user_context)
+
+        if (
+            snapshot.loaded_at + self.config.refresh_interval_sec * 1000
+            < get_timestamp_ms()
+        ):
+            with self.__lock:
+                if self.__refresh_task is None or self.__refresh_task.done():
+                    # the refresh outlives the request that triggered it, so it
+                    # doesn't get its user_context
+                    self.__refresh_task = asyncio.get_running_loop().create_task(
+                        self.__refresh_in_background({})
+                    )
+        return snapshot
+
+    async def __load_initial_snapshot(
+        self, user_context: Dict[str, Any]
+    ) -> RoleSnapshot:
+        # calls that need the snapshot before it is loaded wait for the same load,
+        # instead of each loading all the roles
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            if self.__snapshot is not None:
+                return self.__snapshot
+            task = self.__initial_load_task
+            # a task can only be awaited in its own loop, and a failed load is retried
+            if task is None or task.done() or task.get_loop() is not loop:
+                task = loop.create_task(self.refresh(user_context))
+                self.__initial_load_task = task
+        # a caller that is cancelled doesn't cancel the load for the others
+        return await asyncio.shield(task)
+
+    def stop_background_refresh(self):
+        with self.__lock:
+            if self.__refresh_task is not None:
+                self.__refresh_task.cancel()
+                self.__refresh_task = None
+
+    async def __refresh_in_background(self, user_context: Dict[str, Any]):
+        try:
+            await self.refresh(user_context)
+        except Exception as e:  # pylint: disable=broad-except
+            # the old snapshot keeps being used until the next refresh succeeds
+            log_debug_message("userroles: refreshing the role snapshot failed: %s", e)
+
+    async def refresh(self, user_context: Dict[str, Any]) -> RoleSnapshot:
+        with self.__lock:
+            generation = self.__generation
+            self.__refreshes_in_flight += 1
+        try:
+            loaded_at = get_timestamp_ms()
+            permissions_by_role = await self.__load(user_context)
+            with self.__lock:
+                for update in self.__update_log[
+                    generation - self.__update_log_start_generation :
+                ]:
+                    update(permissions_by_role)
+                snapshot = RoleSnapshot(permissions_by_role, loaded_at)
+                if self.__snapshot is None or self.__snapshot.loaded_at <= loaded_at:
+                    self.__snapshot = snapshot
+                return snapshot
+        finally:
+            with self.__lock:
+                self.__refreshes_in_flight -= 1
+                if self.__refreshes_in_flight == 0:
+                    self.__update_log = []
+                    self.__update_log_start_generation = self.__generation
+
+    def on_permissions_added(self, role: str, permissions: List[str]):
+        def update(permissions_by_role: Dict[str, List[str]]):
+            existing = permissions_by_role.get(role, [])
+            permissions_by_role[role] = existing + [
+                p for p in permissions if p not in existing
+            ]
+
+        self.__update(update)
+
+    def on_permissions_removed(self, role: str, permissions: List[str]):
+        def update(permissions_by_role: Dict[str, List[str]]):
+            if role in permissions_by_role:
+                permissions_by_role[role] = [
+                    p for p in permissions_by_role[role] if p not in permissions
+                ]
+
+        self.__update(update)
+
+    def on_role_deleted(self, role: str):
+        self.__update(lambda permissions_by_role: permissions_by_role.pop(role, None))
+
+    def __update(self, update: Callable[[Dict[str, List[str]]], Any]):
+        with self.__lock:
+            self.__generation += 1
+            if self.__refreshes_in_flight > 0:
+                self.__update_log.append(update)
+            else:
+                self.__update_log_start_generation = self.__generation
+            if self.__snapshot is None:
+                return
+            # snapshots are never changed, since they may be in use
+            permissions_by_role = dict(self.__snapshot.permissions_by_role)
+            update(permissions_by_role)
+            self.__snapshot = RoleSnapshot(
+                permissions_by_role, self.__snapshot.loaded_at
+            )
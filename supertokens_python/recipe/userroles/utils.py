@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, Union, Optional
 
 from supertokens_python.recipe.userroles.interfaces import APIInterface, RecipeInterface
+from supertokens_python.recipe.userroles.snapshot import LocalRoleSnapshotConfig
 from supertokens_python.supertokens import AppInfo
 
 if TYPE_CHECKING:
@@ -39,12 +40,16 @@ class UserRolesConfig:
         skip_adding_roles_to_access_token: bool,
         skip_adding_permissions_to_access_token: bool,
         override: InputOverrideConfig,
+        role_permissions_cache_ttl_sec: float,
+        local_role_snapshot: Optional[LocalRoleSnapshotConfig],
     ) -> None:
         self.skip_adding_roles_to_access_token = skip_adding_roles_to_access_token
         self.skip_adding_permissions_to_access_token = (
             skip_adding_permissions_to_access_token
         )
         self.override = override
+        self.role_permissions_cache_ttl_sec = role_permissions_cache_ttl_sec
+        self.local_role_snapshot = local_role_snapshot
 
 
 def validate_and_normalise_user_input(
@@ -53,6 +58,8 @@ def validate_and_normalise_user_input(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Optional[float] = None,
+    local_role_snapshot: Optional[LocalRoleSnapshotConfig] = None,
 ) -> UserRolesConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
@@ -65,8 +72,23 @@ def validate_and_normalise_user_input(
     if skip_adding_permissions_to_access_token is None:
         skip_adding_permissions_to_access_token = False
 
+    if role_permissions_cache_ttl_sec is None:
+        role_permissions_cache_ttl_sec = 0
+    elif role_permissions_cache_ttl_sec < 0:
+        raise ValueError("role_permissions_cache_ttl_sec must not be negative")
+
+    if local_role_snapshot is not None:
+        if not isinstance(local_role_snapshot, LocalRoleSnapshotConfig):  # type: ignore
+            raise ValueError(
+                "local_role_snapshot must be an instance of LocalRoleSnapshotConfig or None"
+            )
+        if local_role_snapshot.refresh_interval_sec <= 0:
+            raise ValueError("refresh_interval_sec must be greater than 0")
+
     return UserRolesConfig(
         skip_adding_roles_to_access_token=skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token=skip_adding_permissions_to_access_token,
         override=override,
+        role_permissions_cache_ttl_sec=role_permissions_cache_ttl_sec,
+        local_role_snapshot=local_role_snapshot,
     )
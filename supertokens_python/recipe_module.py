@@ -133,6 +133,12 @@ class RecipeModule(abc.ABC):
     def get_all_cors_headers(self) -> List[str]:
         pass
 
+    async def shutdown(self) -> None:
+        """Called by Supertokens.shutdown to stop any background work started by the recipe."""
+
+    async def warmup(self, user_context: Dict[str, Any]) -> None:
+        """Called by Supertokens.warmup to fetch data the recipe needs to handle requests."""
+
 
 class APIHandled:
     def __init__(
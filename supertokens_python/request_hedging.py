@@ -0,0 +1,110 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from .core_call_cache import get_path_without_tenant_id
+
+DEFAULT_HEDGED_PATHS = ["/recipe/session/verify"]
+# The delay is recomputed after this many requests, instead of for every request
+HEDGE_DELAY_RECOMPUTE_INTERVAL = 20
+HEDGE_LATENCY_SAMPLES = 200
+# Hedges that can be sent in a burst, even if the ratio doesn't allow them
+HEDGE_BUDGET_MAX = 10
+
+
+class CoreRequestHedgingConfig:
+    """
+    Enables hedging of requests to the core: if a host hasn't responded to a request for
+    one of the paths after a delay, the same request is sent to another host, and the
+    response that arrives first is used.
+
+    Only paths for which sending the request twice is safe should be hedged. Paths are given
+    without the tenant id prefix. Note that /recipe/session/refresh rotates the refresh token,
+    so it should only be added if a duplicated refresh is acceptable.
+
+    The delay is the delay_percentile latency of the path (or initial_delay_ms, until enough
+    requests have been made), but never less than min_delay_ms. At most max_hedge_ratio of
+    the requests are hedged.
+    """
+
+    def __init__(
+        self,
+        paths: Optional[List[str]] = None,
+        delay_percentile: float = 95,
+        initial_delay_ms: float = 100,
+        min_delay_ms: float = 10,
+        max_hedge_ratio: float = 0.05,
+    ):
+        self.paths = paths if paths is not None else DEFAULT_HEDGED_PATHS
+        self.delay_percentile = delay_percentile
+        self.initial_delay_ms = initial_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.max_hedge_ratio = max_hedge_ratio
+
+
+class PathLatencies:
+    def __init__(self, initial_delay_ms: float):
+        self.samples: Deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+        self.samples_since_recompute = 0
+        self.delay_ms = initial_delay_ms
+
+
+class RequestHedger:
+    def __init__(self, config: CoreRequestHedgingConfig):
+        self.config = config
+        self.__latencies: Dict[str, PathLatencies] = {
+            path: PathLatencies(config.initial_delay_ms) for path in config.paths
+        }
+        self.__budget = float(HEDGE_BUDGET_MAX)
+        self.__lock = threading.Lock()
+        self.hedges_sent = 0
+
+    def get_delay_sec(self, path: str) -> Optional[float]:
+        """
+        Returns None if requests for the path are not hedged
+        """
+        latencies = self.__latencies.get(get_path_without_tenant_id(path))
+        if latencies is None:
+            return None
+        with self.__lock:
+            self.__budget = min(
+                self.__budget + self.config.max_hedge_ratio, HEDGE_BUDGET_MAX
+            )
+        return max(latencies.delay_ms, self.config.min_delay_ms) / 1000
+
+    def try_acquire_hedge(self) -> bool:
+        with self.__lock:
+            if self.__budget < 1:
+                return False
+            self.__budget -= 1
+            self.hedges_sent += 1
+            return True
+
+    def on_response(self, path: str, latency_ms: float):
+        latencies = self.__latencies.get(get_path_without_tenant_id(path))
+        if latencies is None:
+            return
+        with self.__lock:
+            latencies.samples.append(latency_ms)
+            latencies.samples_since_recompute += 1
+            if latencies.samples_since_recompute < HEDGE_DELAY_RECOMPUTE_INTERVAL:
+                return
+            latencies.samples_since_recompute = 0
+            samples = sorted(latencies.samples)
+            index = int(len(samples) * self.config.delay_percentile / 100)
+            latencies.delay_ms = samples[min(index, len(samples) - 1)]
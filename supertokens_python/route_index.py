@@ -0,0 +1,92 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .recipe_module import RecipeModule
+
+# Same as the tenant id part of the regex in RecipeModule.return_api_id_if_can_handle_request
+TENANT_ID_REGEX = re.compile(r"[a-zA-Z0-9-]+")
+
+
+class Route:
+    def __init__(
+        self,
+        recipe: RecipeModule,
+        api_id: str,
+        recipe_index: int,
+        api_index: int,
+    ):
+        self.recipe = recipe
+        self.api_id = api_id
+        # recipes (and their APIs) are matched in the order they were added in
+        self.priority = (recipe_index, api_index)
+
+
+class RouteMatch:
+    def __init__(self, route: Route, tenant_id: Optional[str]):
+        self.recipe = route.recipe
+        self.api_id = route.api_id
+        # None if the path doesn't have a tenant id
+        self.tenant_id = tenant_id
+
+
+class RouteIndex:
+    """
+    The APIs handled by all recipes, indexed by method and path (without the API base
+    path), so that finding the recipe for a request doesn't need to go through every API.
+    It matches requests the same way RecipeModule.return_api_id_if_can_handle_request does.
+    """
+
+    def __init__(self, api_base_path: str, recipe_modules: List[RecipeModule]):
+        self.api_base_path = api_base_path
+        self.__routes: Dict[Tuple[str, str], List[Route]] = {}
+        for recipe_index, recipe in enumerate(recipe_modules):
+            for api_index, api in enumerate(recipe.get_apis_handled()):
+                if api.disabled:
+                    continue
+                key = (
+                    api.method,
+                    api.path_without_api_base_path.get_as_string_dangerous(),
+                )
+                self.__routes.setdefault(key, []).append(
+                    Route(recipe, api.request_id, recipe_index, api_index)
+                )
+
+    def find(self, path: str, method: str) -> List[RouteMatch]:
+        """
+        Returns the APIs that match the (normalised) path and method, in the order the
+        recipes would match them. path must start with the API base path.
+        """
+        path_without_base_path = path[len(self.api_base_path) :]
+
+        matches: List[Tuple[Tuple[int, int, int], RouteMatch]] = []
+        for route in self.__routes.get((method, path_without_base_path), []):
+            matches.append(((*route.priority, 0), RouteMatch(route, None)))
+
+        # the path can also be /<tenant id>/<API path>
+        tenant_id_end = path_without_base_path.find("/", 1)
+        if path_without_base_path.startswith("/") and tenant_id_end > 1:
+            tenant_id = path_without_base_path[1:tenant_id_end]
+            if TENANT_ID_REGEX.fullmatch(tenant_id) is not None:
+                remaining_path = path_without_base_path[tenant_id_end:]
+                for route in self.__routes.get((method, remaining_path), []):
+                    matches.append(((*route.priority, 1), RouteMatch(route, tenant_id)))
+
+        if len(matches) > 1:
+            matches.sort(key=lambda match: match[0])
+        return [match for _, match in matches]
@@ -14,19 +14,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from os import environ
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union, Tuple
 
 from typing_extensions import Literal
 
 from supertokens_python.logger import (
-    get_maybe_none_as_str,
     log_debug_message,
     enable_debug_logging,
 )
 
 
 from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT
+from .core_call_cache import CoreCallCacheConfig
+from .rate_limit_retry import CoreRateLimitRetryConfig
+from .request_hedging import CoreRequestHedgingConfig
+from .route_index import RouteIndex, RouteMatch
+from .tracing import trace
 from .exceptions import SuperTokensError
 from .interfaces import (
     CreateUserIdMappingOkResult,
@@ -86,11 +91,28 @@ class SupertokensConfig:
             ]
         ] = None,
         disable_core_call_cache: bool = False,
+        http_max_connections: Optional[int] = None,
+        http_max_keepalive_connections: Optional[int] = None,
+        http_keepalive_expiry_sec: Optional[float] = None,
+        core_call_cache: Optional[CoreCallCacheConfig] = None,
+        core_request_hedging: Optional[CoreRequestHedgingConfig] = None,
+        core_rate_limit_retry: Optional[CoreRateLimitRetryConfig] = None,
     ):  # We keep this = None here because this is directly used by the user.
         self.connection_uri = connection_uri
         self.api_key = api_key
         self.network_interceptor = network_interceptor
         self.disable_core_call_cache = disable_core_call_cache
+        # Limits of the connection pool used for requests to the core. Connections
+        # are reused across requests until Supertokens.shutdown is called.
+        self.http_max_connections = http_max_connections
+        self.http_max_keepalive_connections = http_max_keepalive_connections
+        self.http_keepalive_expiry_sec = http_keepalive_expiry_sec
+        # Opt in cache of core GET responses that is shared across requests
+        self.core_call_cache = core_call_cache
+        # Opt in hedging of latency critical requests, if multiple core hosts are configured
+        self.core_request_hedging = core_request_hedging
+        # Backoff and process wide budget of the retries of requests rate limited by the core
+        self.core_rate_limit_retry = core_rate_limit_retry
 
 
 class Host:
@@ -248,6 +270,12 @@ class Supertokens:
             supertokens_config.api_key,
             supertokens_config.network_interceptor,
             supertokens_config.disable_core_call_cache,
+            supertokens_config.http_max_connections,
+            supertokens_config.http_max_keepalive_connections,
+            supertokens_config.http_keepalive_expiry_sec,
+            supertokens_config.core_call_cache,
+            supertokens_config.core_request_hedging,
+            supertokens_config.core_rate_limit_retry,
         )
 
         if len(recipe_list) == 0:
@@ -314,6 +342,9 @@ class Supertokens:
 
             self.recipe_modules.append(OAuth2ProviderRecipe.init()(self.app_info))
 
+        # built on the first request, once all recipes have been initialised
+        self.__route_index: Optional[RouteIndex] = None
+
         self.telemetry = (
             telemetry
             if telemetry is not None
@@ -354,6 +385,22 @@ class Supertokens:
         Querier.reset()
         Supertokens.__instance = None
 
+    async def warmup(self, user_context: Optional[Dict[str, Any]] = None) -> None:
+        if user_context is None:
+            user_context = {}
+        log_debug_message("warmup: Fetching the API version and data used by recipes")
+        # The recipes that need the API version wait for the request sent here
+        await asyncio.gather(
+            Querier.get_instance().get_api_version(user_context),
+            *[recipe.warmup(user_context) for recipe in self.recipe_modules],
+        )
+
+    async def shutdown(self) -> None:
+        for recipe in self.recipe_modules:
+            await recipe.shutdown()
+        log_debug_message("shutdown: Closing connections to the core")
+        await Querier.close_http_clients()
+
     @staticmethod
     def get_instance() -> Supertokens:
         if Supertokens.__instance is not None:
@@ -549,47 +596,66 @@ class Supertokens:
             )
             return None
         request_rid = get_rid_from_header(request)
-        log_debug_message(
-            "middleware: requestRID is: %s", get_maybe_none_as_str(request_rid)
-        )
+        log_debug_message("middleware: requestRID is: %s", request_rid)
         if request_rid is not None and request_rid == "anti-csrf":
             # see https://github.com/supertokens/supertokens-python/issues/54
             request_rid = None
 
-        async def handle_without_rid():
-            for recipe in self.recipe_modules:
-                log_debug_message(
-                    "middleware: Checking recipe ID for match: %s with path: %s and method: %s",
-                    recipe.get_recipe_id(),
-                    path.get_as_string_dangerous(),
-                    method,
+        matches = self.__get_route_index().find(path.get_as_string_dangerous(), method)
+
+        async def handle(match: RouteMatch):
+            from supertokens_python.recipe.multitenancy.constants import (
+                DEFAULT_TENANT_ID,
+            )
+
+            from .recipe_module import RecipeModule
+
+            assert RecipeModule.get_tenant_id is not None
+            tenant_id = (
+                await RecipeModule.get_tenant_id(  # pylint: disable=not-callable
+                    (
+                        match.tenant_id
+                        if match.tenant_id is not None
+                        else DEFAULT_TENANT_ID
+                    ),
+                    user_context,
                 )
-                api_and_tenant_id = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
+            )
+            log_debug_message(
+                "middleware: Request being handled by recipe. ID is: %s",
+                match.api_id,
+            )
+            with trace(
+                "supertokens.api",
+                {
+                    "recipe": match.recipe.get_recipe_id(),
+                    "api_id": match.api_id,
+                    "method": method,
+                    "path": path.get_as_string_dangerous(),
+                },
+            ) as span:
+                api_resp = await match.recipe.handle_api_request(
+                    match.api_id,
+                    tenant_id,
+                    request,
+                    path,
+                    method,
+                    response,
+                    user_context,
                 )
-                if api_and_tenant_id is not None:
-                    log_debug_message(
-                        "middleware: Request being handled by recipe. ID is: %s",
-                        api_and_tenant_id.api_id,
-                    )
-                    api_resp = await recipe.handle_api_request(
-                        api_and_tenant_id.api_id,
-                        api_and_tenant_id.tenant_id,
-                        request,
-                        path,
-                        method,
-                        response,
-                        user_context,
-                    )
-                    if api_resp is None:
-                        log_debug_message(
-                            "middleware: Not handled because API returned None"
-                        )
-                        return None
-                    log_debug_message("middleware: Ended")
-                    return api_resp
-            log_debug_message("middleware: Not handling because no recipe matched")
-            return None
+                if api_resp is not None:
+                    span.set_attribute("status", api_resp.status_code)
+            if api_resp is None:
+                log_debug_message("middleware: Not handled because API returned None")
+                return None
+            log_debug_message("middleware: Ended")
+            return api_resp
+
+        async def handle_without_rid():
+            if len(matches) == 0:
+                log_debug_message("middleware: Not handling because no recipe matched")
+                return None
+            return await handle(matches[0])
 
         if request_rid is not None:
             matched_recipes = [
@@ -617,45 +683,33 @@ class Supertokens:
                     "middleware: Matched with recipe Ids: %s", recipe.get_recipe_id()
                 )
 
-            id_result = None
-            final_matched_recipe = None
-            for recipe in matched_recipes:
-                current_id_result = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
+            # a recipe handles the request with the first of its APIs that matches
+            rid_matches: List[RouteMatch] = []
+            for match in matches:
+                if match.recipe in matched_recipes and all(
+                    m.recipe is not match.recipe for m in rid_matches
+                ):
+                    rid_matches.append(match)
+
+            if len(rid_matches) > 1:
+                raise ValueError(
+                    "Two recipes have matched the same API path and method! This is a bug in the SDK. Please contact support."
                 )
-                if current_id_result is not None:
-                    if id_result is not None:
-                        raise ValueError(
-                            "Two recipes have matched the same API path and method! This is a bug in the SDK. Please contact support."
-                        )
-                    final_matched_recipe = recipe
-                    id_result = current_id_result
-
-            if id_result is None or final_matched_recipe is None:
+
+            if len(rid_matches) == 0:
                 return await handle_without_rid()
 
-            log_debug_message(
-                "middleware: Request being handled by recipe. ID is: %s",
-                id_result.api_id,
-            )
-            request_handled = await final_matched_recipe.handle_api_request(
-                id_result.api_id,
-                id_result.tenant_id,
-                request,
-                path,
-                method,
-                response,
-                user_context,
-            )
-            if request_handled is None:
-                log_debug_message(
-                    "middleware: Not handled because API returned request_handled as None"
-                )
-                return None
-            log_debug_message("middleware: Ended")
-            return request_handled
+            return await handle(rid_matches[0])
         return await handle_without_rid()
 
+    def __get_route_index(self) -> RouteIndex:
+        if self.__route_index is None:
+            self.__route_index = RouteIndex(
+                self.app_info.api_base_path.get_as_string_dangerous(),
+                self.recipe_modules,
+            )
+        return self.__route_index
+
     async def handle_supertokens_error(
         self,
         request: BaseRequest,
@@ -665,7 +719,7 @@ class Supertokens:
     ) -> Optional[BaseResponse]:
         log_debug_message("errorHandler: Started")
         log_debug_message(
-            "errorHandler: Error is from SuperTokens recipe. Message: %s", str(err)
+            "errorHandler: Error is from SuperTokens recipe. Message: %s", err
         )
         if isinstance(err, GeneralError):
             raise err
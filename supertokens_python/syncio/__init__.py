@@ -14,7 +14,10 @@
 from typing import Dict, List, Optional, Union, Any
 
 from supertokens_python import Supertokens
-from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.async_to_sync_wrapper import (
+    stop_background_event_loop,
+    sync,
+)
 from supertokens_python.interfaces import (
     CreateUserIdMappingOkResult,
     DeleteUserIdMappingOkResult,
@@ -84,6 +87,15 @@ def get_user_count(
     )
 
 
+def warmup(user_context: Optional[Dict[str, Any]] = None) -> None:
+    return sync(Supertokens.get_instance().warmup(user_context))
+
+
+def shutdown() -> None:
+    sync(Supertokens.get_instance().shutdown())
+    stop_background_event_loop()
+
+
 def delete_user(
     user_id: str,
     remove_all_linked_accounts: bool = True,
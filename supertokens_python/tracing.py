@@ -0,0 +1,133 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Hooks to trace where time is spent in the SDK. Tracing is disabled (a no-op) unless a
+tracer is set with set_tracer, e.g. one that creates OpenTelemetry spans:
+
+    set_tracer(OpenTelemetryTracer(opentelemetry.trace.get_tracer("supertokens")))
+
+Spans are created for:
+- supertokens.core_request: requests to the core, with the path, method, host, status,
+  retry_count (429 retries and other hosts that were tried) and cache_hit (for GET requests,
+  in which case host is the host that would have been queried)
+- supertokens.jwks_fetch: fetches of the JWKS, with the url and status
+- supertokens.claim_refetch: claim values fetched while validating claims, with the claim key
+- supertokens.api: APIs handled by the middleware, with the recipe, api_id, method and path
+"""
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+
+class Span:
+    """A span that records nothing, subclass it to record spans"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class Tracer:
+    """A tracer that creates no-op spans, subclass it to record spans"""
+
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Optional[Span]
+    ) -> Span:
+        """
+        Called when an operation starts. parent is the span of the operation (of the SDK)
+        that this operation is part of. The returned span is ended when the operation ends.
+        """
+        return NO_OP_SPAN
+
+
+class OpenTelemetryTracer(Tracer):
+    """Creates spans with an OpenTelemetry tracer (opentelemetry-api must be installed)"""
+
+    def __init__(self, tracer: Any):
+        self.tracer = tracer
+
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Optional[Span]
+    ) -> Span:
+        from opentelemetry import trace
+
+        context = None if parent is None else trace.set_span_in_context(parent)  # type: ignore
+        return self.tracer.start_span(name, context=context, attributes=attributes)
+
+
+NO_OP_SPAN = Span()
+
+_tracer: Optional[Tracer] = None
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "supertokens_current_span", default=None
+)
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Sets the tracer used for all spans, or disables tracing if it is None"""
+    global _tracer
+    _tracer = tracer
+
+
+def get_current_span() -> Span:
+    """The span of the operation that is running, or a no-op span if it is not traced"""
+    span = _current_span.get()
+    return NO_OP_SPAN if span is None else span
+
+
+class trace:  # pylint: disable=invalid-name
+    """
+    Context manager that traces the operation in it with the tracer set with set_tracer:
+
+        with trace("supertokens.core_request", {"path": path}) as span:
+            span.set_attribute("status", 200)
+
+    The span is the current span (see get_current_span) while the operation runs.
+    """
+
+    __slots__ = ("name", "attributes", "span", "token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.span: Span = NO_OP_SPAN
+        self.token: Optional[Token[Optional[Span]]] = None
+
+    def __enter__(self) -> Span:
+        tracer = _tracer
+        if tracer is None:
+            return NO_OP_SPAN
+        self.span = tracer.start_span(self.name, self.attributes, _current_span.get())
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self.token is None:
+            return
+        _current_span.reset(self.token)
+        if exc_value is not None:
+            self.span.record_exception(exc_value)
+        self.span.end()
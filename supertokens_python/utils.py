@@ -17,6 +17,7 @@ from __future__ import annotations
 import json
 import threading
 import warnings
+from collections import OrderedDict
 from base64 import urlsafe_b64decode, urlsafe_b64encode, b64encode, b64decode
 from math import floor
 from re import fullmatch
@@ -27,7 +28,9 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Generic,
     List,
+    Tuple,
     TypeVar,
     Union,
     Optional,
@@ -428,6 +431,48 @@ class RWLockContext:
             raise exc_type(exc_value).with_traceback(traceback)
 
 
+class TTLCache(Generic[_T]):
+    """
+    A thread safe cache that holds at most max_size entries, evicting the least recently used
+    ones first. Each entry also expires at the time (in ms) it was set with.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[_T, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[_T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= get_timestamp_ms():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: _T, expires_at: int) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def normalise_email(email: str) -> str:
     return email.strip().lower()
 
@@ -12,14 +12,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import json
-from typing import Any, Dict, Union, Optional
+import jwt
+from typing import Any, Dict, List, Union, Optional
 
 from fastapi import Depends, FastAPI
 from fastapi.requests import Request
 from supertokens_python.types import RecipeUserId
 from tests.testclient import TestClientWithNoCookieJar as TestClient
 from pytest import fixture, mark, skip
-from supertokens_python import InputAppInfo, SupertokensConfig, init
+from pytest_mock import MockerFixture
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
 from supertokens_python.framework.fastapi import get_middleware
 from supertokens_python.recipe import emailpassword, session
 from supertokens_python.recipe.emailpassword.interfaces import (
@@ -33,8 +35,14 @@ from supertokens_python.recipe.session.asyncio import (
     refresh_session,
 )
 from supertokens_python.recipe.session.exceptions import UnauthorisedError
-from supertokens_python.recipe.session.framework.fastapi import verify_session
+from supertokens_python.recipe.session.framework.fastapi import (
+    verify_session,
+    verify_session_from_scope,
+)
 from supertokens_python.recipe.session.interfaces import APIInterface
+from supertokens_python.recipe.session.interfaces import (
+    RecipeInterface as SessionRecipeInterface,
+)
 from supertokens_python.recipe.session.interfaces import APIOptions as SessionAPIOptions
 from tests.utils import (
     TEST_DRIVER_CONFIG_ACCESS_TOKEN_PATH,
@@ -1104,3 +1112,124 @@ async def test_search_with_provider_google_and_phone_1(
     info = extract_info(res)
     assert res.status_code == 200
     assert len(info["body"]["users"]) == 0
+
+
+def test_requests_outside_api_base_path_skip_the_middleware_but_apply_session_mutators(
+    mocker: MockerFixture,
+):
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    middleware = mocker.spy(Supertokens, "middleware")
+
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.get("/with-session")
+    async def with_session(request: Request):  # type: ignore
+        session_container = mocker.MagicMock(spec=SessionContainer)
+        session_container.response_mutators = [
+            lambda response, _: response.set_header("x-mutated", "true")  # type: ignore
+        ]
+        request.state.supertokens = session_container
+        return {}
+
+    @app.get("/without-session")
+    async def without_session():  # type: ignore
+        return {}
+
+    client = TestClient(app)
+
+    response = client.get("/with-session")
+    assert response.status_code == 200
+    assert response.headers.get("x-mutated") == "true"
+
+    response = client.get("/without-session")
+    assert response.status_code == 200
+    assert "x-mutated" not in response.headers
+
+    assert middleware.call_count == 0
+
+    # unknown paths inside the API base path still go through the middleware
+    response = client.get("/auth/unknown")
+    assert response.status_code == 404
+    assert middleware.call_count == 1
+
+
+def test_verify_session_from_scope_reads_tokens_from_the_scope_headers(
+    mocker: MockerFixture,
+):
+    access_tokens: List[Optional[str]] = []
+
+    def create_access_token(user_id: str) -> str:
+        payload = {
+            "sub": user_id,
+            "rsub": user_id,
+            "exp": 9999999999,
+            "iat": 0,
+            "sessionHandle": "session-handle",
+            "refreshTokenHash1": "hash",
+        }
+        return jwt.encode(
+            payload,
+            "secret" * 8,
+            algorithm="HS256",
+            headers={"kid": "k", "version": "5"},
+        )
+
+    def override_session_functions(oi: SessionRecipeInterface):
+        async def get_session(access_token: Optional[str], *_: Any, **__: Any):
+            access_tokens.append(access_token)
+            if access_token is None:
+                return None
+            session_container = mocker.MagicMock(spec=SessionContainer)
+            session_container.get_user_id.return_value = jwt.decode(
+                access_token, options={"verify_signature": False}
+            )["sub"]
+            session_container.response_mutators = []
+            return session_container
+
+        oi.get_session = get_session  # type: ignore
+        return oi
+
+    init(
+        **get_st_init_args(  # type: ignore
+            [
+                session.init(
+                    override=session.InputOverrideConfig(
+                        functions=override_session_functions
+                    )
+                )
+            ]
+        )
+    )
+
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.get("/protected")
+    async def protected(  # type: ignore
+        request: Request,
+        s: Optional[SessionContainer] = Depends(
+            verify_session_from_scope(session_required=False)
+        ),
+    ):
+        assert request.state.supertokens is s
+        return {"userId": None if s is None else s.get_user_id()}
+
+    client = TestClient(app)
+
+    header_token = create_access_token("header-user")
+    response = client.get(
+        "/protected", headers={"Authorization": f"Bearer {header_token}"}
+    )
+    assert response.json() == {"userId": "header-user"}
+
+    cookie_token = create_access_token("cookie-user")
+    response = client.get(
+        "/protected", headers={"Cookie": f"other=1; sAccessToken={cookie_token}"}
+    )
+    assert response.json() == {"userId": "cookie-user"}
+
+    response = client.get("/protected")
+    assert response.json() == {"userId": None}
+
+    assert access_tokens == [header_token, cookie_token, None]
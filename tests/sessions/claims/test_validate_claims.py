@@ -0,0 +1,280 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+import respx
+from pytest import mark
+from supertokens_python import SupertokensConfig, init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session, userroles
+from supertokens_python.recipe.session import ClaimValueCacheConfig, SessionRecipe
+from supertokens_python.recipe.session.claim_value_cache import (
+    invalidate_cached_claim_values,
+)
+from supertokens_python.recipe.session.claims import PrimitiveArrayClaim, PrimitiveClaim
+from supertokens_python.recipe.session.interfaces import (
+    ClaimValidationResult,
+    JSONObject,
+    SessionClaim,
+    SessionClaimValidator,
+)
+from supertokens_python.recipe.userroles import UserRoleClaim
+from supertokens_python.recipe.userroles.asyncio import add_role_to_user
+from supertokens_python.types import RecipeUserId
+from tests.utils import get_st_init_args, setup_function, teardown_function
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+
+async def test_claims_are_refetched_concurrently_up_to_the_limit():
+    init(**get_st_init_args([session.init(claim_refetch_concurrency=2)]))  # type: ignore
+
+    running = 0
+    max_running = 0
+    fetched: List[str] = []
+
+    def create_claim(key: str, delay: float) -> PrimitiveClaim[str]:
+        async def fetch_value(*_: Any) -> str:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(delay)
+            running -= 1
+            fetched.append(key)
+            return key + "-value"
+
+        return PrimitiveClaim(key, fetch_value)
+
+    claims = [
+        create_claim("slow", 0.03),
+        create_claim("fast", 0.01),
+        create_claim("medium", 0.02),
+    ]
+    # the same claim checked twice is only fetched once
+    validators = [c.validators.has_value(c.key + "-value") for c in claims] + [
+        claims[0].validators.has_value("slow-value", id_="again")
+    ]
+
+    result = await SessionRecipe.get_instance().recipe_implementation.validate_claims(
+        "user_id", RecipeUserId("user_id"), {}, validators, {}
+    )
+
+    assert max_running == 2
+    assert sorted(fetched) == ["fast", "medium", "slow"]
+    assert result.invalid_claims == []
+    payload: Dict[str, Any] = result.access_token_payload_update or {}
+    # the payload is updated in the order of the validators, not of the fetches
+    assert list(payload) == ["slow", "fast", "medium"]
+    assert [payload[k]["v"] for k in payload] == [
+        "slow-value",
+        "fast-value",
+        "medium-value",
+    ]
+
+
+async def test_payload_update_is_only_returned_if_a_claim_was_refetched():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    claim = PrimitiveClaim("key", lambda *_: "value")  # type: ignore
+    validators = [claim.validators.has_value("value")]
+    payload = claim.add_to_payload_({"custom": {"a": [1, 2]}}, "value", {})
+
+    result = await recipe_implementation.validate_claims(
+        "user_id", RecipeUserId("user_id"), payload, validators, {}
+    )
+    assert result.access_token_payload_update is None
+
+    result = await recipe_implementation.validate_claims(
+        "user_id", RecipeUserId("user_id"), {"custom": {"a": [1, 2]}}, validators, {}
+    )
+    assert result.access_token_payload_update is not None
+    assert result.access_token_payload_update["key"]["v"] == "value"
+
+
+class UntimedClaim(SessionClaim[str]):
+    """Saves its value in the payload as it is, without the time it was fetched"""
+
+    def add_to_payload_(
+        self,
+        payload: JSONObject,
+        value: str,
+        user_context: Union[Dict[str, Any], None] = None,
+    ) -> JSONObject:
+        payload[self.key] = value
+        return payload
+
+    def remove_from_payload_by_merge_(
+        self, payload: JSONObject, user_context: Optional[Dict[str, Any]] = None
+    ) -> JSONObject:
+        payload[self.key] = None
+        return payload
+
+    def remove_from_payload(
+        self, payload: JSONObject, user_context: Optional[Dict[str, Any]] = None
+    ) -> JSONObject:
+        del payload[self.key]
+        return payload
+
+    def get_value_from_payload(
+        self, payload: JSONObject, user_context: Union[Dict[str, Any], None] = None
+    ) -> Union[str, None]:
+        return payload.get(self.key)
+
+
+class AlwaysRefetchValidator(SessionClaimValidator):
+    def __init__(self, claim: SessionClaim[Any]):
+        super().__init__("always-refetch")
+        self.claim = claim
+
+    async def validate(
+        self, payload: JSONObject, user_context: Dict[str, Any]
+    ) -> ClaimValidationResult:
+        return ClaimValidationResult(True)
+
+    def should_refetch(self, payload: JSONObject, user_context: Dict[str, Any]):
+        return True
+
+
+async def test_payload_update_is_not_returned_if_a_refetched_value_is_unchanged():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    async def fetch_value(*_: Any) -> str:
+        return "value"
+
+    validators: List[SessionClaimValidator] = [
+        AlwaysRefetchValidator(UntimedClaim("key", fetch_value))
+    ]
+
+    result = await recipe_implementation.validate_claims(
+        "user_id", RecipeUserId("user_id"), {"key": "value"}, validators, {}
+    )
+    assert result.access_token_payload_update is None
+
+    result = await recipe_implementation.validate_claims(
+        "user_id", RecipeUserId("user_id"), {"key": "old"}, validators, {}
+    )
+    assert result.access_token_payload_update == {"key": "value"}
+
+
+async def test_claim_values_are_cached_across_sessions_of_a_user():
+    init(
+        **get_st_init_args(
+            [session.init(claim_value_cache=ClaimValueCacheConfig(claim_keys=["key"]))]
+        )
+    )  # type: ignore
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    fetched: List[str] = []
+
+    async def fetch_value(user_id: str, *_: Any) -> str:
+        fetched.append(user_id)
+        return "value"
+
+    claim = PrimitiveClaim("key", fetch_value)
+    not_cached_claim = PrimitiveClaim("not-cached", fetch_value)
+    validators = [claim.validators.has_value("value")]
+
+    async def validate(user_id: str):
+        # every call has an empty payload, like a new session of the user
+        await recipe_implementation.validate_claims(
+            user_id, RecipeUserId(user_id), {}, validators, {}
+        )
+
+    await validate("user1")
+    await validate("user1")
+    await validate("user2")
+    assert fetched == ["user1", "user2"]
+
+    invalidate_cached_claim_values(["key"], "user1")
+    await validate("user1")
+    await validate("user2")
+    assert fetched == ["user1", "user2", "user1"]
+
+    validators = [not_cached_claim.validators.has_value("value")]
+    await validate("user1")
+    await validate("user1")
+    assert fetched == ["user1", "user2", "user1", "user1", "user1"]
+
+
+async def test_cached_claim_values_keep_their_fetch_time_and_are_not_shared():
+    init(
+        **get_st_init_args(
+            [session.init(claim_value_cache=ClaimValueCacheConfig(claim_keys=["key"]))]
+        )
+    )  # type: ignore
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    claim = PrimitiveArrayClaim("key", lambda *_: ["value"])  # type: ignore
+    validators = [claim.validators.includes("value", max_age_in_seconds=60)]
+
+    async def validate() -> Dict[str, Any]:
+        result = await recipe_implementation.validate_claims(
+            "user_id", RecipeUserId("user_id"), {}, validators, {}
+        )
+        assert result.access_token_payload_update is not None
+        return result.access_token_payload_update["key"]
+
+    fetched = await validate()
+    await asyncio.sleep(0.05)
+
+    # the age of a cached value counts towards the max age of the validators
+    cached = await validate()
+    assert cached["t"] <= fetched["t"]
+
+    cached["v"].append("other")
+    assert (await validate())["v"] == ["value"]
+
+
+async def test_cached_roles_are_invalidated_when_a_role_is_added():
+    args = get_st_init_args(
+        [session.init(claim_value_cache=ClaimValueCacheConfig()), userroles.init()]
+    )
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+    Querier.api_version = "3.0"
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    validators = [UserRoleClaim.validators.includes("admin")]
+
+    with respx.MockRouter() as mocker:
+        get_roles = mocker.get("http://localhost:6789/public/recipe/user/roles").mock(
+            side_effect=[
+                httpx.Response(200, json={"status": "OK", "roles": []}),
+                httpx.Response(200, json={"status": "OK", "roles": ["admin"]}),
+            ]
+        )
+        mocker.put("http://localhost:6789/public/recipe/user/role").mock(
+            httpx.Response(200, json={"status": "OK", "didUserAlreadyHaveRole": False})
+        )
+
+        for _ in range(2):
+            result = await recipe_implementation.validate_claims(
+                "user_id", RecipeUserId("user_id"), {}, validators, {}
+            )
+            assert len(result.invalid_claims) == 1
+        assert get_roles.call_count == 1
+
+        await add_role_to_user("public", "user_id", "admin")
+
+        result = await recipe_implementation.validate_claims(
+            "user_id", RecipeUserId("user_id"), {}, validators, {}
+        )
+        assert result.invalid_claims == []
+        assert get_roles.call_count == 2
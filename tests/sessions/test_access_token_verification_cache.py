@@ -0,0 +1,203 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import jwt
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.access_token import (
+    get_info_from_access_token_async,
+)
+from supertokens_python.recipe.session.claims import PrimitiveClaim
+from supertokens_python.recipe.session.constants import protected_props
+from supertokens_python.recipe.session.exceptions import TryRefreshTokenError
+from supertokens_python.recipe.session.jwks import reset_jwks_cache
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from tests.utils import get_st_init_args, setup_function, teardown_function
+
+_ = setup_function  # type:ignore
+_ = teardown_function  # type:ignore
+
+pytestmark = mark.asyncio
+
+JWKS_URL = "http://localhost:3567/.well-known/jwks.json"
+
+
+def create_key_and_jwks(kid: str) -> Tuple[Any, Dict[str, Any]]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, {"keys": [jwk]}
+
+
+def create_access_token(
+    private_key: Any, kid: str, anti_csrf_token: Optional[str] = None
+) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": "user-id",
+        "rsub": "user-id",
+        "exp": now + 3600,
+        "iat": now,
+        "sessionHandle": "session-handle",
+        "refreshTokenHash1": "hash",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": anti_csrf_token,
+        "tId": "public",
+    }
+    return jwt.encode(
+        payload,
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid, "version": "5"},
+    )
+
+
+async def test_verified_access_tokens_are_not_verified_again(mocker: MockerFixture):
+    init(
+        **get_st_init_args(
+            [session.init(access_token_verification_cache_size=10)]
+        )  # type: ignore
+    )
+    reset_jwks_cache()
+    private_key, jwks = create_key_and_jwks("s-kid")
+    token = parse_jwt_without_signature_verification(
+        create_access_token(private_key, "s-kid")
+    )
+    config = SessionRecipe.get_instance().config
+    decode_spy = mocker.spy(jwt, "decode")
+
+    with respx.mock() as respx_mock:
+        respx_mock.get(JWKS_URL).mock(httpx.Response(200, json=jwks))
+
+        info = await get_info_from_access_token_async(config, token, False)
+        assert info["userId"] == "user-id"
+        assert decode_spy.call_count == 1
+
+        cached_info = await get_info_from_access_token_async(config, token, False)
+        assert cached_info == info
+        assert decode_spy.call_count == 1
+
+        # The anti-csrf check still happens for cached tokens
+        with raises(TryRefreshTokenError):
+            await get_info_from_access_token_async(config, token, True)
+
+        other_token = parse_jwt_without_signature_verification(
+            create_access_token(private_key, "s-kid", "anti-csrf")
+        )
+        await get_info_from_access_token_async(config, other_token, True)
+        assert decode_spy.call_count == 2
+
+
+async def test_cached_access_tokens_are_verified_again_when_the_keys_change(
+    mocker: MockerFixture,
+):
+    init(
+        **get_st_init_args(
+            [session.init(access_token_verification_cache_size=10)]
+        )  # type: ignore
+    )
+    reset_jwks_cache()
+    old_private_key, old_jwks = create_key_and_jwks("s-old-kid")
+    new_private_key, new_jwks = create_key_and_jwks("s-new-kid")
+    old_token = parse_jwt_without_signature_verification(
+        create_access_token(old_private_key, "s-old-kid")
+    )
+    new_token = parse_jwt_without_signature_verification(
+        create_access_token(new_private_key, "s-new-kid")
+    )
+    config = SessionRecipe.get_instance().config
+
+    with respx.mock() as respx_mock:
+        jwks_route = respx_mock.get(JWKS_URL).mock(httpx.Response(200, json=old_jwks))
+        await get_info_from_access_token_async(config, old_token, False)
+
+        # The old key is revoked, and the new keys are fetched for the kid of the new token
+        jwks_route.mock(httpx.Response(200, json=new_jwks))
+        await get_info_from_access_token_async(config, new_token, False)
+
+        with raises(TryRefreshTokenError):
+            await get_info_from_access_token_async(config, old_token, False)
+
+        # Tokens verified with the new keys are still cached
+        decode_spy = mocker.spy(jwt, "decode")
+        await get_info_from_access_token_async(config, new_token, False)
+        assert decode_spy.call_count == 0
+
+
+async def test_claim_updates_do_not_change_cached_access_token_payload():
+    init(
+        **get_st_init_args(
+            [session.init(access_token_verification_cache_size=10)]
+        )  # type: ignore
+    )
+    reset_jwks_cache()
+    private_key, jwks = create_key_and_jwks("s-kid")
+    token = parse_jwt_without_signature_verification(
+        create_access_token(private_key, "s-kid")
+    )
+    config = SessionRecipe.get_instance().config
+    claim = PrimitiveClaim("st-role", lambda *_: "admin")  # type: ignore
+
+    with respx.mock() as respx_mock:
+        respx_mock.get(JWKS_URL).mock(httpx.Response(200, json=jwks))
+
+        info = await get_info_from_access_token_async(config, token, False)
+
+        # This is what assert_claims does with the payload when a claim is refetched
+        payload_update = claim.add_to_payload_(info["userData"], "admin")
+        for k in protected_props:
+            del payload_update[k]
+
+        cached_info = await get_info_from_access_token_async(config, token, False)
+        assert cached_info["userData"]["sub"] == "user-id"
+        assert cached_info["userData"]["tId"] == "public"
+        assert "st-role" not in cached_info["userData"]
+
+        # Changes to a cached result don't leak into the next one either
+        del cached_info["userData"]["sub"]
+        cached_info = await get_info_from_access_token_async(config, token, False)
+        assert cached_info["userData"]["sub"] == "user-id"
+
+
+async def test_access_tokens_are_verified_every_time_if_cache_is_disabled(
+    mocker: MockerFixture,
+):
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    reset_jwks_cache()
+    private_key, jwks = create_key_and_jwks("s-kid")
+    token = parse_jwt_without_signature_verification(
+        create_access_token(private_key, "s-kid")
+    )
+    config = SessionRecipe.get_instance().config
+    decode_spy = mocker.spy(jwt, "decode")
+
+    with respx.mock() as respx_mock:
+        respx_mock.get(JWKS_URL).mock(httpx.Response(200, json=jwks))
+
+        await get_info_from_access_token_async(config, token, False)
+        await get_info_from_access_token_async(config, token, False)
+        assert decode_spy.call_count == 2
@@ -1,11 +1,18 @@
+import asyncio
 import time
 import pytest
 import logging
 import threading
 import json
+import httpx
 import requests
+import requests_mock
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from jwt import PyJWK
 
-from typing import List, Any, Callable
+from typing import Dict, List, Any, Callable
 
 from supertokens_python import init, SupertokensConfig
 from supertokens_python.recipe import session
@@ -29,10 +36,16 @@ from tests.utils import (
 
 from supertokens_python.recipe.session.jwks import (
     reset_jwks_cache,
+    CachedKeys,
     JWKSConfig,
+    find_matching_keys,
     get_cached_keys,
     get_latest_keys,
+    get_latest_keys_async,
+    is_jwks_background_refresh_running,
+    stop_jwks_background_refresh,
 )
+from supertokens_python.recipe.session import jwks as jwks_module
 from supertokens_python.utils import utf_base64encode
 from tests.utils import min_api_version
 
@@ -718,3 +731,117 @@ async def test_session_verification_of_jwt_with_dynamic_signing_key_mode_works_a
             str(e)
             == "The access token doesn't match the use_dynamic_access_token_signing_key setting"
         )
+
+
+async def test_that_async_jwks_fetch_is_done_once_for_concurrent_callers():
+    """This test makes sure that when many coroutines need the keys at the same time, only one of them fetches them
+    from the core (without blocking the event loop) and the others use the result of that fetch
+    - init (the core is mocked, so it is not started)
+    - Call get_latest_keys_async concurrently
+    - Verify that the well known API was called once and that all callers got the key
+    """
+    init(**get_st_init_args(recipe_list=[session.init()]))
+
+    jwk = create_test_jwk("s-test-kid")
+
+    async def jwks_side_effect(_: httpx.Request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"keys": [jwk]})
+
+    with respx.mock() as mocker:
+        jwks_api = mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+            side_effect=jwks_side_effect
+        )
+
+        results = await asyncio.gather(
+            *[
+                get_latest_keys_async(SessionRecipe.get_instance().config, "s-test-kid")
+                for _ in range(10)
+            ]
+        )
+
+    assert jwks_api.call_count == 1
+    for keys in results:
+        assert [k.key_id for k in keys] == ["s-test-kid"]  # type: ignore
+
+
+def create_test_jwk(kid: str) -> Dict[str, Any]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return jwk
+
+
+async def test_that_jwks_are_refreshed_in_the_background_and_served_stale():
+    """This test makes sure that with jwks_background_refresh the keys are fetched by the background refresher
+    (and not by the requests), and that stale keys are served while the refresher is running
+    - init with background refresh (the core is mocked, so it is not started)
+    - Verify that the keys were fetched without anyone asking for them
+    - Make the keys stale and verify that they are still used while the refresher runs, but not after it stops
+    """
+    jwk = create_test_jwk("s-test-kid")
+
+    m: requests_mock.Mocker
+    with requests_mock.Mocker() as m:
+        jwks_api = m.get(
+            "http://localhost:3567/.well-known/jwks.json", json={"keys": [jwk]}
+        )
+
+        init(
+            **get_st_init_args(
+                recipe_list=[
+                    session.init(
+                        jwks_refresh_interval_sec=100, jwks_background_refresh=True
+                    )
+                ]
+            )
+        )
+
+        for _ in range(50):
+            if get_cached_keys() is not None:
+                break
+            await asyncio.sleep(0.1)
+
+        assert jwks_api.call_count == 1
+        assert is_jwks_background_refresh_running()
+
+        # served from the cache, without fetching the keys in the request
+        keys = await get_latest_keys_async(
+            SessionRecipe.get_instance().config, "s-test-kid"
+        )
+        assert [k.key_id for k in keys] == ["s-test-kid"]  # type: ignore
+        assert jwks_api.call_count == 1
+
+        assert jwks_module.cached_keys is not None
+        jwks_module.cached_keys.last_refresh_time -= 110 * 1000
+        assert not jwks_module.cached_keys.is_fresh()
+        assert get_cached_keys() is not None
+
+        stop_jwks_background_refresh()
+        assert get_cached_keys() is None
+
+
+async def test_that_cached_keys_are_indexed_by_kid():
+    """This test makes sure that the cached keys are prepared for verification and looked up by kid
+    - Create a cache with a few keys, two of which share a kid
+    - Verify that the keys are found by kid with the algorithm from the JWK
+    - Verify that all keys are returned for tokens without a kid, and none for an unknown kid
+    """
+    jwks = [
+        create_test_jwk("d-1"),
+        create_test_jwk("d-2"),
+        create_test_jwk("d-2"),
+        create_test_jwk("s-1"),
+    ]
+    keys = CachedKeys([PyJWK(jwk) for jwk in jwks], 60)
+
+    matching_keys = find_matching_keys(keys, "d-2")
+    assert matching_keys is not None
+    assert [k.jwk for k in matching_keys] == keys.keys[1:3]
+    assert all(k.algorithms == ["RS256"] for k in matching_keys)
+
+    all_keys = find_matching_keys(keys, None)
+    assert all_keys is not None and len(all_keys) == 4
+
+    assert find_matching_keys(keys, "unknown") is None
+    assert find_matching_keys(None, "d-1") is None
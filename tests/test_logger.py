@@ -1,9 +1,11 @@
 import importlib
+import io
 import json
 import logging
 import os
 import sys
 from datetime import datetime as real_datetime
+from typing import List, TextIO, cast
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -12,10 +14,14 @@ import pytest
 from supertokens_python import InputAppInfo, SupertokensConfig, init
 from supertokens_python.constants import VERSION
 from supertokens_python.logger import (
+    LazyLogArg,
     log_debug_message,
     streamFormatter,
+    streamHandler,
     NAMESPACE,
     enable_debug_logging,
+    enable_queued_logging,
+    disable_queued_logging,
 )
 from supertokens_python.recipe import session
 
@@ -49,13 +55,13 @@ class LoggerTests(TestCase):
             log_debug_message("API replied with status 200")
 
         record = captured.records[0]
-        out = json.loads(record.msg)
+        out = json.loads(streamFormatter.format(record)[len(NAMESPACE) + 1 :])
 
         assert out == {
             "t": "2000-01-01T00:00Z",
             "sdkVer": VERSION,
             "message": "API replied with status 200",
-            "file": "../tests/test_logger.py:49",
+            "file": "../tests/test_logger.py:55",
         }
 
     @staticmethod
@@ -150,3 +156,56 @@ class LoggerTests(TestCase):
         del os.environ["SUPERTOKENS_DEBUG"]
 
         assert logMsg in self._caplog.text
+
+    def test_7_lazy_log_args_are_only_computed_if_logged(self):
+        calls: List[str] = []
+
+        def describe(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        log_debug_message("lazy arg: %s", LazyLogArg(describe, "disabled"))
+        assert calls == []
+
+        enable_debug_logging()
+        with self.assertLogs(level="DEBUG") as captured:
+            log_debug_message("lazy arg: %s", LazyLogArg(describe, "enabled"))
+
+        # it is computed once for every handler that formats the message
+        assert set(calls) == {"enabled"}
+        assert "lazy arg: ENABLED" in captured.records[0].getMessage()
+
+    def test_8_queued_logging_writes_formatted_messages(self):
+        enable_debug_logging()
+        stream = io.StringIO()
+        handler = cast("logging.StreamHandler[TextIO]", streamHandler)
+        original_stream = handler.setStream(stream)
+        try:
+            enable_queued_logging()
+            args = ["before"]
+            log_debug_message("queued: %s", args)
+            # the message is formatted when logged, not when written
+            args[0] = "after"
+            disable_queued_logging()
+        finally:
+            handler.setStream(original_stream)  # type: ignore
+
+        name, message = stream.getvalue().strip().split(" ", 1)
+        assert name == NAMESPACE
+        assert json.loads(message)["message"] == "queued: ['before']"
+
+    def test_9_formatter_does_not_modify_the_record(self):
+        enable_debug_logging()
+
+        with self.assertLogs(level="DEBUG") as captured:
+            log_debug_message("API replied with status %s", 200)
+
+        record = captured.records[0]
+        formatted = streamFormatter.format(record)
+
+        assert formatted.startswith(NAMESPACE + " ")
+        out = json.loads(formatted[len(NAMESPACE) + 1 :])
+        assert out["message"] == "API replied with status 200"
+        assert out["file"] == "../tests/test_logger.py:201"
+        assert record.msg == "API replied with status %s"
+        assert record.args == (200,)
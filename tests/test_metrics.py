@@ -0,0 +1,88 @@
+# Copyright (c) 2026, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import httpx
+import respx
+from pytest import mark
+
+from supertokens_python import SupertokensConfig, init
+from supertokens_python.metrics import (
+    MetricsRegistry,
+    core_rate_limit_retries,
+    core_request_duration,
+    metrics_registry,
+)
+from supertokens_python.querier import NormalisedURLPath, Querier
+from supertokens_python.recipe import session
+from tests.utils import get_st_init_args, setup_function, teardown_function
+
+_ = setup_function
+_ = teardown_function
+
+
+def test_metrics_are_exposed_in_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("path",))
+    duration = registry.histogram(
+        "duration_seconds", "Duration.", ("path",), buckets=(0.1, 1)
+    )
+
+    requests.inc('/a"b')
+    requests.inc('/a"b', amount=2)
+    duration.observe(0.05, "/a")
+    duration.observe(0.5, "/a")
+    duration.observe(5, "/a")
+
+    assert registry.generate_text() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="/a\\"b"} 3\n'
+        "# HELP duration_seconds Duration.\n"
+        "# TYPE duration_seconds histogram\n"
+        'duration_seconds_bucket{path="/a",le="0.1"} 1\n'
+        'duration_seconds_bucket{path="/a",le="1"} 2\n'
+        'duration_seconds_bucket{path="/a",le="+Inf"} 3\n'
+        'duration_seconds_sum{path="/a"} 5.55\n'
+        'duration_seconds_count{path="/a"} 3\n'
+    )
+
+
+@mark.asyncio
+async def test_core_requests_are_measured_by_path_without_tenant_id_and_host():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+    metrics_registry.clear()
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx.MockRouter() as mocker:
+        mocker.get("http://localhost:6789/tenant1/recipe/session").mock(
+            side_effect=[
+                httpx.Response(429, json={}),
+                httpx.Response(200, json={"status": "OK"}),
+            ]
+        )
+        await q.send_get_request(
+            NormalisedURLPath("/tenant1/recipe/session"), None, None
+        )
+
+    assert core_rate_limit_retries.get("/recipe/session") == 1
+    assert (
+        core_request_duration.get_count("/recipe/session", "http://localhost:6789") == 2
+    )
+    assert (
+        'supertokens_core_rate_limit_retries_total{path="/recipe/session"} 1'
+        in metrics_registry.generate_text()
+    )
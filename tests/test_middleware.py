@@ -17,9 +17,19 @@ import json
 from fastapi import FastAPI
 from pytest import fixture, mark
 
-from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
 from supertokens_python.framework.fastapi import get_middleware
-from supertokens_python.recipe import emailpassword, passwordless, session
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    passwordless,
+    session,
+    thirdparty,
+    userroles,
+)
+from supertokens_python.route_index import RouteIndex
 from tests.testclient import TestClientWithNoCookieJar as TestClient
 from tests.utils import clean_st, reset, setup_st, sign_up_request, start_st
 
@@ -279,3 +289,64 @@ async def test_wrong_rid_returns_404_if_recipe_missing(
     )
 
     assert response_2.status_code == 404
+
+
+@mark.asyncio
+async def test_route_index_matches_the_same_apis_as_the_recipes():
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="SuperTokens Demo",
+            api_domain="api.supertokens.io",
+            website_domain="supertokens.io",
+        ),
+        framework="fastapi",
+        recipe_list=[
+            session.init(),
+            emailpassword.init(),
+            passwordless.init(
+                contact_config=passwordless.ContactEmailOrPhoneConfig(),
+                flow_type="USER_INPUT_CODE_AND_MAGIC_LINK",
+            ),
+            thirdparty.init(),
+            emailverification.init(mode="OPTIONAL"),
+            dashboard.init(),
+            userroles.init(),
+        ],
+    )
+    st = Supertokens.get_instance()
+    api_base_path = st.app_info.api_base_path
+    route_index = RouteIndex(api_base_path.get_as_string_dangerous(), st.recipe_modules)
+
+    api_paths = {
+        api.path_without_api_base_path.get_as_string_dangerous()
+        for recipe in st.recipe_modules
+        for api in recipe.get_apis_handled()
+    }
+    paths = [
+        api_base_path.append(NormalisedURLPath(prefix + api_path))
+        for api_path in [*api_paths, "/unknown"]
+        for prefix in ["", "/public", "/tenant-1", "/invalid_tenant", "/a/b"]
+    ]
+
+    for path in paths:
+        for method in ["get", "post", "put", "delete"]:
+            expected = None
+            for recipe in st.recipe_modules:
+                result = await recipe.return_api_id_if_can_handle_request(
+                    path, method, {}
+                )
+                if result is not None:
+                    expected = (recipe.get_recipe_id(), result.api_id, result.tenant_id)
+                    break
+
+            matches = route_index.find(path.get_as_string_dangerous(), method)
+            actual = None
+            if len(matches) > 0:
+                actual = (
+                    matches[0].recipe.get_recipe_id(),
+                    matches[0].api_id,
+                    matches[0].tenant_id or "public",
+                )
+
+            assert actual == expected, path.get_as_string_dangerous()
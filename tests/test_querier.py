@@ -11,6 +11,8 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 from pytest import mark
 from supertokens_python.recipe import (
     session,
@@ -22,11 +24,22 @@ from supertokens_python.recipe import (
 from supertokens_python import InputAppInfo
 from supertokens_python.recipe.emailpassword.asyncio import get_user, sign_up
 import asyncio
+import time
 import respx
 import httpx
 import json
-from supertokens_python import init, SupertokensConfig
+from supertokens_python import (
+    init,
+    CoreCallCacheConfig,
+    CoreCallCachePolicy,
+    CoreRateLimitRetryConfig,
+    CoreRequestHedgingConfig,
+    SupertokensConfig,
+)
+from supertokens_python.asyncio import shutdown, warmup
+from supertokens_python.host_selector import HostSelector
 from supertokens_python.querier import Querier, NormalisedURLPath
+from supertokens_python.tracing import Span, Tracer, set_tracer, trace
 
 from tests.utils import get_st_init_args
 from tests.utils import (
@@ -34,7 +47,7 @@ from tests.utils import (
     teardown_function,
     start_st,
 )
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 _ = setup_function
 _ = teardown_function
@@ -155,6 +168,45 @@ async def test_parallel_calls_have_independent_counters():
         assert api.call_count == 12
 
 
+async def test_rate_limit_retries_use_retry_after_and_a_shared_budget():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789",
+        core_rate_limit_retry=CoreRateLimitRetryConfig(
+            base_delay_ms=1, retry_budget_size=4, retry_budget_refill_per_sec=0
+        ),
+    )
+    init(**args)  # type: ignore
+    start_st()
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx_mock() as mocker:
+        mocker.get("http://localhost:6789/retry-after").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "1"}, json={}),
+                httpx.Response(200, json={}),
+            ]
+        )
+        api = mocker.get("http://localhost:6789/api").mock(httpx.Response(429, json={}))
+
+        start = time.time()
+        await q.send_get_request(NormalisedURLPath("/retry-after"), None, None)
+        assert time.time() - start >= 1
+
+        # 3 retries are left in the budget, so the request is not retried 5 times
+        for _ in range(2):
+            try:
+                await q.send_get_request(NormalisedURLPath("/api"), None, None)
+            except Exception as e:
+                if "with status code: 429" not in str(e):
+                    raise e
+
+        assert api.call_count == 4 + 1
+        assert Querier.get_rate_limit_retries_denied_count() == 2
+
+
 async def test_querier_text_and_headers():
     args = get_st_init_args([session.init()])
     args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
@@ -680,3 +732,462 @@ async def test_caching_gets_clear_with_non_get_if_keep_alive_is_not_set():
 
     assert user is None
     assert called_core
+
+
+async def test_core_connections_are_pooled_and_closed_on_shutdown():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789",
+        http_max_connections=5,
+        http_max_keepalive_connections=2,
+        http_keepalive_expiry_sec=1.5,
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    clients_used: List[httpx.AsyncClient] = []
+    original_send = httpx.AsyncClient.send
+
+    async def send(client: httpx.AsyncClient, *args: Any, **kwargs: Any):
+        clients_used.append(client)
+        return await original_send(client, *args, **kwargs)
+
+    with respx_mock() as mocker:
+        mocker.get("http://localhost:6789/api").mock(httpx.Response(200, json={}))
+
+        httpx.AsyncClient.send = send  # type: ignore
+        try:
+            await q.send_get_request(NormalisedURLPath("/api"), {"id": 1}, None)
+            await q.send_get_request(NormalisedURLPath("/api"), {"id": 2}, None)
+        finally:
+            httpx.AsyncClient.send = original_send  # type: ignore
+
+    assert len(clients_used) == 2
+    assert clients_used[0] is clients_used[1]
+    pool = clients_used[0]._transport._pool  # type: ignore
+    assert pool._max_connections == 5  # type: ignore
+    assert pool._max_keepalive_connections == 2  # type: ignore
+    assert pool._keepalive_expiry == 1.5  # type: ignore
+
+    await shutdown()
+    assert clients_used[0].is_closed
+
+
+async def test_shared_core_call_cache_is_used_across_requests_and_invalidated_by_writes():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789",
+        core_call_cache=CoreCallCacheConfig(
+            {
+                "/recipe/user/roles": CoreCallCachePolicy(
+                    60, invalidated_by=["/recipe/user/role"]
+                )
+            }
+        ),
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx_mock() as mocker:
+        roles = mocker.get("http://localhost:6789/public/recipe/user/roles").mock(
+            httpx.Response(200, json={"status": "OK", "roles": []})
+        )
+        metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+        mocker.put("http://localhost:6789/public/recipe/user/role").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        async def get_roles(user_id: str):
+            # every call uses its own user_context, like separate requests would
+            return await q.send_get_request(
+                NormalisedURLPath("/public/recipe/user/roles"), {"userId": user_id}, {}
+            )
+
+        await get_roles("user1")
+        await get_roles("user1")
+        await get_roles("user2")
+        assert roles.call_count == 2
+
+        # paths without a policy are not cached
+        for _ in range(2):
+            await q.send_get_request(
+                NormalisedURLPath("/recipe/user/metadata"), {"userId": "user1"}, {}
+            )
+        assert metadata.call_count == 2
+
+        await q.send_put_request(
+            NormalisedURLPath("/public/recipe/user/role"),
+            {"userId": "user1", "role": "admin"},
+            None,
+            {},
+        )
+        await get_roles("user1")
+        await get_roles("user2")
+        assert roles.call_count == 4
+
+
+async def test_shared_core_call_cache_of_a_user_is_invalidated_when_a_user_is_deleted():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789", core_call_cache=CoreCallCacheConfig()
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx_mock() as mocker:
+        roles = mocker.get("http://localhost:6789/public/recipe/user/roles").mock(
+            httpx.Response(200, json={"status": "OK", "roles": []})
+        )
+        metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+        mocker.post("http://localhost:6789/user/remove").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        async def get_roles_and_metadata():
+            await q.send_get_request(
+                NormalisedURLPath("/public/recipe/user/roles"), {"userId": "user1"}, {}
+            )
+            await q.send_get_request(
+                NormalisedURLPath("/recipe/user/metadata"), {"userId": "user1"}, {}
+            )
+
+        await get_roles_and_metadata()
+        await get_roles_and_metadata()
+        assert (roles.call_count, metadata.call_count) == (1, 1)
+
+        await q.send_post_request(
+            NormalisedURLPath("/user/remove"), {"userId": "user1"}, {}
+        )
+        await get_roles_and_metadata()
+        assert (roles.call_count, metadata.call_count) == (2, 2)
+
+
+async def test_concurrent_identical_get_requests_are_coalesced():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    async def api_side_effect(_: httpx.Request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"status": "OK"})
+
+    with respx_mock() as mocker:
+        api = mocker.get("http://localhost:6789/api").mock(side_effect=api_side_effect)
+
+        responses = await asyncio.gather(
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), {"id": id_}, None)
+                for id_ in [1, 1, 1, 1, 2]
+            ]
+        )
+        assert all(res["status"] == "OK" for res in responses)
+        assert api.call_count == 2
+        assert Querier.get_coalesced_get_requests_count() == 3
+
+        # requests that are not in flight at the same time are sent again
+        await q.send_get_request(NormalisedURLPath("/api"), {"id": 1}, None)
+        assert api.call_count == 3
+
+
+async def test_get_requests_are_not_coalesced_if_a_network_interceptor_is_set():
+    def intercept(
+        url: str,
+        method: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        user_context: Optional[Dict[str, Any]],
+    ):
+        assert user_context is not None
+        return url, method, {**headers, "tenant": user_context["tenant"]}, params, body
+
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789", network_interceptor=intercept
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    async def api_side_effect(request: httpx.Request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"tenant": request.headers["tenant"]})
+
+    with respx_mock() as mocker:
+        api = mocker.get("http://localhost:6789/api").mock(side_effect=api_side_effect)
+
+        responses = await asyncio.gather(
+            *[
+                q.send_get_request(NormalisedURLPath("/api"), {}, {"tenant": tenant})
+                for tenant in ["t1", "t2"]
+            ]
+        )
+        assert [res["tenant"] for res in responses] == ["t1", "t2"]
+        assert api.call_count == 2
+
+
+async def test_shared_core_call_cache_is_not_used_if_a_network_interceptor_is_set():
+    def intercept(
+        url: str,
+        method: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        user_context: Optional[Dict[str, Any]],
+    ):
+        assert user_context is not None
+        return url, method, {**headers, "tenant": user_context["tenant"]}, params, body
+
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789",
+        network_interceptor=intercept,
+        core_call_cache=CoreCallCacheConfig(
+            {"/api": CoreCallCachePolicy(60, invalidated_by=[])}
+        ),
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    def api_side_effect(request: httpx.Request):
+        return httpx.Response(200, json={"tenant": request.headers["tenant"]})
+
+    with respx_mock() as mocker:
+        api = mocker.get("http://localhost:6789/api").mock(side_effect=api_side_effect)
+
+        responses = [
+            await q.send_get_request(NormalisedURLPath("/api"), {}, {"tenant": tenant})
+            for tenant in ["t1", "t2"]
+        ]
+        assert [res["tenant"] for res in responses] == ["t1", "t2"]
+        assert api.call_count == 2
+
+
+async def test_failing_hosts_are_ejected_and_probed_after_the_ejection_window():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789;http://localhost:6790"
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    host_selector = getattr(Querier, "_Querier__host_selector")
+
+    with respx_mock() as mocker:
+        alive = mocker.get("http://localhost:6789/api").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+        dead = mocker.get("http://localhost:6790/api").mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+
+        for _ in range(20):
+            res = await q.send_get_request(NormalisedURLPath("/api"), None, None)
+            assert res["status"] == "OK"
+
+        # the host is not used anymore once it has failed 3 times in a row
+        assert dead.call_count == 3
+        assert alive.call_count == 20
+        assert host_selector.is_ejected(1)
+
+        # once the ejection window has passed, a request is sent to check if the host has recovered
+        dead.mock(side_effect=None, return_value=httpx.Response(200, json={}))
+        host_selector.hosts[1].ejected_until = 0
+        for _ in range(20):
+            await q.send_get_request(NormalisedURLPath("/api"), None, None)
+
+        assert not host_selector.is_ejected(1)
+        assert dead.call_count > 4
+
+
+async def test_only_the_probe_request_releases_the_probe_of_an_ejected_host():
+    host_selector = HostSelector(["http://localhost:6789", "http://localhost:6790"])
+    for _ in range(3):
+        host_selector.on_failure("http://localhost:6790/api")
+    host_selector.hosts[1].ejected_until = 0
+
+    assert host_selector.select({0}) == (1, True)
+
+    # a request that was sent to the host before it was ejected fails while it is probed
+    host_selector.on_failure("http://localhost:6790/api")
+    host_selector.hosts[1].ejected_until = 0
+    assert host_selector.select(set()) == (0, False)
+
+    host_selector.release_probe(1)
+    assert host_selector.select({0}) == (1, True)
+
+
+async def test_slow_requests_are_hedged_to_another_host():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig(
+        "http://localhost:6789;http://localhost:6790",
+        core_request_hedging=CoreRequestHedgingConfig(initial_delay_ms=50),
+    )
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    slow_requests_count = 0
+
+    async def slow_side_effect(_: httpx.Request):
+        nonlocal slow_requests_count
+        slow_requests_count += 1
+        await asyncio.sleep(2)
+        return httpx.Response(200, json={"status": "OK", "host": "slow"})
+
+    with respx_mock(assert_all_called=False) as mocker:
+        mocker.post("http://localhost:6789/recipe/session/verify").mock(
+            side_effect=slow_side_effect
+        )
+        fast = mocker.post("http://localhost:6790/recipe/session/verify").mock(
+            httpx.Response(200, json={"status": "OK", "host": "fast"})
+        )
+        for host in ["http://localhost:6789", "http://localhost:6790"]:
+            mocker.post(f"{host}/recipe/session").mock(side_effect=slow_side_effect)
+
+        # the first request goes to the first host
+        start = time.time()
+        res = await q.send_post_request(
+            NormalisedURLPath("/recipe/session/verify"), {}, None
+        )
+        assert time.time() - start < 1
+        assert res["host"] == "fast"
+        assert slow_requests_count == 1
+        assert fast.call_count == 1
+        assert Querier.get_hedged_requests_count() == 1
+
+        # paths that are not configured are not hedged
+        res = await q.send_post_request(NormalisedURLPath("/recipe/session"), {}, None)
+        assert res["host"] == "slow"
+        assert slow_requests_count == 2
+        assert Querier.get_hedged_requests_count() == 1
+
+
+async def test_warmup_fetches_the_api_version_once_for_concurrent_callers():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": "d-1", "alg": "RS256", "use": "sig"})
+
+    async def api_version_side_effect(_: httpx.Request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"versions": ["5.2"]})
+
+    with respx_mock() as mocker:
+        api_version = mocker.get("http://localhost:6789/apiversion").mock(
+            side_effect=api_version_side_effect
+        )
+        jwks = mocker.get("http://localhost:6789/.well-known/jwks.json").mock(
+            httpx.Response(200, json={"keys": [jwk]})
+        )
+        tenants = mocker.get(
+            "http://localhost:6789/recipe/multitenancy/tenant/list/v2"
+        ).mock(httpx.Response(200, json={"status": "OK", "tenants": []}))
+
+        q = Querier.get_instance()
+        versions = await asyncio.gather(
+            q.get_api_version(), q.get_api_version(), warmup()
+        )
+
+        assert versions[:2] == ["5.2", "5.2"]
+        assert api_version.call_count == 1
+        assert jwks.call_count == 1
+        assert tenants.call_count == 1
+        request: httpx.Request = tenants.calls.last.request
+        assert request.headers["cdi-version"] == "5.2"
+
+
+class RecordedSpan(Span):
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: Optional[Span]):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+        self.ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.spans: List[RecordedSpan] = []
+
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Optional[Span]
+    ) -> Span:
+        span = RecordedSpan(name, attributes, parent)
+        self.spans.append(span)
+        return span
+
+
+async def test_core_requests_are_traced():
+    args = get_st_init_args([session.init()])
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    tracer = RecordingTracer()
+    set_tracer(tracer)
+
+    try:
+        with respx_mock() as mocker:
+            mocker.get("http://localhost:6789/api").mock(
+                side_effect=[
+                    httpx.Response(429, json={}),
+                    httpx.Response(200, json={"status": "OK"}),
+                ]
+            )
+
+            user_context: Dict[str, Any] = {}
+            with trace("parent", {}):
+                await q.send_get_request(NormalisedURLPath("/api"), None, user_context)
+            await q.send_get_request(NormalisedURLPath("/api"), None, user_context)
+    finally:
+        set_tracer(None)
+
+    parent, sent, cached = tracer.spans
+    assert sent.name == cached.name == "supertokens.core_request"
+    assert sent.parent is parent
+    assert cached.parent is None
+    assert all(span.ended for span in tracer.spans)
+    assert sent.attributes == {
+        "path": "/api",
+        "method": "GET",
+        "cache_hit": False,
+        "host": "http://localhost:6789",
+        "status": 200,
+        "retry_count": 1,
+    }
+    assert cached.attributes == {
+        "path": "/api",
+        "method": "GET",
+        "cache_hit": True,
+        "host": "http://localhost:6789",
+        "status": 200,
+        "retry_count": 0,
+    }
@@ -1,14 +1,22 @@
 from typing import Union, List, Any, Dict
 
+import asyncio
+import contextvars
 import pytest
 import threading
 
+from supertokens_python.async_to_sync_wrapper import (
+    get_background_event_loop,
+    stop_background_event_loop,
+    sync,
+)
+
 from supertokens_python.utils import (
     humanize_time,
     is_version_gte,
     get_top_level_domain_for_same_site_resolution,
 )
-from supertokens_python.utils import RWMutex
+from supertokens_python.utils import RWMutex, TTLCache, get_timestamp_ms
 
 from tests.utils import is_subset
 
@@ -197,3 +205,88 @@ def test_rw_mutex_writes():
 )
 def test_tld_for_same_site(url: str, res: str):
     assert get_top_level_domain_for_same_site_resolution(url) == res
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries():
+    cache: TTLCache[int] = TTLCache(2)
+    expires_at = get_timestamp_ms() + 60000
+
+    cache.set("a", 1, expires_at)
+    cache.set("b", 2, expires_at)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+
+    cache.set("c", 3, expires_at)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.set("d", 4, get_timestamp_ms() - 1)
+    assert cache.get("d") is None
+    assert len(cache) == 1
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_sync_runs_coroutines_in_the_background_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    loops: List[Any] = []
+    try:
+        threads = [
+            threading.Thread(target=lambda: loops.append(sync(get_loop())))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        background_loop = get_background_event_loop()
+        assert len(loops) == 5
+        assert all(loop is background_loop.loop for loop in loops)
+    finally:
+        stop_background_event_loop()
+
+    background_loop.thread.join(timeout=5)
+    assert not background_loop.is_running()
+    try:
+        assert sync(get_loop()) is not background_loop.loop
+    finally:
+        stop_background_event_loop()
+
+
+def test_sync_keeps_the_context_of_the_caller_in_the_background_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+    request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+    async def get_request_id():
+        return request_id.get(None)
+
+    results: List[Any] = []
+
+    def handle_request(value: str):
+        request_id.set(value)
+        results.append((value, sync(get_request_id())))
+
+    try:
+        threads = [
+            threading.Thread(target=handle_request, args=(f"request-{i}",))
+            for i in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        stop_background_event_loop()
+
+    assert len(results) == 5
+    assert all(value == seen for value, seen in results)
@@ -12,13 +12,29 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import asyncio as aio
+from typing import Any, Dict, List, Union
+
+import httpx
+import respx
 from pytest import mark, skip
 from supertokens_python import InputAppInfo, SupertokensConfig, init
 from supertokens_python.querier import Querier
 from supertokens_python.recipe import userroles, session
-from supertokens_python.recipe.userroles import asyncio, interfaces
-from supertokens_python.utils import is_version_gte
-from tests.utils import clean_st, reset, setup_st, start_st
+from supertokens_python.recipe.userroles import (
+    PermissionClaim,
+    UserRolesRecipe,
+    asyncio,
+    interfaces,
+)
+from supertokens_python.recipe.userroles.interfaces import RecipeInterface
+from supertokens_python.recipe.userroles.snapshot import (
+    LocalRoleSnapshot,
+    LocalRoleSnapshotConfig,
+)
+from supertokens_python.types import RecipeUserId
+from supertokens_python.utils import is_version_gte, resolve
+from tests.utils import clean_st, get_st_init_args, reset, setup_st, start_st
 
 
 def setup_function(_):
@@ -95,3 +111,187 @@ async def test_get_permission_for_non_existent_role():
     # Get the permissions given to the role
     result = await asyncio.get_permissions_for_role(role)
     assert isinstance(result, interfaces.UnknownRoleError)
+
+
+@mark.asyncio
+async def test_permissions_of_roles_are_fetched_concurrently():
+    running = 0
+    max_running = 0
+
+    def override(original_implementation: RecipeInterface) -> RecipeInterface:
+        async def get_roles_for_user(*_: Any, **__: Any):
+            return interfaces.GetRolesForUserOkResult([f"role{i}" for i in range(20)])
+
+        async def get_permissions_for_role(
+            role: str, user_context: Dict[str, Any]
+        ) -> Union[
+            interfaces.GetPermissionsForRoleOkResult, interfaces.UnknownRoleError
+        ]:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await aio.sleep(0.01)
+            running -= 1
+            if role == "role0":
+                return interfaces.UnknownRoleError()
+            return interfaces.GetPermissionsForRoleOkResult(["read", f"{role}-write"])
+
+        original_implementation.get_roles_for_user = get_roles_for_user  # type: ignore
+        original_implementation.get_permissions_for_role = get_permissions_for_role  # type: ignore
+        return original_implementation
+
+    init(
+        **get_st_init_args(
+            [
+                userroles.init(
+                    override=userroles.utils.InputOverrideConfig(functions=override)
+                ),
+                session.init(),
+            ]
+        )
+    )  # type: ignore
+
+    permissions = await resolve(
+        PermissionClaim.fetch_value(
+            "user_id", RecipeUserId("user_id"), "public", {}, {}
+        )
+    )
+
+    assert max_running == 10
+    assert permissions is not None
+    # unknown roles are skipped by the claim
+    assert sorted(permissions) == sorted(
+        ["read"] + [f"role{i}-write" for i in range(1, 20)]
+    )
+
+
+@mark.asyncio
+async def test_permissions_of_roles_are_cached():
+    args = get_st_init_args(
+        [userroles.init(role_permissions_cache_ttl_sec=60), session.init()]
+    )
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+    Querier.api_version = "3.0"
+    recipe = UserRolesRecipe.get_instance()
+
+    def get_permissions(request: httpx.Request) -> httpx.Response:
+        role = request.url.params["role"]
+        if role == "unknown":
+            return httpx.Response(200, json={"status": "UNKNOWN_ROLE_ERROR"})
+        return httpx.Response(200, json={"status": "OK", "permissions": [role]})
+
+    with respx.MockRouter() as mocker:
+        get_permissions_route = mocker.get(
+            "http://localhost:6789/recipe/role/permissions"
+        ).mock(side_effect=get_permissions)
+        mocker.put("http://localhost:6789/recipe/role").mock(
+            httpx.Response(200, json={"status": "OK", "createdNewRole": False})
+        )
+
+        roles = ["role1", "role2", "unknown"]
+        assert sorted(await recipe.get_permissions_for_roles(roles, False, {})) == [
+            "role1",
+            "role2",
+        ]
+        assert get_permissions_route.call_count == 3
+
+        await recipe.get_permissions_for_roles(roles, False, {})
+        assert get_permissions_route.call_count == 3
+
+        # changing the permissions of a role invalidates the permissions of all roles
+        await asyncio.create_new_role_or_add_permissions("role1", ["perm"])
+        await recipe.get_permissions_for_roles(roles, False, {})
+        assert get_permissions_route.call_count == 6
+
+
+@mark.asyncio
+async def test_permissions_and_roles_are_answered_from_local_snapshot():
+    args = get_st_init_args(
+        [
+            userroles.init(
+                local_role_snapshot=userroles.LocalRoleSnapshotConfig(
+                    refresh_interval_sec=60
+                )
+            ),
+            session.init(),
+        ]
+    )
+    args["supertokens_config"] = SupertokensConfig("http://localhost:6789")
+    init(**args)  # type: ignore
+    Querier.api_version = "3.0"
+    recipe = UserRolesRecipe.get_instance()
+
+    def get_permissions(request: httpx.Request) -> httpx.Response:
+        role = request.url.params["role"]
+        if role == "unknown":
+            return httpx.Response(200, json={"status": "UNKNOWN_ROLE_ERROR"})
+        return httpx.Response(
+            200, json={"status": "OK", "permissions": [f"{role}-perm", "shared"]}
+        )
+
+    with respx.MockRouter(assert_all_called=False) as mocker:
+        get_all_roles_route = mocker.get("http://localhost:6789/recipe/roles").mock(
+            httpx.Response(200, json={"status": "OK", "roles": ["role1", "role2"]})
+        )
+        get_permissions_route = mocker.get(
+            "http://localhost:6789/recipe/role/permissions"
+        ).mock(side_effect=get_permissions)
+        get_roles_route = mocker.get("http://localhost:6789/recipe/permission/roles")
+        mocker.put("http://localhost:6789/recipe/role").mock(
+            httpx.Response(200, json={"status": "OK", "createdNewRole": True})
+        )
+        mocker.post("http://localhost:6789/recipe/role/remove").mock(
+            httpx.Response(200, json={"status": "OK", "didRoleExist": True})
+        )
+
+        await recipe.warmup({})
+        assert get_all_roles_route.call_count == 1
+        assert get_permissions_route.call_count == 2
+
+        result = await asyncio.get_permissions_for_role("role1")
+        assert isinstance(result, interfaces.GetPermissionsForRoleOkResult)
+        assert result.permissions == ["role1-perm", "shared"]
+        result = await asyncio.get_roles_that_have_permission("shared")
+        assert sorted(result.roles) == ["role1", "role2"]
+        assert get_permissions_route.call_count == 2
+        assert get_roles_route.call_count == 0
+
+        # changes made through the SDK are applied to the snapshot
+        await asyncio.create_new_role_or_add_permissions("role3", ["shared"])
+        await asyncio.delete_role("role1")
+        result = await asyncio.get_roles_that_have_permission("shared")
+        assert sorted(result.roles) == ["role2", "role3"]
+        result = await asyncio.get_permissions_for_role("role3")
+        assert isinstance(result, interfaces.GetPermissionsForRoleOkResult)
+        assert result.permissions == ["shared"]
+        assert get_permissions_route.call_count == 2
+
+        # roles that are not in the snapshot are fetched from the core
+        result = await asyncio.get_permissions_for_role("unknown")
+        assert isinstance(result, interfaces.UnknownRoleError)
+        assert get_permissions_route.call_count == 3
+        assert get_all_roles_route.call_count == 1
+
+
+@mark.asyncio
+async def test_local_snapshot_is_loaded_once_by_concurrent_calls():
+    user_contexts: List[Dict[str, Any]] = []
+
+    async def load(user_context: Dict[str, Any]) -> Dict[str, List[str]]:
+        user_contexts.append(user_context)
+        await aio.sleep(0.1)
+        return {"role1": ["perm"]}
+
+    snapshot = LocalRoleSnapshot(LocalRoleSnapshotConfig(refresh_interval_sec=0), load)
+
+    results = await aio.gather(*[snapshot.get({"request": i}) for i in range(5)])
+    assert user_contexts == [{"request": 0}]
+    assert all(result is results[0] for result in results)
+
+    # refreshes run in the background, without the user_context of the request that
+    # triggered them
+    await aio.sleep(0.01)
+    await snapshot.get({"request": 5})
+    await aio.sleep(0.2)
+    assert user_contexts == [{"request": 0}, {}]